@@ -73,7 +73,7 @@ describe('/api/ai/breakdown', () => {
       }],
       max_tokens: 300,
       temperature: 0.7,
-    });
+    }, { signal: expect.any(Object) });
   });
 
   test('returns 400 for missing task title', async () => {
@@ -93,6 +93,22 @@ describe('/api/ai/breakdown', () => {
     expect(mockCreate).not.toHaveBeenCalled();
   });
 
+  test('returns 400 for a non-string or blank task title', async () => {
+    for (const taskTitle of [42, { title: 'Shelf' }, '   ']) {
+      const request = new NextRequest('http://localhost:3000/api/ai/breakdown', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ taskTitle }),
+      });
+
+      const response = await POST(request);
+      expect(response.status).toBe(400);
+    }
+    expect(mockCreate).not.toHaveBeenCalled();
+  });
+
   test('handles OpenAI API errors gracefully', async () => {
     mockCreate.mockRejectedValueOnce(new Error('API Error'));
 
@@ -173,4 +189,83 @@ describe('/api/ai/breakdown', () => {
       "Put everything in its place"
     ]);
   });
-});
\ No newline at end of file
+
+  test('serves repeat breakdowns from the cache', async () => {
+    mockCreate.mockResolvedValueOnce({
+      choices: [{
+        message: {
+          content: '["Measure the wall", "Buy shelf brackets", "Mount the shelf"]'
+        }
+      }]
+    });
+
+    const makeRequest = (taskTitle) => new NextRequest('http://localhost:3000/api/ai/breakdown', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ taskTitle }),
+    });
+
+    const first = await (await POST(makeRequest('Hang a shelf'))).json();
+    const second = await (await POST(makeRequest('  hang a SHELF '))).json();
+
+    expect(mockCreate).toHaveBeenCalledTimes(1);
+    expect(second.subtasks).toEqual(first.subtasks);
+    expect(second.originalTask).toBe('  hang a SHELF ');
+  });
+
+  test('does not cache breakdowns salvaged from an unparseable reply', async () => {
+    mockCreate
+      .mockResolvedValueOnce({ choices: [{ message: { content: 'Not JSON at all' } }] })
+      .mockResolvedValueOnce({ choices: [{ message: { content: '["Find the leak", "Replace the washer"]' } }] });
+
+    const makeRequest = () => new NextRequest('http://localhost:3000/api/ai/breakdown', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ taskTitle: 'Fix the dripping tap' }),
+    });
+
+    const first = await (await POST(makeRequest())).json();
+    const second = await (await POST(makeRequest())).json();
+
+    expect(mockCreate).toHaveBeenCalledTimes(2);
+    expect(first.subtasks).toEqual(['Not JSON at all']);
+    expect(second.subtasks).toEqual(['Find the leak', 'Replace the washer']);
+  });
+
+  test('coalesces concurrent identical breakdowns into one completion', async () => {
+    let resolveCompletion;
+    mockCreate.mockImplementationOnce(() => new Promise(resolve => {
+      resolveCompletion = resolve;
+    }));
+
+    const makeRequest = () => new NextRequest('http://localhost:3000/api/ai/breakdown', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ taskTitle: 'Paint the fence' }),
+    });
+
+    const pending = [POST(makeRequest()), POST(makeRequest())];
+    while (!resolveCompletion) {
+      await new Promise(resolve => setTimeout(resolve, 0));
+    }
+    resolveCompletion({
+      choices: [{
+        message: {
+          content: '["Buy exterior paint", "Sand the boards", "Apply two coats"]'
+        }
+      }]
+    });
+
+    const [first, second] = await Promise.all(pending.map(async p => (await p).json()));
+
+    expect(mockCreate).toHaveBeenCalledTimes(1);
+    expect(first.subtasks).toEqual(["Buy exterior paint", "Sand the boards", "Apply two coats"]);
+    expect(second.subtasks).toEqual(first.subtasks);
+  });
+});
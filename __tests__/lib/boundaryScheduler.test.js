@@ -0,0 +1,74 @@
+import { msUntilNextHour, subscribeToTimeBoundaries } from '@/lib/boundaryScheduler';
+
+const MINUTE = 60 * 1000;
+const HOUR = 60 * MINUTE;
+
+let visibility = 'visible';
+const setVisibility = (state) => {
+  visibility = state;
+  document.dispatchEvent(new Event('visibilitychange'));
+};
+
+describe('boundaryScheduler', () => {
+  let unsubscribe;
+
+  beforeAll(() => {
+    Object.defineProperty(document, 'visibilityState', { configurable: true, get: () => visibility });
+  });
+
+  beforeEach(() => {
+    visibility = 'visible';
+    jest.useFakeTimers();
+    // Friday 22:30 local time
+    jest.setSystemTime(new Date(2025, 0, 3, 22, 30));
+  });
+
+  afterEach(() => {
+    unsubscribe?.();
+    jest.useRealTimers();
+  });
+
+  test('computes the next top of the hour', () => {
+    expect(msUntilNextHour(new Date(2025, 0, 3, 22, 30))).toBe(30 * MINUTE);
+    expect(msUntilNextHour(new Date(2025, 0, 3, 23, 0))).toBe(HOUR);
+  });
+
+  test('fires once per hour boundary, not before', async () => {
+    const listener = jest.fn();
+    unsubscribe = subscribeToTimeBoundaries(listener);
+
+    await jest.advanceTimersByTimeAsync(29 * MINUTE);
+    expect(listener).not.toHaveBeenCalled();
+
+    await jest.advanceTimersByTimeAsync(MINUTE);
+    expect(listener).toHaveBeenCalledTimes(1);
+    expect(listener).toHaveBeenLastCalledWith({ hourChanged: true, dayChanged: false, weekendChanged: false });
+
+    // 23:00 -> midnight into Saturday
+    await jest.advanceTimersByTimeAsync(HOUR);
+    expect(listener).toHaveBeenCalledTimes(2);
+    expect(listener).toHaveBeenLastCalledWith({ hourChanged: true, dayChanged: true, weekendChanged: true });
+  });
+
+  test('pauses while hidden and catches up once on resume', async () => {
+    const listener = jest.fn();
+    unsubscribe = subscribeToTimeBoundaries(listener);
+
+    setVisibility('hidden');
+    await jest.advanceTimersByTimeAsync(3 * HOUR);
+    expect(listener).not.toHaveBeenCalled();
+
+    setVisibility('visible');
+    await jest.advanceTimersByTimeAsync(0);
+    expect(listener).toHaveBeenCalledTimes(1);
+    expect(listener).toHaveBeenLastCalledWith({ hourChanged: true, dayChanged: true, weekendChanged: true });
+  });
+
+  test('stops after unsubscribing', async () => {
+    const listener = jest.fn();
+    subscribeToTimeBoundaries(listener)();
+
+    await jest.advanceTimersByTimeAsync(2 * HOUR);
+    expect(listener).not.toHaveBeenCalled();
+  });
+});
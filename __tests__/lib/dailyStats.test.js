@@ -0,0 +1,73 @@
+/**
+ * @jest-environment node
+ */
+
+import { currentStreak, localDateKey, prepareRollupWrites } from '@/lib/dailyStats';
+
+jest.mock('firebase/firestore', () => ({
+  doc: jest.fn((db, ...path) => path.join('/')),
+  increment: jest.fn((n) => ({ increment: n })),
+  serverTimestamp: jest.fn(() => 'now')
+}));
+
+// In-memory stand-in for a Firestore transaction over rollup docs
+function fakeTransaction(docs) {
+  return {
+    get: jest.fn(async (ref) => ({ exists: () => ref in docs, data: () => docs[ref] })),
+    set: jest.fn()
+  };
+}
+
+describe('dailyStats', () => {
+  const friday = new Date(2025, 0, 3, 20, 15);
+
+  test('keys rollups by local date', () => {
+    expect(localDateKey(new Date(2025, 0, 3, 23, 59))).toBe('2025-01-03');
+  });
+
+  test('first completion of a day extends yesterday\'s streak', async () => {
+    const transaction = fakeTransaction({
+      'users/u1/dailyStats/2025-01-02': { completed: 2, streak: 6 }
+    });
+
+    const write = await prepareRollupWrites(transaction, {}, [
+      { userId: 'u1', category: 'household', at: friday, delta: 1 },
+      { userId: 'u1', category: 'baby', at: friday, delta: 1 }
+    ]);
+    write();
+
+    expect(transaction.set).toHaveBeenCalledTimes(1);
+    const [ref, data, options] = transaction.set.mock.calls[0];
+    expect(ref).toBe('users/u1/dailyStats/2025-01-03');
+    expect(options).toEqual({ merge: true });
+    expect(data).toMatchObject({
+      date: '2025-01-03',
+      completed: { increment: 2 },
+      byHour: { 20: { increment: 2 } },
+      byCategory: { household: { increment: 1 }, baby: { increment: 1 } },
+      streak: 7
+    });
+  });
+
+  test('later completions and uncompletions leave the streak alone', async () => {
+    const transaction = fakeTransaction({
+      'users/u1/dailyStats/2025-01-03': { completed: 1, streak: 7 }
+    });
+
+    const write = await prepareRollupWrites(transaction, {}, [
+      { userId: 'u1', category: 'household', at: friday, delta: 1 },
+      { userId: 'u1', category: 'household', at: new Date(2025, 0, 1, 9), delta: -1 }
+    ]);
+    write();
+
+    expect(transaction.set).toHaveBeenCalledTimes(2);
+    transaction.set.mock.calls.forEach(([, data]) => expect(data.streak).toBeUndefined());
+    expect(transaction.set.mock.calls[1][1].completed).toEqual({ increment: -1 });
+  });
+
+  test('streak runs through today, or yesterday until today has a completion', () => {
+    expect(currentStreak({ today: { completed: 2, streak: 5 }, yesterday: null })).toBe(5);
+    expect(currentStreak({ today: { completed: 0, streak: 5 }, yesterday: { completed: 1, streak: 4 } })).toBe(4);
+    expect(currentStreak({ today: null, yesterday: null })).toBe(0);
+  });
+});
@@ -0,0 +1,224 @@
+import { setDoc, getDoc, onSnapshot, runTransaction } from 'firebase/firestore';
+import {
+  closePatternStore,
+  flushPatternEvents,
+  getAIContext,
+  getUserPatterns,
+  initializePatternTracking,
+  trackSuggestionResponse,
+  trackTaskCompletion
+} from '@/lib/patternTracking';
+
+jest.mock('@/lib/firebase', () => ({ db: {}, auth: {} }));
+let mockAuthListener;
+jest.mock('firebase/auth', () => ({
+  onAuthStateChanged: jest.fn((auth, listener) => {
+    mockAuthListener = listener;
+    return jest.fn();
+  })
+}));
+const mockTransaction = {
+  get: jest.fn(),
+  set: jest.fn()
+};
+jest.mock('firebase/firestore', () => ({
+  doc: jest.fn((db, ...path) => path.join('/')),
+  collection: jest.fn((db, ...path) => path.join('/')),
+  query: jest.fn((collectionPath, ...constraints) => ({ collectionPath, constraints })),
+  where: jest.fn((...args) => args),
+  documentId: jest.fn(() => '__name__'),
+  getDocs: jest.fn(),
+  getDoc: jest.fn(),
+  setDoc: jest.fn(() => Promise.resolve()),
+  updateDoc: jest.fn(() => Promise.resolve()),
+  serverTimestamp: jest.fn(() => 'now'),
+  increment: jest.fn((n) => ({ increment: n })),
+  onSnapshot: jest.fn(),
+  runTransaction: jest.fn((db, update) => update(mockTransaction)),
+  arrayUnion: jest.fn((...values) => ({ arrayUnion: values }))
+}));
+
+describe('patternTracking event buffer', () => {
+  beforeEach(() => {
+    jest.useFakeTimers();
+    jest.setSystemTime(new Date(2025, 0, 3, 8, 15));
+    jest.clearAllMocks();
+    mockTransaction.get.mockResolvedValue({ exists: () => false });
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  test('buffers events into one merge write of increments', async () => {
+    await trackTaskCompletion('user-1', { title: 'Dishes', category: 'household' });
+    await trackTaskCompletion('user-1', { title: 'Laundry', category: 'household' });
+    await trackSuggestionResponse('user-1', { id: 's1', title: 'Call mom', category: 'relationship' }, true);
+    expect(runTransaction).not.toHaveBeenCalled();
+
+    await jest.advanceTimersByTimeAsync(10 * 1000);
+
+    expect(mockTransaction.set).toHaveBeenCalledTimes(1);
+    const [ref, update, options] = mockTransaction.set.mock.calls[0];
+    expect(ref).toBe('users/user-1/patterns/behavioral');
+    expect(options).toEqual({ merge: true });
+    expect(update).toMatchObject({
+      totalTasksCompleted: { increment: 2 },
+      suggestionsAccepted: { increment: 1 },
+      completionsByHour: { 8: { increment: 2 } },
+      completionsByDay: { 5: { increment: 2 } },
+      completionsByCategory: { household: { increment: 2 } },
+      categoryLastUsed: { household: 'now' },
+      suggestionHistory: { s1: { timestamp: 'now', accepted: true, category: 'relationship' } },
+      lastActiveDate: 'now'
+    });
+  });
+
+  test('seeds missing defaults on the first flush, then writes blind', async () => {
+    mockTransaction.get.mockResolvedValue({
+      exists: () => true,
+      data: () => ({ totalTasksCompleted: 7, categoryLastUsed: { household: 'earlier' } })
+    });
+
+    await trackTaskCompletion('user-5', { title: 'Dishes', category: 'baby' });
+    await flushPatternEvents('user-5');
+
+    const [, seeded] = mockTransaction.set.mock.calls[0];
+    expect(seeded).toMatchObject({
+      initialized: true,
+      totalTasksCompleted: { increment: 1 },
+      suggestionsAccepted: 0,
+      categoryLastUsed: { baby: 'now', work: null }
+    });
+    expect(seeded.categoryLastUsed).not.toHaveProperty('household');
+
+    await trackTaskCompletion('user-5', { title: 'Bottles', category: 'baby' });
+    await flushPatternEvents('user-5');
+
+    expect(runTransaction).toHaveBeenCalledTimes(1);
+    expect(getDoc).not.toHaveBeenCalled();
+    expect(setDoc).toHaveBeenCalledTimes(1);
+    expect(setDoc.mock.calls[0][1]).not.toHaveProperty('initialized');
+  });
+
+  test('initialization only fills in what the doc is missing', async () => {
+    mockTransaction.get.mockResolvedValue({
+      exists: () => true,
+      data: () => ({ completionsByCategory: { household: 4 }, suggestionsAccepted: 2 })
+    });
+
+    const patterns = await initializePatternTracking('user-6');
+
+    const [, seeds, options] = mockTransaction.set.mock.calls[0];
+    expect(options).toEqual({ merge: true });
+    expect(seeds).toMatchObject({ initialized: true, suggestionsDismissed: 0 });
+    expect(seeds).not.toHaveProperty('completionsByCategory');
+    expect(seeds).not.toHaveProperty('suggestionsAccepted');
+    expect(patterns).toMatchObject({ completionsByCategory: { household: 4 }, suggestionsAccepted: 2 });
+    expect(setDoc).not.toHaveBeenCalled();
+  });
+
+  test('requeues deltas when a flush fails', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    runTransaction.mockRejectedValueOnce(new Error('offline'));
+
+    await trackTaskCompletion('user-2', { title: 'Mow lawn', category: 'maintenance' });
+    await flushPatternEvents();
+    await trackTaskCompletion('user-2', { title: 'Rake leaves', category: 'maintenance' });
+    await flushPatternEvents();
+
+    expect(runTransaction).toHaveBeenCalledTimes(2);
+    expect(mockTransaction.set.mock.calls[0][1].completionsByCategory).toEqual({ maintenance: { increment: 2 } });
+    console.error.mockRestore();
+  });
+
+  test('flushes when the page is hidden', async () => {
+    await trackTaskCompletion('user-3', { title: 'Groceries', category: 'household' });
+
+    window.dispatchEvent(new Event('pagehide'));
+    await Promise.resolve();
+
+    expect(runTransaction).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('patternTracking live store', () => {
+  let emit;
+
+  const snapshot = (data) => ({ exists: () => true, data: () => data });
+  const patterns = (overrides = {}) => ({
+    completionsByHour: { 8: 3, 20: 5 },
+    completionsByDay: { 1: 4 },
+    completionsByCategory: { household: 6, baby: 2 },
+    categoryLastUsed: {},
+    overwhelmDays: [],
+    suggestionsAccepted: 1,
+    suggestionsDismissed: 3,
+    ...overrides
+  });
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    onSnapshot.mockImplementation((ref, onNext) => {
+      if (ref.collectionPath) {
+        // Daily rollups: today's doc
+        const now = new Date();
+        const today = `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, '0')}-${String(now.getDate()).padStart(2, '0')}`;
+        onNext({ docs: [{ id: today, data: () => ({ date: today, completed: 3, streak: 4 }) }] });
+      } else {
+        emit = (data) => onNext(snapshot(data));
+        emit(patterns());
+      }
+      return jest.fn();
+    });
+  });
+
+  afterEach(() => closePatternStore('user-4'));
+
+  test('callers share one set of listeners and no reads', async () => {
+    const context = await getAIContext('user-4');
+    await getAIContext('user-4');
+    await getUserPatterns('user-4');
+
+    // Patterns doc + daily rollups
+    expect(onSnapshot).toHaveBeenCalledTimes(2);
+    expect(getDoc).not.toHaveBeenCalled();
+    expect(context.todayCompletions).toBe(3);
+    expect(context.streakDays).toBe(4);
+    expect(context.mostProductiveHour).toBe(20);
+    expect(context.favoriteCategories).toEqual(['household', 'baby']);
+    expect(context.acceptanceRate).toBe(25);
+  });
+
+  test('closes the listeners when the user signs out', async () => {
+    const unsubscribes = [];
+    onSnapshot.mockImplementation((ref, onNext) => {
+      onNext(ref.collectionPath ? { docs: [] } : snapshot(patterns()));
+      const unsubscribe = jest.fn();
+      unsubscribes.push(unsubscribe);
+      return unsubscribe;
+    });
+    await getUserPatterns('user-5');
+
+    mockAuthListener({ uid: 'user-5' });
+    unsubscribes.forEach(unsubscribe => expect(unsubscribe).not.toHaveBeenCalled());
+
+    mockAuthListener(null);
+    unsubscribes.forEach(unsubscribe => expect(unsubscribe).toHaveBeenCalled());
+
+    // The next read opens a fresh store
+    await getUserPatterns('user-5');
+    expect(onSnapshot).toHaveBeenCalledTimes(4);
+    closePatternStore('user-5');
+  });
+
+  test('only recomputes insights whose fields changed', async () => {
+    const before = await getUserPatterns('user-4');
+
+    emit(patterns({ completionsByHour: { 8: 9, 20: 5 } }));
+    const after = await getUserPatterns('user-4');
+
+    expect(after.insights.mostProductiveHour).toBe(8);
+    expect(after.insights.favoriteCategories).toBe(before.insights.favoriteCategories);
+  });
+});
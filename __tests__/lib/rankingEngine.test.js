@@ -0,0 +1,143 @@
+/**
+ * @jest-environment node
+ */
+
+import {
+  buildRankingWeights,
+  rankTopK,
+  scoreBatch,
+  setRankingWeightModel,
+  taskFeatures,
+  topK,
+  RANKING_FEATURES
+} from '@/lib/rankingEngine';
+
+const PRIORITIES = ['high', 'medium', 'low'];
+const RELEVANCE = [undefined, 'priority-area', 'parent', 'homeowner', 'location'];
+const TIMING = [undefined, 'do-now', 'save-for-later', 'weekend'];
+const CATEGORIES = ['maintenance', 'household', 'baby', 'personal', 'relationship', 'home_projects', 'health'];
+
+// The string-comparison scorer this engine replaced, kept as the reference
+function legacyScore(task, profile, patterns, context) {
+  let score = 0;
+  score += task.priority === 'high' ? 30 : task.priority === 'medium' ? 20 : 10;
+  if (task.relevance === 'priority-area') score += 25;
+  if (task.relevance === 'parent' && profile?.kidsCount > 0) score += 20;
+  if (task.relevance === 'homeowner' && profile?.homeOwnership === 'own') score += 15;
+  if (task.relevance === 'location') score += 15;
+  if (patterns?.neglectedCategories?.includes(task.category)) score += 20;
+  if (patterns?.favoriteCategories?.includes(task.category)) score += 10;
+  if (task.timing === 'do-now') score += 15;
+  if (task.timing === 'save-for-later') score -= 10;
+  if (task.timing === 'weekend' && !context.isWeekend) score -= 15;
+  if (task.prevents) score += 15;
+  if (task.isSeasonal) score += 10;
+  return score;
+}
+
+function legacyRank(tasks, profile, patterns, context, k) {
+  return tasks
+    .map(task => ({ ...task, relevanceScore: legacyScore(task, profile, patterns, context) }))
+    .sort((a, b) => b.relevanceScore - a.relevanceScore)
+    .slice(0, k);
+}
+
+// Deterministic pseudo-random catalog
+function makeTasks(count) {
+  let seed = 42;
+  const random = (n) => {
+    seed = (seed * 1103515245 + 12345) % 2147483648;
+    return seed % n;
+  };
+  return Array.from({ length: count }, (_, i) => ({
+    title: `Task ${i}`,
+    category: CATEGORIES[random(CATEGORIES.length)],
+    priority: PRIORITIES[random(PRIORITIES.length)],
+    relevance: RELEVANCE[random(RELEVANCE.length)],
+    timing: TIMING[random(TIMING.length)],
+    prevents: random(4) === 0 ? 'Something' : undefined,
+    isSeasonal: random(5) === 0
+  }));
+}
+
+const profile = { kidsCount: 2, homeOwnership: 'own' };
+const patterns = { neglectedCategories: ['household'], favoriteCategories: ['baby', 'household'] };
+const context = { isWeekend: false };
+
+describe('rankingEngine', () => {
+  afterEach(() => setRankingWeightModel(null));
+
+  test('default weights reproduce the legacy ranking, ties included', () => {
+    const tasks = makeTasks(500);
+    const weights = buildRankingWeights(profile, patterns, context);
+    const ranked = rankTopK(tasks.map(task => ({ ...task })), tasks.map(task => taskFeatures(task)), weights, 10);
+
+    const expected = legacyRank(tasks, profile, patterns, context, 10);
+    expect(ranked.map(task => [task.title, task.relevanceScore]))
+      .toEqual(expected.map(task => [task.title, task.relevanceScore]));
+  });
+
+  test('topK matches a stable full sort for any k', () => {
+    const scores = Float64Array.from({ length: 200 }, (_, i) => (i * 37) % 11);
+    const sorted = [...scores.keys()].sort((a, b) => scores[b] - scores[a]);
+
+    [0, 1, 5, 200, 500].forEach(k => {
+      expect(topK(scores, k)).toEqual(sorted.slice(0, k));
+    });
+  });
+
+  test('a learned weight model can adjust the weights', () => {
+    const tasks = [
+      { title: 'Low priority health task', category: 'health', priority: 'low' },
+      { title: 'High priority chore', category: 'household', priority: 'high' }
+    ];
+    const health = RANKING_FEATURES.indexOf('category:health');
+    setRankingWeightModel((weights) => {
+      weights[health] = 100;
+    });
+
+    const weights = buildRankingWeights(null, null, context);
+    const ranked = rankTopK(tasks, tasks.map(task => taskFeatures(task)), weights, 1);
+
+    expect(ranked[0].title).toBe('Low priority health task');
+    expect(ranked[0].relevanceScore).toBe(110);
+  });
+
+  test('a failing weight model falls back to the defaults', () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    setRankingWeightModel((weights) => {
+      weights[0] = 999;
+      throw new Error('model unavailable');
+    });
+
+    const weights = buildRankingWeights(null, null, context);
+
+    expect(weights[RANKING_FEATURES.indexOf('priorityHigh')]).toBe(30);
+    console.error.mockRestore();
+  });
+
+  // Micro-benchmark, run with `npm run bench:ranking`
+  (process.env.BENCHMARK ? test : test.skip)('benchmark: legacy sort vs top-k engine', () => {
+    const time = (fn, runs) => {
+      fn();
+      const start = process.hrtime.bigint();
+      for (let i = 0; i < runs; i++) fn();
+      return Number(process.hrtime.bigint() - start) / 1e6 / runs;
+    };
+
+    [1000, 10000, 100000].forEach(size => {
+      const tasks = makeTasks(size);
+      // Catalog features are computed ahead of time, as the suggestion catalog does
+      const featureRows = tasks.map(task => taskFeatures(task));
+      const runs = size >= 100000 ? 5 : 50;
+
+      const legacyMs = time(() => legacyRank(tasks, profile, patterns, context, 10), runs);
+      const engineMs = time(() => {
+        const weights = buildRankingWeights(profile, patterns, context);
+        topK(scoreBatch(featureRows, weights), 10);
+      }, runs);
+
+      console.log(`${size} tasks: legacy ${legacyMs.toFixed(2)}ms, engine ${engineMs.toFixed(2)}ms (${(legacyMs / engineMs).toFixed(1)}x)`);
+    });
+  });
+});
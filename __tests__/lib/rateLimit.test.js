@@ -0,0 +1,69 @@
+/**
+ * @jest-environment node
+ */
+
+import { MemoryRateLimitStore, slidingWindow, tokenBucket } from '@/lib/rateLimit';
+
+describe('rateLimit', () => {
+  let now;
+  let store;
+  const clock = () => now;
+
+  beforeEach(() => {
+    now = 1_000_000;
+    store = new MemoryRateLimitStore(clock);
+  });
+
+  test('sliding window allows up to the limit and reports retry time', async () => {
+    const limiter = slidingWindow({ name: 'test', limit: 3, windowMs: 60_000, store, clock });
+
+    for (let i = 0; i < 3; i++) {
+      expect((await limiter.check('user:a')).allowed).toBe(true);
+    }
+    const denied = await limiter.check('user:a');
+
+    expect(denied.allowed).toBe(false);
+    expect(denied.retryAfterMs).toBeGreaterThan(0);
+    // Other callers have their own window
+    expect((await limiter.check('user:b')).allowed).toBe(true);
+  });
+
+  test('sliding window weights the previous window as it slides out', async () => {
+    const limiter = slidingWindow({ name: 'test', limit: 4, windowMs: 60_000, store, clock });
+    now = 60_000 * 100; // start of a window
+
+    for (let i = 0; i < 4; i++) {
+      await limiter.check('user:a');
+    }
+
+    // A quarter into the next window, 75% of the previous count (3) still applies
+    now += 60_000 + 15_000;
+    expect((await limiter.check('user:a')).allowed).toBe(true);
+    expect((await limiter.check('user:a')).allowed).toBe(false);
+  });
+
+  test('token bucket allows bursts and refills over time', async () => {
+    const limiter = tokenBucket({ name: 'test', capacity: 2, refillPerSecond: 1, store, clock });
+
+    expect((await limiter.check('user:a')).allowed).toBe(true);
+    expect((await limiter.check('user:a')).allowed).toBe(true);
+    const denied = await limiter.check('user:a');
+    expect(denied.allowed).toBe(false);
+    expect(denied.retryAfterMs).toBe(1000);
+
+    now += 1000;
+    expect((await limiter.check('user:a')).allowed).toBe(true);
+  });
+
+  test('fails open when the store is unavailable', async () => {
+    const brokenStore = {
+      getCount: () => Promise.reject(new Error('unavailable')),
+      incrementCount: () => Promise.reject(new Error('unavailable')),
+      transactBucket: () => Promise.reject(new Error('unavailable'))
+    };
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    const limiter = slidingWindow({ name: 'test', limit: 1, windowMs: 60_000, store: brokenStore, clock });
+    expect((await limiter.check('user:a')).allowed).toBe(true);
+  });
+});
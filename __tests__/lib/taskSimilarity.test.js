@@ -0,0 +1,62 @@
+/**
+ * @jest-environment node
+ */
+
+import {
+  dedupeSuggestions,
+  getTaskSimilarityIndex,
+  normalizeTitle,
+  TaskSimilarityIndex
+} from '@/lib/taskSimilarity';
+
+describe('taskSimilarity', () => {
+  test('normalizes case, punctuation and filler words', () => {
+    expect(normalizeTitle('  Take out the TRASH! ')).toBe('take out trash');
+    expect(normalizeTitle(undefined)).toBe('');
+  });
+
+  test('matches exact and near-identical titles', () => {
+    const index = getTaskSimilarityIndex([
+      { title: 'Take out the trash' },
+      { title: 'Schedule dentist appointment' }
+    ]);
+
+    expect(index.findSimilar('take out trash').score).toBe(1);
+    expect(index.has('Schedule dentist appointments')).toBe(true);
+    expect(index.has('Mow the lawn')).toBe(false);
+  });
+
+  test('a shared prefix alone is not a match', () => {
+    const index = getTaskSimilarityIndex([{ title: 'Schedule doctor checkup' }]);
+
+    expect(index.has('Schedule car maintenance')).toBe(false);
+  });
+
+  test('builds one index per task snapshot', () => {
+    const tasks = [{ title: 'Water the plants' }];
+
+    expect(getTaskSimilarityIndex(tasks)).toBe(getTaskSimilarityIndex(tasks));
+    expect(getTaskSimilarityIndex([...tasks])).not.toBe(getTaskSimilarityIndex(tasks));
+  });
+
+  test('dedupes suggestions against existing tasks and each other', () => {
+    const suggestions = [
+      { title: 'Water your plants' },
+      { title: 'Make your bed' },
+      { title: 'Make the bed' },
+      { title: 'Vacuum one room' }
+    ];
+
+    const kept = dedupeSuggestions(suggestions, [{ title: 'water plants' }]);
+
+    expect(kept.map(s => s.title)).toEqual(['Make your bed', 'Vacuum one room']);
+  });
+
+  test('added titles are found afterwards', () => {
+    const index = new TaskSimilarityIndex();
+    index.add('Clean dryer vent', 'vent');
+
+    expect(index.findSimilar('Clean the dryer vents').item).toBe('vent');
+    expect(index.size).toBe(1);
+  });
+});
@@ -0,0 +1,89 @@
+/**
+ * @jest-environment node
+ */
+
+import {
+  extractClientQueries,
+  extractAdminQueries,
+  expandVariants,
+  requiredIndexes,
+  covers
+} from '@/scripts/firestore-indexes';
+
+describe('firestore index generator', () => {
+  test('extracts client queries including optional refinements', () => {
+    const source = `
+      let q = query(collection(db, 'tasks'), where('userId', '==', uid));
+      if (status) {
+        q = query(q, where('status', '==', status));
+      }
+      q = query(q, orderBy('createdAt', 'desc'));
+    `;
+    const [shape] = extractClientQueries(source, 'file.js');
+
+    expect(shape.collection).toBe('tasks');
+    expect(shape.required).toHaveLength(1);
+    expect(expandVariants(shape)).toHaveLength(4);
+  });
+
+  test('extracts admin SDK chains through collection refs', () => {
+    const source = `
+      const ref = db.collection('scheduledNotifications');
+      const snap = await ref.where('sent', '==', false).where('scheduledFor', '<=', now).limit(50).get();
+      await db.collection('users').doc(uid).get();
+    `;
+    const shapes = extractAdminQueries(source, 'index.js');
+
+    expect(shapes).toHaveLength(1);
+    expect(shapes[0].collection).toBe('scheduledNotifications');
+    expect(shapes[0].required.map(c => c.op)).toEqual(['==', '<=']);
+  });
+
+  test('equality-only queries need no composite index', () => {
+    expect(requiredIndexes('tasks', [
+      { kind: 'where', field: 'userId', op: '==' },
+      { kind: 'where', field: 'sent', op: '==' }
+    ])).toEqual([]);
+  });
+
+  test('equality + range needs one composite index', () => {
+    const [index] = requiredIndexes('tasks', [
+      { kind: 'where', field: 'userId', op: '==' },
+      { kind: 'where', field: 'createdAt', op: '>=' }
+    ]);
+
+    expect(index.fields).toEqual([
+      { fieldPath: 'userId', order: 'ASCENDING' },
+      { fieldPath: 'createdAt', order: 'ASCENDING' }
+    ]);
+  });
+
+  test('multiple equalities with a sort use merged per-field indexes', () => {
+    const indexes = requiredIndexes('tasks', [
+      { kind: 'where', field: 'userId', op: '==' },
+      { kind: 'where', field: 'status', op: '==' },
+      { kind: 'orderBy', field: 'createdAt', direction: 'DESCENDING' }
+    ]);
+
+    expect(indexes.map(i => i.fields[0].fieldPath)).toEqual(['status', 'userId']);
+  });
+
+  test('declared indexes cover requirements regardless of equality order', () => {
+    const [required] = requiredIndexes('tasks', [
+      { kind: 'where', field: 'userId', op: '==' },
+      { kind: 'where', field: 'title', op: '==' },
+      { kind: 'where', field: 'createdAt', op: '>' }
+    ]);
+    const declared = {
+      collectionGroup: 'tasks',
+      queryScope: 'COLLECTION',
+      fields: [
+        { fieldPath: 'userId', order: 'ASCENDING' },
+        { fieldPath: 'title', order: 'ASCENDING' },
+        { fieldPath: 'createdAt', order: 'ASCENDING' }
+      ]
+    };
+
+    expect(covers(declared, required)).toBe(true);
+  });
+});
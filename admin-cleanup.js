@@ -3,112 +3,87 @@
 // Admin cleanup utility using Firebase Admin SDK
 // Usage: node admin-cleanup.js YOUR_USER_ID
 
-const admin = require('firebase-admin');
-
-// Initialize Firebase Admin SDK
-if (!admin.apps.length) {
-  const serviceAccount = {
-    type: "service_account",
-    project_id: process.env.NEXT_PUBLIC_FIREBASE_PROJECT_ID || 'betterish',
-    client_email: process.env.FIREBASE_ADMIN_CLIENT_EMAIL,
-    private_key: process.env.FIREBASE_ADMIN_PRIVATE_KEY?.replace(/\\n/g, '\n'),
-  };
-
-  admin.initializeApp({
-    credential: admin.credential.cert(serviceAccount),
-    projectId: 'betterish'
-  });
-}
-
-const db = admin.firestore();
+const { admin, db, runMaintenance } = require('./scripts/lib/maintenance');
 
 async function cleanupProblematicTasks(userId) {
   try {
     console.log('🔍 Finding problematic tasks for user:', userId);
     
-    const tasksRef = db.collection('tasks');
-    const snapshot = await tasksRef.where('userId', '==', userId).get();
-    
-    console.log(`📋 Found ${snapshot.size} total tasks to check`);
-    
-    let deletedCount = 0;
-    let checkedCount = 0;
-    
-    for (const doc of snapshot.docs) {
-      const data = doc.data();
-      const id = doc.id;
-      checkedCount++;
+    const report = await runMaintenance({
+      name: 'problematic tasks',
+      query: db.collection('tasks').where('userId', '==', userId),
+      handle: (doc, { ops, report }) => {
+        const data = doc.data();
+        const id = doc.id;
       
-      let shouldDelete = false;
-      let reason = '';
+        let shouldDelete = false;
+        let reason = '';
       
-      // Delete template tasks that shouldn't be in user data
-      const templatePatterns = ['rel_', 'baby_', 'house_', 'self_', 'admin_', 'seas_'];
-      if (templatePatterns.some(pattern => id.startsWith(pattern))) {
-        shouldDelete = true;
-        reason = 'template task ID';
-      }
+        // Delete template tasks that shouldn't be in user data
+        const templatePatterns = ['rel_', 'baby_', 'house_', 'self_', 'admin_', 'seas_'];
+        if (templatePatterns.some(pattern => id.startsWith(pattern))) {
+          shouldDelete = true;
+          reason = 'template task ID';
+        }
       
-      // Delete tasks with very short IDs (likely templates) 
-      else if (id.length < 10) {
-        shouldDelete = true;
-        reason = 'suspiciously short ID';
-      }
+        // Delete tasks with very short IDs (likely templates) 
+        else if (id.length < 10) {
+          shouldDelete = true;
+          reason = 'suspiciously short ID';
+        }
       
-      // Delete tasks with missing critical fields
-      else if (!data.title || !data.userId || !data.createdAt) {
-        shouldDelete = true;
-        reason = 'missing critical fields';
-      }
+        // Delete tasks with missing critical fields
+        else if (!data.title || !data.userId || !data.createdAt) {
+          shouldDelete = true;
+          reason = 'missing critical fields';
+        }
       
-      // Check for malformed timestamps
-      else if (data.createdAt && !(data.createdAt instanceof admin.firestore.Timestamp)) {
-        shouldDelete = true;
-        reason = 'invalid timestamp format';
-      }
+        // Check for malformed timestamps
+        else if (data.createdAt && !(data.createdAt instanceof admin.firestore.Timestamp)) {
+          shouldDelete = true;
+          reason = 'invalid timestamp format';
+        }
       
-      // Check date ranges
-      else if (data.createdAt) {
-        try {
-          const date = data.createdAt.toDate();
-          if (date > new Date()) {
-            shouldDelete = true;
-            reason = 'future-dated task';
-          } else if (date.getFullYear() < 2020) {
+        // Check date ranges
+        else if (data.createdAt) {
+          try {
+            const date = data.createdAt.toDate();
+            if (date > new Date()) {
+              shouldDelete = true;
+              reason = 'future-dated task';
+            } else if (date.getFullYear() < 2020) {
+              shouldDelete = true;
+              reason = 'suspiciously old date';
+            }
+          } catch (e) {
             shouldDelete = true;
-            reason = 'suspiciously old date';
+            reason = 'date conversion error';
           }
-        } catch (e) {
-          shouldDelete = true;
-          reason = 'date conversion error';
         }
-      }
       
-      // Delete tasks with malformed data types
-      if (!shouldDelete) {
-        if ((data.title && typeof data.title !== 'string') ||
-            (data.detail && typeof data.detail !== 'string') ||
-            (data.category && typeof data.category !== 'string')) {
-          shouldDelete = true;
-          reason = 'malformed data types';
+        // Delete tasks with malformed data types
+        if (!shouldDelete) {
+          if ((data.title && typeof data.title !== 'string') ||
+              (data.detail && typeof data.detail !== 'string') ||
+              (data.category && typeof data.category !== 'string')) {
+            shouldDelete = true;
+            reason = 'malformed data types';
+          }
         }
-      }
       
-      if (shouldDelete) {
-        console.log(`🗑️ Deleting task ${id}: ${reason}`);
-        console.log(`   Title: ${data.title || 'N/A'}`);
+        if (shouldDelete) {
+          console.log(`🗑️ Deleting task ${id}: ${reason}`);
+          console.log(`   Title: ${data.title || 'N/A'}`);
         
-        try {
-          await doc.ref.delete();
-          deletedCount++;
-          console.log(`   ✅ Deleted successfully`);
-        } catch (deleteError) {
-          console.log(`   ❌ Failed to delete: ${deleteError.message}`);
+          ops.delete(doc.ref);
+          report.count('deleted');
+          console.log('');
         }
-        console.log('');
       }
-    }
+    });
     
+    const checkedCount = report.scanned;
+    const deletedCount = (report.counters.deleted || 0) - (report.counters.failed || 0);
     console.log(`📊 Summary:`);
     console.log(`   Checked: ${checkedCount} tasks`);
     console.log(`   Deleted: ${deletedCount} problematic tasks`);
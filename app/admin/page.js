@@ -7,38 +7,56 @@ export default function AdminPage() {
   const [result, setResult] = useState(null);
   const [error, setError] = useState(null);
 
-  const runGlobalCleanup = async () => {
-    if (!confirm('⚠️ This will delete ALL problematic template tasks for ALL users!\n\nThis includes tasks with IDs starting with:\n- rel_, baby_, house_, self_, admin_, etc.\n- Template titles like "Ask how her day was"\n- Corrupted or orphaned tasks\n\nAre you sure you want to proceed?')) {
+  const [progress, setProgress] = useState(null);
+
+  const runGlobalCleanup = async (dryRun = false) => {
+    if (!dryRun && !confirm('⚠️ This will delete ALL problematic template tasks for ALL users!\n\nThis includes tasks with IDs starting with:\n- rel_, baby_, house_, self_, admin_, etc.\n- Template titles like "Ask how her day was"\n- Corrupted or orphaned tasks\n\nAre you sure you want to proceed?')) {
       return;
     }
 
     setLoading(true);
     setError(null);
     setResult(null);
+    setProgress(null);
 
     try {
-      const response = await fetch('/api/admin/cleanup-all-users', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          adminKey: 'cleanup-all-template-tasks-2025' // Simple admin key
-        })
-      });
-
-      const data = await response.json();
-
-      if (data.success) {
-        setResult(data);
-      } else {
-        setError(data.error || 'Cleanup failed');
+      // The server scans until its time budget runs out and checkpoints;
+      // keep calling until it reports the whole collection is done
+      let restart = true;
+      for (;;) {
+        const response = await fetch('/api/admin/cleanup-all-users', {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify({
+            adminKey: 'cleanup-all-template-tasks-2025', // Simple admin key
+            dryRun,
+            restart
+          })
+        });
+
+        const data = await response.json();
+
+        if (!data.success) {
+          setError(data.error || 'Cleanup failed');
+          break;
+        }
+
+        if (data.done) {
+          setResult(data);
+          break;
+        }
+
+        setProgress(data.stats);
+        restart = false;
       }
 
     } catch (err) {
       setError(err.message);
     } finally {
       setLoading(false);
+      setProgress(null);
     }
   };
 
@@ -71,22 +89,37 @@ export default function AdminPage() {
             </ul>
           </div>
 
-          <button
-            onClick={runGlobalCleanup}
-            disabled={loading}
-            className="bg-red-600 text-white px-6 py-3 rounded-lg hover:bg-red-700 transition-colors disabled:opacity-50 disabled:cursor-not-allowed flex items-center gap-2"
-          >
-            {loading ? (
-              <>
-                <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white"></div>
-                Running Global Cleanup...
-              </>
-            ) : (
-              <>
-                🧹 Run Global Template Task Cleanup
-              </>
-            )}
-          </button>
+          <div className="flex flex-wrap gap-3">
+            <button
+              onClick={() => runGlobalCleanup(true)}
+              disabled={loading}
+              className="bg-gray-600 text-white px-6 py-3 rounded-lg hover:bg-gray-700 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+            >
+              🔍 Dry Run (report only)
+            </button>
+            <button
+              onClick={() => runGlobalCleanup(false)}
+              disabled={loading}
+              className="bg-red-600 text-white px-6 py-3 rounded-lg hover:bg-red-700 transition-colors disabled:opacity-50 disabled:cursor-not-allowed flex items-center gap-2"
+            >
+              {loading ? (
+                <>
+                  <div className="animate-spin rounded-full h-4 w-4 border-b-2 border-white"></div>
+                  Running Global Cleanup...
+                </>
+              ) : (
+                <>
+                  🧹 Run Global Template Task Cleanup
+                </>
+              )}
+            </button>
+          </div>
+
+          {progress && (
+            <p className="mt-4 text-sm text-gray-600">
+              Scanned {progress.totalTasks} tasks so far, {progress.matchedTasks} matched...
+            </p>
+          )}
 
           {error && (
             <div className="mt-6 bg-red-50 border border-red-200 rounded-lg p-4">
@@ -97,9 +130,12 @@ export default function AdminPage() {
 
           {result && (
             <div className="mt-6 bg-green-50 border border-green-200 rounded-lg p-4">
-              <h3 className="text-lg font-semibold text-green-800 mb-2">✅ Cleanup Complete</h3>
+              <h3 className="text-lg font-semibold text-green-800 mb-2">
+                {result.dryRun ? '🔍 Dry Run Report' : '✅ Cleanup Complete'}
+              </h3>
               <div className="text-green-700 space-y-2">
                 <p><strong>Total Tasks:</strong> {result.stats.totalTasks}</p>
+                {result.dryRun && <p><strong>Would Delete:</strong> {result.stats.matchedTasks}</p>}
                 <p><strong>Deleted Tasks:</strong> {result.stats.deletedTasks}</p>
                 <p><strong>Remaining Tasks:</strong> {result.stats.remainingTasks}</p>
                 <p><strong>Total Users:</strong> {result.stats.userCount}</p>
@@ -108,7 +144,7 @@ export default function AdminPage() {
 
               {result.tasksByReason && (
                 <div className="mt-4">
-                  <h4 className="font-semibold mb-2">Tasks deleted by reason:</h4>
+                  <h4 className="font-semibold mb-2">Tasks {result.dryRun ? 'matched' : 'deleted'} by reason:</h4>
                   <ul className="text-sm space-y-1">
                     {Object.entries(result.tasksByReason).map(([reason, data]) => (
                       <li key={reason}>
@@ -130,7 +166,7 @@ export default function AdminPage() {
                   <div className="text-sm max-h-40 overflow-y-auto">
                     {Object.entries(result.userSummary).map(([userId, stats]) => (
                       <div key={userId} className="py-1">
-                        <strong>User {userId.substring(0, 8)}...:</strong> {stats.deleted} tasks deleted 
+                        <strong>User {userId.substring(0, 8)}...:</strong> {stats.deleted} tasks {result.dryRun ? 'matched' : 'deleted'} 
                         <span className="text-gray-600"> ({stats.reasons.join(', ')})</span>
                       </div>
                     ))}
@@ -1,6 +1,23 @@
 import { adminAuth as auth, adminDb as db } from '@/lib/firebase-admin';
+import { FieldPath, FieldValue } from 'firebase-admin/firestore';
 import { NextResponse } from 'next/server';
 
+// Allow long scans on platforms that honor it; the scan itself stops at the time budget
+export const maxDuration = 60;
+
+// Scan tuning - each request scans pages until the budget is spent, then
+// persists its cursor so the next request resumes where this one stopped
+const PAGE_SIZE = 1000;
+const TIME_BUDGET_MS = 45 * 1000;
+// One checkpoint per mode, so a dry run never clobbers a paused real run
+const CHECKPOINT_COLLECTION = 'jobCheckpoints';
+const CHECKPOINT_IDS = {
+  real: 'globalTemplateCleanup',
+  dryRun: 'globalTemplateCleanupDryRun'
+};
+const MAX_USER_SUMMARY = 500;   // keep the checkpoint doc well under 1 MB
+const EXAMPLES_PER_REASON = 3;
+
 // Template patterns to delete globally
 const TEMPLATE_ID_PREFIXES = [
   'rel_',      // relationship tasks
@@ -57,9 +74,94 @@ const TEMPLATE_TITLES = [
   'Update project status',
 ];
 
+const TEMPLATE_TITLE_SET = new Set(TEMPLATE_TITLES.map(title => title.toLowerCase()));
+
+// Why a task should be deleted, or null to keep it
+function classifyTask(taskId, taskData) {
+  // Check for template ID prefixes
+  if (TEMPLATE_ID_PREFIXES.some(prefix => taskId.toLowerCase().startsWith(prefix))) {
+    return 'Template ID prefix';
+  }
+  
+  // Check for template titles
+  if (taskData.title && TEMPLATE_TITLE_SET.has(taskData.title.toLowerCase().trim())) {
+    return 'Template title match';
+  }
+  
+  // Check for very short IDs (likely templates)
+  if (taskId.length < 15 && /^[a-z]+_?\d*$/i.test(taskId)) {
+    return 'Suspicious short ID';
+  }
+  
+  // Check for missing critical fields
+  if (!taskData.title || !taskData.userId || !taskData.createdAt) {
+    return 'Missing critical fields';
+  }
+  
+  // Check for tasks with no userId (orphaned)
+  if (taskData.userId === 'undefined' || taskData.userId === 'null') {
+    return 'Orphaned task (no valid userId)';
+  }
+  
+  // Check for very old tasks that might be test data
+  if (taskData.createdAt && taskData.createdAt.toDate) {
+    try {
+      if (taskData.createdAt.toDate().getFullYear() < 2023) {
+        return 'Very old task (pre-2023)';
+      }
+    } catch (e) {
+      return 'Date conversion error';
+    }
+  }
+  
+  return null;
+}
+
+function emptyProgress(dryRun) {
+  return {
+    cursor: null,
+    dryRun,
+    scanned: 0,
+    matched: 0,
+    affectedUsers: 0,
+    tasksByReason: {},
+    userSummary: {},
+    startedAt: FieldValue.serverTimestamp()
+  };
+}
+
+function recordMatch(progress, taskId, taskData, reason) {
+  const userId = taskData.userId || 'unknown';
+  progress.matched++;
+  
+  const byReason = progress.tasksByReason[reason] || (progress.tasksByReason[reason] = { count: 0, examples: [] });
+  byReason.count++;
+  if (byReason.examples.length < EXAMPLES_PER_REASON) {
+    byReason.examples.push({ id: taskId, title: taskData.title || 'NO TITLE' });
+  }
+  
+  // Track deletions per user
+  let userStats = progress.userSummary[userId];
+  if (!userStats) {
+    progress.affectedUsers++;
+    if (Object.keys(progress.userSummary).length >= MAX_USER_SUMMARY) return;
+    userStats = progress.userSummary[userId] = { deleted: 0, reasons: [] };
+  }
+  userStats.deleted++;
+  if (!userStats.reasons.includes(reason)) userStats.reasons.push(reason);
+}
+
+/**
+ * POST { adminKey, dryRun?, restart? }
+ * Streams the tasks collection page by page, deleting matches through a
+ * BulkWriter (or only reporting them with dryRun). Returns done: false when
+ * the time budget ran out; calling again resumes from the saved cursor.
+ */
 export async function POST(request) {
+  const startedAt = Date.now();
+  
   try {
-    const { adminKey } = await request.json();
+    const { adminKey, dryRun = false, restart = false } = await request.json();
     
     // Simple admin key check (you should change this)
     if (adminKey !== 'cleanup-all-template-tasks-2025') {
@@ -76,159 +178,87 @@ export async function POST(request) {
       );
     }
 
-    console.log('🚀 Starting global template task cleanup...');
+    const checkpointRef = db.collection(CHECKPOINT_COLLECTION).doc(dryRun ? CHECKPOINT_IDS.dryRun : CHECKPOINT_IDS.real);
+    const saved = (await checkpointRef.get()).data();
     
-    // Get ALL tasks from the database
-    const tasksSnapshot = await db.collection('tasks').get();
-    console.log(`📊 Found ${tasksSnapshot.size} total tasks in database`);
+    // The mode check skips dry-run progress left in the real doc by older runs
+    const progress = !restart && saved?.cursor && saved.dryRun === dryRun
+      ? saved
+      : emptyProgress(dryRun);
     
-    let deletedCount = 0;
-    let userTaskCounts = new Map();
-    const tasksToDelete = [];
-    const userSummary = new Map();
+    console.log(`🚀 ${progress.cursor ? 'Resuming' : 'Starting'} global template task cleanup${dryRun ? ' (dry run)' : ''}...`);
     
-    // Analyze each task
-    tasksSnapshot.docs.forEach((doc) => {
-      const taskId = doc.id;
-      const taskData = doc.data();
-      const userId = taskData.userId || 'unknown';
-      
-      // Count tasks per user
-      userTaskCounts.set(userId, (userTaskCounts.get(userId) || 0) + 1);
-      
-      let shouldDelete = false;
-      let reason = '';
+    const writer = dryRun ? null : db.bulkWriter();
+    writer?.onWriteError(error => {
+      console.error(`Cleanup delete failed for ${error.documentRef.path}:`, error.message);
+      return error.failedAttempts < 3;
+    });
+    
+    let done = false;
+    while (Date.now() - startedAt < TIME_BUDGET_MS) {
+      let pageQuery = db.collection('tasks')
+        .orderBy(FieldPath.documentId())
+        .limit(PAGE_SIZE);
+      if (progress.cursor) pageQuery = pageQuery.startAfter(progress.cursor);
       
-      // Check for template ID prefixes
-      if (TEMPLATE_ID_PREFIXES.some(prefix => taskId.toLowerCase().startsWith(prefix))) {
-        shouldDelete = true;
-        reason = 'Template ID prefix';
-      }
+      const page = await pageQuery.get();
       
-      // Check for template titles
-      else if (taskData.title && TEMPLATE_TITLES.some(title => 
-        taskData.title.toLowerCase().trim() === title.toLowerCase()
-      )) {
-        shouldDelete = true;
-        reason = 'Template title match';
-      }
+      page.docs.forEach((doc) => {
+        const taskData = doc.data();
+        const reason = classifyTask(doc.id, taskData);
+        if (!reason) return;
+        
+        recordMatch(progress, doc.id, taskData, reason);
+        writer?.delete(doc.ref);
+      });
       
-      // Check for very short IDs (likely templates)
-      else if (taskId.length < 15 && /^[a-z]+_?\d*$/i.test(taskId)) {
-        shouldDelete = true;
-        reason = 'Suspicious short ID';
-      }
+      progress.scanned += page.size;
       
-      // Check for missing critical fields
-      else if (!taskData.title || !taskData.userId || !taskData.createdAt) {
-        shouldDelete = true;
-        reason = 'Missing critical fields';
-      }
+      // Deletes must land before the cursor moves past them
+      await writer?.flush();
       
-      // Check for tasks with no userId (orphaned)
-      else if (!taskData.userId || taskData.userId === 'undefined' || taskData.userId === 'null') {
-        shouldDelete = true;
-        reason = 'Orphaned task (no valid userId)';
+      if (page.size < PAGE_SIZE) {
+        progress.cursor = null;
+        done = true;
+      } else {
+        progress.cursor = page.docs[page.docs.length - 1].id;
       }
       
-      // Check for very old tasks that might be test data
-      else if (taskData.createdAt && taskData.createdAt.toDate) {
-        try {
-          const date = taskData.createdAt.toDate();
-          if (date.getFullYear() < 2023) {
-            shouldDelete = true;
-            reason = 'Very old task (pre-2023)';
-          }
-        } catch (e) {
-          shouldDelete = true;
-          reason = 'Date conversion error';
-        }
-      }
+      await checkpointRef.set({ ...progress, updatedAt: FieldValue.serverTimestamp() });
+      console.log(`Scanned ${progress.scanned} tasks, ${progress.matched} ${dryRun ? 'would be deleted' : 'deleted'}`);
       
-      if (shouldDelete) {
-        tasksToDelete.push({
-          id: taskId,
-          userId: userId,
-          title: taskData.title || 'NO TITLE',
-          reason: reason,
-          ref: doc.ref
-        });
-        
-        // Track deletions per user
-        if (!userSummary.has(userId)) {
-          userSummary.set(userId, { deleted: 0, reasons: new Set() });
-        }
-        const userStats = userSummary.get(userId);
-        userStats.deleted++;
-        userStats.reasons.add(reason);
-      }
-    });
-    
-    if (tasksToDelete.length === 0) {
-      return NextResponse.json({
-        success: true,
-        message: 'No problematic tasks found! Database is clean.',
-        stats: {
-          totalTasks: tasksSnapshot.size,
-          deletedTasks: 0,
-          remainingTasks: tasksSnapshot.size,
-          userCount: userTaskCounts.size
-        }
-      });
+      if (done) break;
     }
     
-    console.log(`⚠️ Found ${tasksToDelete.length} problematic tasks to delete`);
-    
-    // Delete tasks in batches to avoid timeouts
-    const batchSize = 500;
-    for (let i = 0; i < tasksToDelete.length; i += batchSize) {
-      const batch = db.batch();
-      const batchTasks = tasksToDelete.slice(i, Math.min(i + batchSize, tasksToDelete.length));
-      
-      batchTasks.forEach(task => {
-        batch.delete(task.ref);
-      });
-      
-      await batch.commit();
-      deletedCount += batchTasks.length;
-      console.log(`Deleted batch: ${deletedCount}/${tasksToDelete.length} tasks`);
-    }
+    await writer?.close();
     
-    // Create summary by reason
-    const tasksByReason = {};
-    tasksToDelete.forEach(task => {
-      if (!tasksByReason[task.reason]) {
-        tasksByReason[task.reason] = [];
-      }
-      tasksByReason[task.reason].push(task);
-    });
+    const userCount = (await db.collection('users').count().get()).data().count;
+    const deletedTasks = dryRun ? 0 : progress.matched;
     
-    console.log('✅ Global cleanup complete!');
-    console.log(`Deleted ${deletedCount} problematic tasks`);
-    console.log(`Remaining tasks: ${tasksSnapshot.size - deletedCount}`);
+    if (done) {
+      console.log(`✅ Global cleanup ${dryRun ? 'dry run ' : ''}complete!`);
+    }
     
     return NextResponse.json({
       success: true,
-      message: 'Global cleanup completed successfully!',
+      done,
+      dryRun,
+      message: done
+        ? (progress.matched === 0
+          ? 'No problematic tasks found! Database is clean.'
+          : dryRun ? 'Dry run complete - nothing was deleted.' : 'Global cleanup completed successfully!')
+        : 'Cleanup paused at the time limit - run again to resume.',
       stats: {
-        totalTasks: tasksSnapshot.size,
-        deletedTasks: deletedCount,
-        remainingTasks: tasksSnapshot.size - deletedCount,
-        userCount: userTaskCounts.size,
-        affectedUsers: userSummary.size
+        totalTasks: progress.scanned,
+        matchedTasks: progress.matched,
+        deletedTasks,
+        remainingTasks: progress.scanned - deletedTasks,
+        userCount,
+        affectedUsers: progress.affectedUsers,
+        elapsedMs: Date.now() - startedAt
       },
-      tasksByReason: Object.fromEntries(
-        Object.entries(tasksByReason).map(([reason, tasks]) => [
-          reason, 
-          { count: tasks.length, examples: tasks.slice(0, 3).map(t => ({ id: t.id, title: t.title })) }
-        ])
-      ),
-      userSummary: Object.fromEntries(
-        Array.from(userSummary.entries()).map(([userId, stats]) => [
-          userId,
-          { deleted: stats.deleted, reasons: Array.from(stats.reasons) }
-        ])
-      )
+      tasksByReason: progress.tasksByReason,
+      userSummary: progress.userSummary
     });
 
   } catch (error) {
@@ -242,4 +272,4 @@ export async function POST(request) {
       { status: 500 }
     );
   }
-}
\ No newline at end of file
+}
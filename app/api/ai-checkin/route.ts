@@ -6,9 +6,14 @@
 import { NextResponse } from 'next/server';
 import { createDadMentor } from '@/lib/aiMentor';
 import { getAiService } from '@/lib/ai/AiService';
+import { getAiResponseCache } from '@/lib/ai/ResponseCache';
+import { enableFirestoreCacheTier } from '@/lib/ai/FirestoreCacheTier';
+import { getAiRateLimiter, rateLimitId, rateLimitHeaders } from '@/lib/rateLimit';
 import { Task, User, TaskStatus } from '@/types/models';
 
 export async function POST(request: Request) {
+  enableFirestoreCacheTier();
+
   try {
     const { userId, action = 'check_in', taskTitle = null, userTasks = [], category = null, userProfile = null } = await request.json();
     
@@ -21,6 +26,14 @@ export async function POST(request: Request) {
       );
     }
 
+    const rateLimit = await getAiRateLimiter('ai-checkin').check(rateLimitId(request, userId));
+    if (!rateLimit.allowed) {
+      return NextResponse.json(
+        { error: 'Rate limit exceeded' },
+        { status: 429, headers: rateLimitHeaders(rateLimit) }
+      );
+    }
+
     // For morning check-in, use the new Grok-powered AI service
     if (action === 'check_in') {
       try {
@@ -36,7 +49,8 @@ export async function POST(request: Request) {
         
         // Use the new AI service with Grok
         const aiService = getAiService();
-        const aiResponse = await aiService.generateDailyMix(userData, existingTasks);
+        // A client that disconnects stops waiting on (and, if alone, cancels) the Grok call
+        const aiResponse = await aiService.generateDailyMix(userData, existingTasks, { signal: request.signal });
         
         if (aiResponse.data) {
           // Format response for the UI
@@ -142,6 +156,7 @@ export async function GET(request: Request) {
   return NextResponse.json({ 
     status: 'AI Mentor is running with Grok integration',
     timestamp: new Date().toISOString(),
-    grokEnabled: !!process.env.GROK_API_KEY
+    grokEnabled: !!process.env.GROK_API_KEY,
+    aiCache: getAiResponseCache().snapshot()
   });
 }
\ No newline at end of file
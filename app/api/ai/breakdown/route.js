@@ -1,5 +1,10 @@
 import { NextResponse } from 'next/server';
 import OpenAI from 'openai';
+import { getAiResponseCache } from '@/lib/ai/ResponseCache';
+import { enableFirestoreCacheTier } from '@/lib/ai/FirestoreCacheTier';
+import { getAiRateLimiter, rateLimitId, rateLimitHeaders } from '@/lib/rateLimit';
+
+const BREAKDOWN_MODEL = 'gpt-3.5-turbo';
 
 // Initialize OpenAI with the same API key used for transcription
 const openai = new OpenAI({
@@ -7,72 +12,48 @@ const openai = new OpenAI({
 });
 
 export async function POST(request) {
+  enableFirestoreCacheTier();
+
+  // Declared outside the try so the fallback below can still read it
+  let taskTitle = '';
+
   try {
-    const { taskTitle, context } = await request.json();
+    let context;
+    ({ taskTitle, context } = await request.json());
     
-    if (!taskTitle) {
+    if (typeof taskTitle !== 'string' || !taskTitle.trim()) {
       return NextResponse.json({ error: 'Task title is required' }, { status: 400 });
     }
 
-    const prompt = `Break down this task into 3-6 specific, actionable subtasks for a busy parent to complete. Focus on practical, concrete steps that can be done individually.
-
-Task: "${taskTitle}"
-${context ? `Context: ${context}` : ''}
+    const rateLimit = await getAiRateLimiter('ai-breakdown').check(rateLimitId(request));
+    if (!rateLimit.allowed) {
+      return NextResponse.json(
+        { error: 'Rate limit exceeded' },
+        { status: 429, headers: rateLimitHeaders(rateLimit) }
+      );
+    }
 
-Return ONLY a JSON array of subtask titles (strings), no other text or formatting. Each subtask should be a clear action someone can complete in 15-60 minutes.
+    const cacheInputs = {
+      model: BREAKDOWN_MODEL,
+      taskTitle: normalizeTitle(taskTitle),
+      context: context || null,
+      format: 'subtasks+parsed' // Older entries were bare arrays
+    };
+    // Double taps share one in-flight completion; request.signal releases a
+    // disconnected client without cancelling the call for the others
+    // Line-split guesses from an unparseable reply are served but not cached
+    const { subtasks } = await getAiResponseCache().wrap(
+      'taskBreakdown',
+      cacheInputs,
+      (signal) => generateSubtasks(taskTitle, context, signal),
+      { signal: request.signal, shouldCache: result => result.parsed }
+    );
 
-Example format: ["Step 1 description", "Step 2 description", "Step 3 description"]`;
-
-    const completion = await openai.chat.completions.create({
-      model: "gpt-3.5-turbo",
-      messages: [{ role: "user", content: prompt }],
-      max_tokens: 300,
-      temperature: 0.7,
+    return NextResponse.json({ 
+      subtasks,
+      originalTask: taskTitle 
     });
 
-    const responseText = completion.choices[0].message.content.trim();
-    
-    try {
-      // Parse the JSON response
-      const subtasks = JSON.parse(responseText);
-      
-      if (!Array.isArray(subtasks)) {
-        throw new Error('Response is not an array');
-      }
-
-      // Validate and clean the subtasks
-      const cleanedSubtasks = subtasks
-        .filter(task => typeof task === 'string' && task.length > 5)
-        .slice(0, 6) // Limit to 6 subtasks max
-        .map(task => task.trim());
-
-      if (cleanedSubtasks.length === 0) {
-        throw new Error('No valid subtasks generated');
-      }
-
-      return NextResponse.json({ 
-        subtasks: cleanedSubtasks,
-        originalTask: taskTitle 
-      });
-
-    } catch (parseError) {
-      console.error('Error parsing AI response:', parseError);
-      
-      // Fallback: try to extract task-like content from response
-      const lines = responseText.split('\n')
-        .filter(line => line.trim().length > 5)
-        .slice(0, 6);
-        
-      if (lines.length > 0) {
-        return NextResponse.json({ 
-          subtasks: lines.map(line => line.replace(/^[\d\.\-\*\s]+/, '').trim()),
-          originalTask: taskTitle 
-        });
-      } else {
-        throw new Error('Could not parse AI response');
-      }
-    }
-
   } catch (error) {
     console.error('AI breakdown error:', error);
     
@@ -87,6 +68,75 @@ Example format: ["Step 1 description", "Step 2 description", "Step 3 description
   }
 }
 
+// Titles differing only in case or spacing get the same breakdown
+function normalizeTitle(taskTitle) {
+  return taskTitle.trim().toLowerCase().replace(/\s+/g, ' ');
+}
+
+/**
+ * Ask the model for subtasks as `{ subtasks, parsed }`; `parsed` is false
+ * when the reply wasn't valid JSON and lines were salvaged instead. Throws
+ * when nothing usable comes back so the caller serves (and doesn't cache)
+ * the generic fallback
+ */
+async function generateSubtasks(taskTitle, context, signal) {
+  const prompt = `Break down this task into 3-6 specific, actionable subtasks for a busy parent to complete. Focus on practical, concrete steps that can be done individually.
+
+Task: "${taskTitle}"
+${context ? `Context: ${context}` : ''}
+
+Return ONLY a JSON array of subtask titles (strings), no other text or formatting. Each subtask should be a clear action someone can complete in 15-60 minutes.
+
+Example format: ["Step 1 description", "Step 2 description", "Step 3 description"]`;
+
+  const completion = await openai.chat.completions.create({
+    model: BREAKDOWN_MODEL,
+    messages: [{ role: "user", content: prompt }],
+    max_tokens: 300,
+    temperature: 0.7,
+  }, { signal });
+
+  const responseText = completion.choices[0].message.content.trim();
+  
+  try {
+    // Parse the JSON response
+    const subtasks = JSON.parse(responseText);
+    
+    if (!Array.isArray(subtasks)) {
+      throw new Error('Response is not an array');
+    }
+
+    // Validate and clean the subtasks
+    const cleanedSubtasks = subtasks
+      .filter(task => typeof task === 'string' && task.length > 5)
+      .slice(0, 6) // Limit to 6 subtasks max
+      .map(task => task.trim());
+
+    if (cleanedSubtasks.length === 0) {
+      throw new Error('No valid subtasks generated');
+    }
+
+    return { subtasks: cleanedSubtasks, parsed: true };
+
+  } catch (parseError) {
+    console.error('Error parsing AI response:', parseError);
+    
+    // Fallback: try to extract task-like content from response
+    const lines = responseText.split('\n')
+      .filter(line => line.trim().length > 5)
+      .slice(0, 6);
+      
+    if (lines.length > 0) {
+      return {
+        subtasks: lines.map(line => line.replace(/^[\d\.\-\*\s]+/, '').trim()),
+        parsed: false
+      };
+    } else {
+      throw new Error('Could not parse AI response');
+    }
+  }
+}
+
 function generateFallbackSubtasks(taskTitle) {
   const task = taskTitle.toLowerCase();
   
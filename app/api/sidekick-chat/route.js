@@ -1,130 +1,189 @@
 import { adminAuth as auth, adminDb as db } from '@/lib/firebase-admin';
-import { NextResponse } from 'next/server';
+import { NextResponse, after } from 'next/server';
+import { buildSidekickPrompt } from '@/lib/ai/SidekickPromptBuilder';
+import { FieldValue } from 'firebase-admin/firestore';
+import { getAiRateLimiter, rateLimitId, rateLimitHeaders } from '@/lib/rateLimit';
+import { CHAT_USAGE_COLLECTION, MONTHLY_CHAT_LIMITS, isUnlimitedTesting, monthlyChatLimit, monthlyUsageKey } from '@/lib/chatUsage';
 
 const GROK_API_URL = 'https://api.x.ai/v1/chat/completions';
 const GROK_API_KEY = process.env.GROK_API_KEY;
 
-// Rate limiting storage (in production, use Redis)
-const rateLimitStore = new Map();
+const FALLBACK_RESPONSE = "I'm having trouble connecting right now, but here's what I'd suggest: break this down into smaller steps, check YouTube for tutorials on this specific task, and don't hesitate to ask for help at your local hardware store. You've got this, dad!";
 
-function checkRateLimit(userId, tier) {
-  const key = `${userId}-${new Date().toISOString().slice(0, 7)}`; // monthly key
-  const current = rateLimitStore.get(key) || 0;
-  
-  const limits = {
-    free: 3,
-    premium: 100,
-    family: 150
-  };
-  
-  if (current >= limits[tier]) {
-    return false;
-  }
-  
-  rateLimitStore.set(key, current + 1);
-  return true;
-}
+const sseEncoder = new TextEncoder();
 
-function buildDadSidekickPrompt(task, userProfile, conversationHistory) {
-  const isProject = task.category === 'project' && task.subtasks;
-  
-  let taskContext;
-  if (isProject) {
-    const completedSubtasks = task.subtasks.filter(st => st.completed);
-    const pendingSubtasks = task.subtasks.filter(st => !st.completed);
-    
-    taskContext = `
-CURRENT PROJECT CONTEXT:
-- Project: "${task.title}"
-- Progress: ${completedSubtasks.length}/${task.subtasks.length} steps completed
-- Remaining steps: ${pendingSubtasks.map(st => st.title).join(', ')}
-- Completed steps: ${completedSubtasks.length > 0 ? completedSubtasks.map(st => st.title).join(', ') : 'None yet'}`;
-  } else {
-    taskContext = `
-CURRENT TASK CONTEXT:
-- Task: "${task.title}"
-- Detail: "${task.detail}" 
-- Category: ${task.category}`;
+/**
+ * Take one chat from the user's monthly quota (lib/chatUsage). The limit
+ * check and the increment share a transaction, so concurrent sends can't
+ * both take the last chat. Returns `reservation` for refundMonthlyChat.
+ */
+async function reserveMonthlyChat(userId, tier) {
+  const limit = monthlyChatLimit(tier);
+  if (!db) {
+    // Don't block the chat when metering isn't configured
+    return { allowed: true, used: null, limit, reservation: null };
   }
 
-  const contextPrompt = `You are a knowledgeable, supportive dad friend helping another modern father. Your name is "Sidekick" and you talk like a helpful neighbor dad who's been through this before.
-
-${taskContext}
-
-YOUR PERSONALITY:
-- Practical and encouraging
-- Slightly humorous but not cheesy
-- Assumes he's competent but needs guidance
-- Provides specific product recommendations with rough prices
-- Mentions YouTube channels or tutorials when relevant
-- Keeps responses conversational and under 150 words
-- Never condescending - treat him as an equal
+  const { monthKey, usageId } = monthlyUsageKey(userId);
+  const usageRef = db.collection(CHAT_USAGE_COLLECTION).doc(usageId);
+  try {
+    const { allowed, used } = await db.runTransaction(async (transaction) => {
+      const usageDoc = await transaction.get(usageRef);
+      const count = usageDoc.exists ? usageDoc.data().count || 0 : 0;
+      if (count >= limit && !isUnlimitedTesting()) return { allowed: false, used: count };
 
-RESPONSE GUIDELINES:
-- Start responses naturally (no "As a dad friend..." intros)
-- Include specific brands/products when helpful
-- Mention rough time estimates ("this usually takes about 30 minutes")
-- Suggest backup plans for common problems
-- Reference YouTube, Home Depot, Amazon when relevant
-- Keep it practical and actionable
-${isProject ? '- For projects, focus on the current step or offer advice on tackling remaining steps efficiently' : ''}
+      transaction.set(usageRef, {
+        userId,
+        monthKey,
+        count: count + 1,
+        lastUsed: FieldValue.serverTimestamp(),
+        ...(!usageDoc.exists && { createdAt: FieldValue.serverTimestamp() })
+      }, { merge: true });
+      return { allowed: true, used: count + 1 };
+    });
 
-USER CONTEXT:
-- Modern father trying to manage home, family, and personal responsibilities
-- Values efficiency and competence
-- Has limited time but wants to do things right
+    return { allowed, used, limit, reservation: allowed ? usageRef : null };
+  } catch (error) {
+    console.error('Error reserving chat usage:', error);
+    return { allowed: true, used: null, limit, reservation: null };
+  }
+}
 
-Conversation so far:
-${conversationHistory.map(msg => `${msg.role}: ${msg.content}`).join('\n')}
+// Give the chat back when no real answer was produced
+async function refundMonthlyChat(reservation) {
+  if (!reservation) return;
 
-Respond as the Dad Sidekick to help with this ${isProject ? 'project' : 'task'}. Be conversational, practical, and supportive.`;
+  try {
+    await reservation.update({ count: FieldValue.increment(-1) });
+  } catch (error) {
+    console.error('Error refunding chat usage:', error);
+  }
+}
 
-  return contextPrompt;
+function buildGrokRequest(messages, stream) {
+  return {
+    model: 'grok-4-0709',
+    messages,
+    temperature: 0.7,
+    max_tokens: 1000,
+    stream
+  };
 }
 
-async function callGrokAPI(prompt, message) {
+async function fetchGrok(requestBody) {
   if (!GROK_API_KEY) {
     throw new Error('GROK API key not configured');
   }
 
-  const requestBody = {
-    model: 'grok-4-0709',
-    messages: [
-      { role: 'system', content: prompt },
-      { role: 'user', content: message }
-    ],
-    temperature: 0.7,
-    max_tokens: 1000,
-    stream: false
-  };
+  const response = await fetch(GROK_API_URL, {
+    method: 'POST',
+    headers: {
+      'Authorization': `Bearer ${GROK_API_KEY}`,
+      'Content-Type': 'application/json'
+    },
+    body: JSON.stringify(requestBody)
+  });
 
-  try {
-    const response = await fetch(GROK_API_URL, {
-      method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${GROK_API_KEY}`,
-        'Content-Type': 'application/json'
-      },
-      body: JSON.stringify(requestBody)
-    });
+  if (!response.ok) {
+    const errorText = await response.text();
+    throw new Error(`GROK API error (${response.status}): ${errorText}`);
+  }
 
-    if (!response.ok) {
-      const errorText = await response.text();
-      throw new Error(`GROK API error (${response.status}): ${errorText}`);
-    }
+  return response;
+}
 
-    const data = await response.json();
-    
-    if (!data.choices || !data.choices[0] || !data.choices[0].message) {
-      throw new Error(`Unexpected API response structure: ${JSON.stringify(data)}`);
-    }
-    
-    const content = data.choices[0].message.content;
-    return content || 'Sorry, I couldn\'t generate a response right now.';
-    
-  } catch (fetchError) {
-    throw fetchError;
+async function callGrokAPI(messages) {
+  const response = await fetchGrok(buildGrokRequest(messages, false));
+  const data = await response.json();
+  
+  if (!data.choices || !data.choices[0] || !data.choices[0].message) {
+    throw new Error(`Unexpected API response structure: ${JSON.stringify(data)}`);
   }
+  
+  const content = data.choices[0].message.content;
+  return content || 'Sorry, I couldn\'t generate a response right now.';
+}
+
+function sseEvent(event, data) {
+  return sseEncoder.encode(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+}
+
+/**
+ * Re-emit Grok's OpenAI-style stream as `token` events, then one `done` (or
+ * `error`) event carrying `donePayload`. `onComplete` receives the full text
+ * once the stream ends.
+ */
+function streamGrokTokens(upstream, donePayload, onComplete) {
+  const reader = upstream.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let fullText = '';
+  // Set once the client cancels; the controller throws on use after that
+  let cancelled = false;
+
+  return new ReadableStream({
+    async start(controller) {
+      const send = (chunk) => {
+        if (cancelled) return;
+        try {
+          controller.enqueue(chunk);
+        } catch (enqueueError) {
+          cancelled = true;
+        }
+      };
+
+      try {
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+
+          buffer += decoder.decode(value, { stream: true });
+          const lines = buffer.split('\n');
+          buffer = lines.pop();
+
+          for (const line of lines) {
+            const trimmed = line.trim();
+            if (!trimmed.startsWith('data:')) continue;
+
+            const payload = trimmed.slice(5).trim();
+            if (payload === '[DONE]') continue;
+
+            let delta;
+            try {
+              delta = JSON.parse(payload).choices?.[0]?.delta?.content;
+            } catch (parseError) {
+              continue; // keep-alive or partial frame
+            }
+            if (delta) {
+              fullText += delta;
+              send(sseEvent('token', { delta }));
+            }
+          }
+        }
+        send(sseEvent('done', { success: true, ...donePayload }));
+      } catch (error) {
+        // A cancelled read is the client leaving, not an upstream failure
+        if (!cancelled) {
+          console.error('Sidekick stream error:', error.message);
+          send(sseEvent('error', { error: 'Stream interrupted', fallback: FALLBACK_RESPONSE }));
+        }
+      } finally {
+        onComplete(fullText);
+        if (!cancelled) {
+          try {
+            controller.close();
+          } catch (closeError) {
+            // Cancelled between the last send and here
+          }
+        }
+      }
+    },
+    cancel(reason) {
+      // Client went away - stop generating upstream
+      cancelled = true;
+      return reader.cancel(reason);
+    }
+  });
 }
 
 async function logChatInteraction(userId, taskId, userMessage, assistantResponse) {
@@ -148,8 +207,11 @@ async function logChatInteraction(userId, taskId, userMessage, assistantResponse
 }
 
 export async function POST(request) {
+  // Held outside the try so the fallback below can refund it
+  let reservation = null;
+
   try {
-    const { task, message, conversationHistory, userProfile } = await request.json();
+    const { task, message, conversationHistory, historySummary, userProfile, stream = false } = await request.json();
 
     console.log('📨 Sidekick chat request received');
     console.log('Task:', task);
@@ -164,38 +226,85 @@ export async function POST(request) {
       );
     }
 
-    // Check rate limit
-    const userTier = userProfile.tier || 'free';
-    if (!checkRateLimit(userProfile.id, userTier)) {
+    // Burst limit first, then the monthly tier quota
+    const callerId = rateLimitId(request, userProfile.id);
+    const burst = await getAiRateLimiter('sidekick-chat').check(callerId);
+    if (!burst.allowed) {
+      return NextResponse.json(
+        { error: 'Too many messages - give it a few seconds' },
+        { status: 429, headers: rateLimitHeaders(burst) }
+      );
+    }
+
+    const userTier = MONTHLY_CHAT_LIMITS[userProfile.tier] ? userProfile.tier : 'free';
+    const quota = await reserveMonthlyChat(userProfile.id, userTier);
+    if (!quota.allowed) {
       return NextResponse.json(
         { 
           error: 'Rate limit exceeded',
-          suggestion: 'Upgrade to Pro for unlimited chat'
+          suggestion: 'Upgrade to Pro for unlimited chat',
+          usage: { used: quota.used, limit: quota.limit }
         },
         { status: 429 }
       );
     }
+    reservation = quota.reservation;
+    const usage = { used: quota.used, limit: quota.limit };
+
+    // Build the dad-specific prompt: cached persona prefix, rolling summary of
+    // older turns, recent turns verbatim
+    const { messages, summary, estimatedTokens } = buildSidekickPrompt({
+      task,
+      conversationHistory: conversationHistory || [],
+      message,
+      previousSummary: historySummary
+    });
+    console.log(`🧮 Sidekick prompt: ~${estimatedTokens} tokens, ${summary.count} turns summarized`);
 
-    // Build the dad-specific prompt
-    const prompt = buildDadSidekickPrompt(task, userProfile, conversationHistory || []);
+    if (stream) {
+      const upstream = await fetchGrok(buildGrokRequest(messages, true));
+
+      let streamedText = '';
+      const body = streamGrokTokens(upstream.body, { summary, usage }, (text) => {
+        streamedText = text;
+      });
+
+      // Runs once the stream has been fully sent; an empty reply is refunded
+      after(() => streamedText
+        ? logChatInteraction(userProfile.id, task.id, message, streamedText)
+        : refundMonthlyChat(reservation));
+
+      return new Response(body, {
+        headers: {
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache, no-transform',
+          'Connection': 'keep-alive'
+        }
+      });
+    }
 
     // Call GROK API
-    const grokResponse = await callGrokAPI(prompt, message);
+    const grokResponse = await callGrokAPI(messages);
     
     // DEBUG: Log what we got back
     console.log('🔄 Grok response received:', grokResponse);
 
-    // Log the interaction for analytics
-    await logChatInteraction(userProfile.id, task.id, message, grokResponse);
+    // Log the interaction for analytics once the response is sent
+    after(() => logChatInteraction(userProfile.id, task.id, message, grokResponse));
 
     return NextResponse.json({ 
       success: true, 
-      response: grokResponse 
+      response: grokResponse,
+      summary,
+      usage
     });
 
   } catch (error) {
     console.error('Sidekick chat error:', error.message);
     console.error('Full error details:', error);
+
+    // No real answer, so the chat doesn't count
+    await refundMonthlyChat(reservation);
     
     // Include debug information in development
     const isDevelopment = process.env.NODE_ENV === 'development';
@@ -215,11 +324,9 @@ export async function POST(request) {
     }
     
     // Provide fallback response for production
-    const fallbackResponse = "I'm having trouble connecting right now, but here's what I'd suggest: break this down into smaller steps, check YouTube for tutorials on this specific task, and don't hesitate to ask for help at your local hardware store. You've got this, dad!";
-    
     return NextResponse.json({ 
       success: true, 
-      response: fallbackResponse,
+      response: FALLBACK_RESPONSE,
       fallback: true
     });
   }
@@ -1,57 +1,144 @@
 import { NextResponse } from 'next/server';
 import { OpenAI } from 'openai';
+import { getAiRateLimiter, rateLimitId, rateLimitHeaders } from '@/lib/rateLimit';
 
 // Initialize OpenAI client with server-side API key
 const openai = new OpenAI({
   apiKey: process.env.OPENAI_API_KEY,
 });
 
-export async function POST(request) {
-  try {
-    // Check if request is multipart form-data
-    if (!request.headers.get('content-type')?.includes('multipart/form-data')) {
-      return NextResponse.json(
-        { error: 'Request must be multipart/form-data' },
-        { status: 400 }
-      );
+const VALID_TYPES = ['audio/webm', 'audio/mp3', 'audio/wav', 'audio/mpeg', 'audio/ogg'];
+const MAX_SIZE = 10 * 1024 * 1024; // 10MB
+
+// Whisper picks the decoder from the file extension
+const EXTENSIONS = {
+  'audio/webm': 'webm',
+  'audio/mp3': 'mp3',
+  'audio/wav': 'wav',
+  'audio/mpeg': 'mp3',
+  'audio/ogg': 'ogg'
+};
+
+function invalidTypeResponse(type) {
+  return NextResponse.json(
+    { error: `Invalid file type: ${type}. Supported types: ${VALID_TYPES.join(', ')}` },
+    { status: 400 }
+  );
+}
+
+function tooLargeResponse() {
+  return NextResponse.json(
+    { error: 'File size exceeds 10MB limit' },
+    { status: 400 }
+  );
+}
+
+/**
+ * Read a raw audio body as it arrives. The chunks become the parts of the
+ * File handed to OpenAI, so nothing is concatenated into one big buffer, and
+ * an oversized upload is cut off as soon as it passes the limit.
+ */
+async function readAudioBody(body, maxSize) {
+  const reader = body.getReader();
+  const parts = [];
+  let size = 0;
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    size += value.byteLength;
+    if (size > maxSize) {
+      await reader.cancel();
+      return null;
     }
+    parts.push(value);
+  }
 
-    // Parse the form data
-    const formData = await request.formData();
-    const audioFile = formData.get('file');
+  return parts;
+}
 
-    // Validate file exists
-    if (!audioFile) {
+/**
+ * Accepts either a raw audio body (Content-Type: audio/*), used by the
+ * streaming recorder for each segment, or multipart form-data with a `file`
+ * field. `?prompt=` carries the transcript so far for continuity.
+ */
+export async function POST(request) {
+  try {
+    const contentType = request.headers.get('content-type') || '';
+    const isRawAudio = contentType.startsWith('audio/');
+
+    // Check request format
+    if (!isRawAudio && !contentType.includes('multipart/form-data')) {
       return NextResponse.json(
-        { error: 'No audio file provided' },
+        { error: 'Request must be multipart/form-data or an audio body' },
         { status: 400 }
       );
     }
 
-    // Validate file type
-    const validTypes = ['audio/webm', 'audio/mp3', 'audio/wav', 'audio/mpeg', 'audio/ogg'];
-    if (!validTypes.includes(audioFile.type)) {
+    const rateLimit = await getAiRateLimiter('transcribe').check(rateLimitId(request));
+    if (!rateLimit.allowed) {
       return NextResponse.json(
-        { error: `Invalid file type: ${audioFile.type}. Supported types: ${validTypes.join(', ')}` },
-        { status: 400 }
+        { error: 'Rate limit exceeded' },
+        { status: 429, headers: rateLimitHeaders(rateLimit) }
       );
     }
 
-    // Validate file size (10MB max)
-    const maxSize = 10 * 1024 * 1024; // 10MB
-    if (audioFile.size > maxSize) {
-      return NextResponse.json(
-        { error: 'File size exceeds 10MB limit' },
-        { status: 400 }
-      );
+    let fileForOpenAI;
+
+    if (isRawAudio) {
+      // e.g. 'audio/webm;codecs=opus'
+      const type = contentType.split(';')[0].trim();
+      if (!VALID_TYPES.includes(type)) {
+        return invalidTypeResponse(type);
+      }
+
+      if (Number(request.headers.get('content-length') || 0) > MAX_SIZE) {
+        return tooLargeResponse();
+      }
+
+      const parts = request.body ? await readAudioBody(request.body, MAX_SIZE) : [];
+      if (!parts) {
+        return tooLargeResponse();
+      }
+      if (parts.length === 0) {
+        return NextResponse.json(
+          { error: 'No audio file provided' },
+          { status: 400 }
+        );
+      }
+
+      fileForOpenAI = new File(parts, `segment.${EXTENSIONS[type]}`, { type });
+    } else {
+      // Parse the form data
+      const formData = await request.formData();
+      const audioFile = formData.get('file');
+
+      // Validate file exists
+      if (!audioFile) {
+        return NextResponse.json(
+          { error: 'No audio file provided' },
+          { status: 400 }
+        );
+      }
+
+      // Validate file type
+      if (!VALID_TYPES.includes(audioFile.type)) {
+        return invalidTypeResponse(audioFile.type);
+      }
+
+      // Validate file size (10MB max)
+      if (audioFile.size > MAX_SIZE) {
+        return tooLargeResponse();
+      }
+
+      // Re-wrap the upload as a File the OpenAI SDK accepts; the Blob is
+      // referenced as a part rather than copied out with arrayBuffer()
+      fileForOpenAI = new File([audioFile], audioFile.name || 'recording.webm', {
+        type: audioFile.type,
+      });
     }
 
-    // Create a proper File object from the incoming Blob that the OpenAI SDK accepts
-    const arrayBuf = await audioFile.arrayBuffer();
-    const uint8Arr = new Uint8Array(arrayBuf);
-    const fileForOpenAI = new File([uint8Arr], audioFile.name || 'recording.webm', {
-      type: audioFile.type,
-    });
+    const prompt = new URL(request.url).searchParams.get('prompt');
 
     // Sending audio to OpenAI for transcription
 
@@ -60,7 +147,8 @@ export async function POST(request) {
       file: fileForOpenAI,
       model: 'whisper-1',
       language: 'en',
-    });
+      ...(prompt ? { prompt: prompt.slice(-500) } : {}),
+    }, { signal: request.signal });
 
     // Return the transcription
     return NextResponse.json({ 
@@ -265,6 +265,8 @@ export default function DashboardClient() {
       const newRecurringTask = {
         ...recurringTask,
         userId: user.uid,
+        // Lets the server-side materializer create instances on the user's local date
+        timezone: Intl.DateTimeFormat().resolvedOptions().timeZone,
         createdAt: Timestamp.now(),
         isActive: true
       };
@@ -9,8 +9,8 @@ import {
   ArrowUpIcon,
   ArrowDownIcon
 } from '@heroicons/react/24/outline';
-import { collection, query, where, getDocs, Timestamp } from 'firebase/firestore';
 import { db } from '@/lib/firebase';
+import { createStatsService } from '@/lib/services/StatsService';
 import { UserId } from '@/types/models';
 import { BaseProps } from '@/types/components';
 
@@ -24,6 +24,7 @@ interface DashboardStats {
   completionRate: number;
   weeklyTasks: number[]; // Sun-Sat
   trend: 'up' | 'down' | 'stable';
+  streak: number;
 }
 
 const DashboardStatsComponent: React.FC<DashboardStatsProps> = ({ 
@@ -35,7 +36,8 @@ const DashboardStatsComponent: React.FC<DashboardStatsProps> = ({
     tasksCompletedToday: 0,
     completionRate: 0,
     weeklyTasks: [0, 0, 0, 0, 0, 0, 0], // Sun-Sat
-    trend: 'stable'
+    trend: 'stable',
+    streak: 0
   });
   const [loading, setLoading] = useState<boolean>(true);
 
@@ -46,63 +48,19 @@ const DashboardStatsComponent: React.FC<DashboardStatsProps> = ({
       try {
         setLoading(true);
         
-        // Get today's date at midnight
         const today = new Date();
-        today.setHours(0, 0, 0, 0);
-        const startOfToday = Timestamp.fromDate(today);
-        
-        // Get start of week (Sunday)
-        const startOfWeek = new Date(today);
-        startOfWeek.setDate(today.getDate() - today.getDay());
-        const startOfWeekTimestamp = Timestamp.fromDate(startOfWeek);
-        
-        // Query for today's completed tasks
-        const todayCompletedQuery = query(
-          collection(db, 'tasks'),
-          where('userId', '==', userId),
-          where('completedAt', '>=', startOfToday)
-        );
-        
-        // Query for all tasks created today
-        const todayCreatedQuery = query(
-          collection(db, 'tasks'),
-          where('userId', '==', userId),
-          where('createdAt', '>=', startOfToday)
-        );
-        
-        // Query for this week's tasks
-        const weeklyTasksQuery = query(
-          collection(db, 'tasks'),
-          where('userId', '==', userId),
-          where('createdAt', '>=', startOfWeekTimestamp)
-        );
-        
-        // Execute queries
-        const [todayCompletedSnapshot, todayCreatedSnapshot, weeklyTasksSnapshot] = await Promise.all([
-          getDocs(todayCompletedQuery),
-          getDocs(todayCreatedQuery),
-          getDocs(weeklyTasksQuery)
-        ]);
+        const {
+          tasksCompletedToday,
+          tasksCreatedToday: totalTasksToday,
+          weeklyCompletions: weeklyDistribution,
+          streak
+        } = await createStatsService(db).getDashboardCounts(userId, today);
         
         // Calculate completion rate
-        const tasksCompletedToday = todayCompletedSnapshot.size;
-        const totalTasksToday = todayCreatedSnapshot.size;
         const completionRate = totalTasksToday > 0 
           ? Math.round((tasksCompletedToday / totalTasksToday) * 100) 
           : 0;
         
-        // Calculate weekly distribution
-        const weeklyDistribution: number[] = [0, 0, 0, 0, 0, 0, 0]; // Sun-Sat
-        
-        weeklyTasksSnapshot.forEach(doc => {
-          const data = doc.data();
-          if (data.completedAt) {
-            const completedDate = data.completedAt.toDate();
-            const dayOfWeek = completedDate.getDay();
-            weeklyDistribution[dayOfWeek]++;
-          }
-        });
-        
         // Calculate trend (comparing today with yesterday)
         const yesterday = new Date(today);
         yesterday.setDate(yesterday.getDate() - 1);
@@ -116,7 +74,8 @@ const DashboardStatsComponent: React.FC<DashboardStatsProps> = ({
           tasksCompletedToday,
           completionRate,
           weeklyTasks: weeklyDistribution,
-          trend
+          trend,
+          streak
         });
         
         setLoading(false);
@@ -193,7 +152,7 @@ const DashboardStatsComponent: React.FC<DashboardStatsProps> = ({
             <FireIcon className="w-5 h-5 text-orange-500" />
           </div>
           <div className="mt-2">
-            <span className="text-2xl font-bold text-orange-700">{streakCount || 0}</span>
+            <span className="text-2xl font-bold text-orange-700">{streakCount ?? stats.streak}</span>
             <span className="text-sm text-orange-500 ml-1">days</span>
           </div>
         </div>
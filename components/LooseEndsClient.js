@@ -13,6 +13,7 @@ import {
   doc
 } from 'firebase/firestore';
 import { auth, db } from '@/lib/firebase';
+import { createTaskService } from '@/lib/services/TaskService';
 
 export default function LooseEndsClient() {
   const [user, loading] = useAuthState(auth);
@@ -110,8 +111,8 @@ export default function LooseEndsClient() {
   }
 
   const markTaskDone = async (taskId) => {
-    const taskRef = doc(db, 'tasks', taskId);
-    await updateDoc(taskRef, { completedAt: Timestamp.now() });
+    // Through TaskService so the completion lands in the daily rollup
+    await createTaskService(db).completeTask(taskId);
     setManualTasks((prev) => prev.filter((t) => t.id !== taskId));
   };
 
@@ -8,8 +8,8 @@ import {
   SparklesIcon,
   LightBulbIcon
 } from '@heroicons/react/24/outline';
-import { collection, query, where, getDocs, Timestamp } from 'firebase/firestore';
 import { db } from '@/lib/firebase';
+import { createStatsService } from '@/lib/services/StatsService';
 import { UserId } from '@/types/models';
 import { BaseProps } from '@/types/components';
 
@@ -52,57 +52,16 @@ const QuickOverview: React.FC<QuickOverviewProps> = ({
       try {
         setLoading(true);
         
-        // Get today's date at midnight
-        const today = new Date();
-        today.setHours(0, 0, 0, 0);
-        const startOfToday = Timestamp.fromDate(today);
+        const { createdToday, completedToday, upcoming } = await createStatsService(db).getOverviewCounts(userId);
         
-        // Get next 7 days for upcoming deadlines
-        const nextWeek = new Date(today);
-        nextWeek.setDate(today.getDate() + 7);
-        const nextWeekTimestamp = Timestamp.fromDate(nextWeek);
-        
-        // Query for today's tasks
-        const todayTasksQuery = query(
-          collection(db, 'tasks'),
-          where('userId', '==', userId),
-          where('createdAt', '>=', startOfToday)
-        );
-        
-        // Query for upcoming deadlines
-        const upcomingDeadlinesQuery = query(
-          collection(db, 'tasks'),
-          where('userId', '==', userId),
-          where('createdAt', '>=', startOfToday),
-          where('createdAt', '<=', nextWeekTimestamp)
-        );
-        
-        // Execute queries
-        const [todayTasksSnapshot, upcomingDeadlinesSnapshot] = await Promise.all([
-          getDocs(todayTasksQuery),
-          getDocs(upcomingDeadlinesQuery)
-        ]);
-        
-        // Process today's tasks
-        const todayTasks = todayTasksSnapshot.docs.map(doc => ({ 
-          ...doc.data(), 
-          id: doc.id 
-        })) as any[];
-        const completedTasks = todayTasks.filter((task: any) => task.completedAt).length;
-        const remainingTasks = todayTasks.length - completedTasks;
-        const completionPercentage = todayTasks.length > 0 
-          ? Math.round((completedTasks / todayTasks.length) * 100) 
+        const completedTasks = completedToday;
+        const remainingTasks = Math.max(createdToday - completedToday, 0);
+        const completionPercentage = createdToday > 0 
+          ? Math.round((completedTasks / createdToday) * 100) 
           : 0;
         
-        // Process upcoming deadlines
-        const deadlines: UpcomingDeadline[] = upcomingDeadlinesSnapshot.docs
-          .map(doc => ({ 
-            ...doc.data(), 
-            id: doc.id 
-          } as any))
-          .filter((task: any) => !task.completedAt)
-          .sort((a, b) => a.createdAt.toDate() - b.createdAt.toDate())
-          .slice(0, 3); // Get top 3 upcoming deadlines
+        // Already the oldest open tasks, in order
+        const deadlines: UpcomingDeadline[] = upcoming;
         
         // Generate motivational message based on completion percentage
         const motivationalMessage = getMotivationalMessage(completionPercentage, remainingTasks);
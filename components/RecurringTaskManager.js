@@ -1,6 +1,6 @@
 'use client';
 
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { PlusIcon, XMarkIcon, CalendarIcon } from '@heroicons/react/24/outline';
 import { 
   RECURRENCE_TYPES, 
@@ -8,7 +8,7 @@ import {
   DAY_NAMES, 
   DAY_ABBREVIATIONS,
   getRecurrenceDescription,
-  SAMPLE_RECURRING_TASKS 
+  loadSampleRecurringTasks
 } from '@/lib/recurringTasks';
 
 export default function RecurringTaskManager({ onSave, onClose }) {
@@ -23,6 +23,17 @@ export default function RecurringTaskManager({ onSave, onClose }) {
   });
 
   const [showSamples, setShowSamples] = useState(true);
+  const [sampleTasks, setSampleTasks] = useState({});
+
+  // Templates live in their own chunk; fetch them while the form is showing them
+  useEffect(() => {
+    if (!showSamples) return;
+    let cancelled = false;
+    loadSampleRecurringTasks()
+      .then(samples => { if (!cancelled) setSampleTasks(samples); })
+      .catch(error => console.error('Error loading recurring templates:', error));
+    return () => { cancelled = true; };
+  }, [showSamples]);
 
   const handleSave = () => {
     if (!task.title.trim()) return;
@@ -73,7 +84,7 @@ export default function RecurringTaskManager({ onSave, onClose }) {
             <div className="mb-6 p-4 bg-blue-50 rounded-lg">
               <h3 className="font-semibold text-blue-800 mb-2">Quick Start Templates</h3>
               <div className="space-y-2">
-                {Object.entries(SAMPLE_RECURRING_TASKS).map(([category, tasks]) => (
+                {Object.entries(sampleTasks).map(([category, tasks]) => (
                   <div key={category}>
                     <h4 className="text-sm font-medium text-blue-700 capitalize mb-1">{category}</h4>
                     <div className="grid grid-cols-1 gap-1">
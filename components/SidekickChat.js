@@ -3,20 +3,66 @@
 import { useState, useRef, useEffect, useCallback } from 'react';
 import { useAuthState } from 'react-firebase-hooks/auth';
 import { auth } from '@/lib/firebase';
-import { canUseChat, incrementChatUsage } from '@/lib/subscription';
+import { canUseChat, recordChatUsage } from '@/lib/subscription';
 
-export default function SidekickChat({ task, isVisible, onClose, userTier = 'free', onUpgradeRequest }) {
+/**
+ * Read the sidekick SSE stream, calling onText with the reply so far after
+ * every token. Resolves with the full text and the done/error event payloads.
+ */
+async function readChatStream(response, onText) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let text = '';
+  let done = null;
+  let error = null;
+
+  for (;;) {
+    const { done: streamDone, value } = await reader.read();
+    if (streamDone) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const events = buffer.split('\n\n');
+    buffer = events.pop();
+
+    for (const rawEvent of events) {
+      const lines = rawEvent.split('\n');
+      const event = lines.find(line => line.startsWith('event:'))?.slice(6).trim();
+      const data = lines.find(line => line.startsWith('data:'))?.slice(5).trim();
+      if (!data) continue;
+
+      const payload = JSON.parse(data);
+      if (event === 'token') {
+        text += payload.delta;
+        onText(text);
+      } else if (event === 'done') {
+        done = payload;
+      } else if (event === 'error') {
+        error = payload;
+      }
+    }
+  }
+
+  return { text, done, error };
+}
+
+export default function SidekickChat({ task, isVisible, onClose, userTier, onUpgradeRequest }) {
   const [user] = useAuthState(auth);
   const [messages, setMessages] = useState([]);
   const [inputMessage, setInputMessage] = useState('');
   const [isLoading, setIsLoading] = useState(false);
+  const [streamingReply, setStreamingReply] = useState(null);
+  // Rolling summary of older turns, returned by the server with each reply
+  const [historySummary, setHistorySummary] = useState(null);
   const [usageInfo, setUsageInfo] = useState({ allowed: true, remaining: 'unlimited' });
   const messagesEndRef = useRef(null);
+  // Without a userTier prop the tier is looked up once per session
+  const tier = userTier || usageInfo.tier || 'free';
 
-  // Scroll to bottom when messages change
+  // Scroll to bottom when messages change or a reply streams in
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
-  }, [messages]);
+  }, [messages, streamingReply]);
 
   // Initialize with task context when visible
   useEffect(() => {
@@ -50,10 +96,19 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
   const sendMessage = async () => {
     if (!inputMessage.trim() || isLoading || !usageInfo.allowed) return;
 
+    setIsLoading(true);
+
+    // Display-side check; the route meters the chat and refunds failures
+    const usage = await canUseChat(user.uid, userTier);
+    setUsageInfo(usage);
+    if (!usage.allowed) {
+      setIsLoading(false);
+      return;
+    }
+
     const userMessage = { role: 'user', content: inputMessage };
     setMessages(prev => [...prev, userMessage]);
     setInputMessage('');
-    setIsLoading(true);
 
     try {
       console.log('🚀 Sending chat request to /api/sidekick-chat');
@@ -67,7 +122,7 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
         message: inputMessage,
         userProfile: {
           id: user?.uid,
-          tier: userTier
+          tier: usage.tier
         }
       });
       
@@ -83,17 +138,35 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
           },
           message: inputMessage,
           conversationHistory: messages,
+          historySummary,
           userProfile: {
             id: user?.uid,
-            tier: userTier
-          }
+            tier: usage.tier
+          },
+          stream: true
         })
       });
 
       console.log('📡 Response status:', response.status);
       console.log('📡 Response ok:', response.ok);
       
-      const data = await response.json();
+      // Errors, rate limits and fallbacks still come back as plain JSON
+      let data;
+      if (response.headers.get('Content-Type')?.includes('text/event-stream')) {
+        const { text, done, error } = await readChatStream(response, setStreamingReply);
+        setStreamingReply(null);
+        data = text
+          ? { success: true, response: text, summary: done?.summary, usage: done?.usage }
+          : { success: false, error: error?.error || 'Empty response' };
+      } else {
+        data = await response.json();
+      }
+
+      if (response.status === 429 && data.usage) {
+        // Out of chats for the month on the server's count
+        recordChatUsage(user.uid, data.usage.used);
+        setUsageInfo(await canUseChat(user.uid, usage.tier));
+      }
       console.log('📦 Response data:', data);
       
       if (data.debugInfo) {
@@ -103,16 +176,10 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
       if (data.success) {
         const assistantMessage = { role: 'assistant', content: data.response };
         setMessages(prev => [...prev, assistantMessage]);
-        
-        // Increment usage and refresh limits
-        await incrementChatUsage(user.uid);
-        
-        // Refresh usage limits
-        try {
-          const usage = await canUseChat(user.uid, userTier);
-          setUsageInfo(usage);
-        } catch (error) {
-          console.error('Error refreshing usage limits:', error);
+        if (data.summary) setHistorySummary(data.summary);
+        if (!data.fallback) {
+          recordChatUsage(user.uid, data.usage?.used);
+          setUsageInfo(await canUseChat(user.uid, usage.tier));
         }
       } else {
         throw new Error(data.error || 'Something went wrong');
@@ -125,6 +192,7 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
       };
       setMessages(prev => [...prev, errorMessage]);
     } finally {
+      setStreamingReply(null);
       setIsLoading(false);
     }
   };
@@ -155,7 +223,7 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
           <div className="text-sm text-blue-600">
             💡 {task.title} - {task.detail}
           </div>
-          {userTier === 'free' && (
+          {tier === 'free' && (
             <div className="text-xs text-orange-600 mt-1">
               {usageInfo.remaining} free chats remaining this month
             </div>
@@ -181,7 +249,15 @@ export default function SidekickChat({ task, isVisible, onClose, userTier = 'fre
             </div>
           ))}
           
-          {isLoading && (
+          {streamingReply && (
+            <div className="flex justify-start">
+              <div className="max-w-[85%] p-3 rounded-lg text-sm bg-gray-100 text-gray-800 rounded-bl-sm">
+                {streamingReply}
+              </div>
+            </div>
+          )}
+          
+          {isLoading && !streamingReply && (
             <div className="flex justify-start">
               <div className="bg-gray-100 p-3 rounded-lg rounded-bl-sm">
                 <div className="flex space-x-1">
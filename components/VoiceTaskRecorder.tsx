@@ -4,6 +4,7 @@ import { useState, useRef, useEffect, RefObject } from 'react';
 import { MicrophoneIcon, StopIcon, XMarkIcon, CheckIcon } from '@heroicons/react/24/solid';
 import { trackFeatureUsage, FEATURES } from '@/lib/featureDiscovery';
 import { TaskCategory, TaskPriority, TaskSource, Task } from '@/types/models';
+import { StreamingTranscriber, VOICE_SEGMENT_MS } from '@/lib/voiceTranscription';
 
 interface ExtractedTask {
   title: string;
@@ -13,6 +14,9 @@ interface ExtractedTask {
   priority?: TaskPriority;
 }
 
+// Shorter trailing segments are dropped; Whisper rejects near-empty audio
+const MIN_SEGMENT_SEC = 0.5;
+
 interface NewTaskData {
   title: string;
   description?: string;
@@ -51,8 +55,8 @@ export default function VoiceTaskRecorder({
   const [isPreparing, setIsPreparing] = useState<boolean>(false);
   const [isTranscribing, setIsTranscribing] = useState<boolean>(false);
   const [isProcessing, setIsProcessing] = useState<boolean>(false);
-  const [audioBlob, setAudioBlob] = useState<Blob | null>(null);
   const [transcript, setTranscript] = useState<string>('');
+  const [partialTranscript, setPartialTranscript] = useState<string>('');
   const [extractedTasks, setExtractedTasks] = useState<ExtractedTask[]>([]);
   const [error, setError] = useState<string | null>(null);
   const [permissionDenied, setPermissionDenied] = useState<boolean>(false);
@@ -62,7 +66,10 @@ export default function VoiceTaskRecorder({
   // Refs
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
-  const audioChunksRef = useRef<Blob[]>([]);
+  const audioChunksRef = useRef<Blob[]>([]); // current segment only
+  const transcriberRef = useRef<StreamingTranscriber | null>(null);
+  const segmentTimerRef = useRef<NodeJS.Timeout | null>(null);
+  const segmentStartRef = useRef<number | null>(null);
   const timerRef = useRef<NodeJS.Timeout | null>(null);
   const startTimeRef = useRef<number | null>(null); // tracks actual recording start
   const analyserRef = useRef<AnalyserNode | null>(null);
@@ -75,8 +82,8 @@ export default function VoiceTaskRecorder({
     setIsPreparing(false);
     setIsTranscribing(false);
     setIsProcessing(false);
-    setAudioBlob(null);
     setTranscript('');
+    setPartialTranscript('');
     setError(null);
     setRecordingTime(0);
     setAudioLevel(0);
@@ -86,12 +93,23 @@ export default function VoiceTaskRecorder({
     // Clear refs
     audioChunksRef.current = [];
     
+    // Drop any segments still uploading
+    if (transcriberRef.current) {
+      transcriberRef.current.abort();
+      transcriberRef.current = null;
+    }
+    
     // Stop any ongoing processes
     if (timerRef.current) {
       clearInterval(timerRef.current);
       timerRef.current = null;
     }
     
+    if (segmentTimerRef.current) {
+      clearInterval(segmentTimerRef.current);
+      segmentTimerRef.current = null;
+    }
+    
     if (animationFrameRef.current) {
       cancelAnimationFrame(animationFrameRef.current);
       animationFrameRef.current = null;
@@ -111,7 +129,10 @@ export default function VoiceTaskRecorder({
   useEffect(() => {
     return () => {
       if (timerRef.current) clearInterval(timerRef.current);
+      if (segmentTimerRef.current) clearInterval(segmentTimerRef.current);
       if (animationFrameRef.current) cancelAnimationFrame(animationFrameRef.current);
+      transcriberRef.current?.abort();
+      transcriberRef.current = null;
       if (mediaRecorderRef.current && mediaRecorderRef.current.state !== 'inactive') {
         mediaRecorderRef.current.stop();
       }
@@ -121,6 +142,84 @@ export default function VoiceTaskRecorder({
     };
   }, []);
 
+  // Record one segment. Each MediaRecorder produces a complete webm file, so
+  // every segment can be transcribed on its own while recording continues.
+  const startSegment = (stream: MediaStream, transcriber: StreamingTranscriber): void => {
+    const mediaRecorder = new MediaRecorder(stream, {
+      mimeType: 'audio/webm;codecs=opus'
+    });
+    const chunks: Blob[] = [];
+    const segmentStart = Date.now();
+    mediaRecorderRef.current = mediaRecorder;
+    audioChunksRef.current = chunks;
+    segmentStartRef.current = segmentStart;
+    
+    mediaRecorder.ondataavailable = (event: BlobEvent) => {
+      if (event.data.size > 0) {
+        chunks.push(event.data);
+      }
+    };
+    
+    mediaRecorder.onstop = () => {
+      // Cancelled - nothing to upload
+      if (transcriberRef.current !== transcriber) return;
+      
+      if (chunks.length > 0 && (Date.now() - segmentStart) / 1000 >= MIN_SEGMENT_SEC) {
+        transcriber.push(new Blob(chunks, { type: 'audio/webm' }));
+      }
+      
+      // A rotated-out segment just uploads; the last one finishes the recording
+      if (mediaRecorderRef.current === mediaRecorder) {
+        finishRecording(transcriber);
+      }
+    };
+    
+    mediaRecorder.start(100); // Capture data in smaller chunks (100ms)
+  };
+
+  // Close the current segment and start the next one without a gap
+  const rotateSegment = (): void => {
+    const previous = mediaRecorderRef.current;
+    if (!streamRef.current || !transcriberRef.current || !previous || previous.state === 'inactive') return;
+    
+    startSegment(streamRef.current, transcriberRef.current);
+    previous.stop();
+  };
+
+  // Called once the last segment has been handed to the transcriber
+  const finishRecording = (transcriber: StreamingTranscriber): void => {
+    console.log('[VoiceRecorder] Recording stopped, finishing transcription...');
+    
+    // Calculate real recording duration
+    const elapsedSec = startTimeRef.current
+      ? (Date.now() - startTimeRef.current) / 1000
+      : 0;
+    
+    // Stop all tracks to release the microphone
+    if (streamRef.current) {
+      streamRef.current.getTracks().forEach(track => track.stop());
+    }
+    
+    // Clear timers
+    if (timerRef.current) clearInterval(timerRef.current);
+    if (segmentTimerRef.current) clearInterval(segmentTimerRef.current);
+    if (animationFrameRef.current) cancelAnimationFrame(animationFrameRef.current);
+    setIsRecording(false);
+    
+    // Only proceed to transcription if we have recorded something meaningful
+    // threshold 0.5 s
+    if (elapsedSec > MIN_SEGMENT_SEC) {
+      console.log('[VoiceRecorder] Recording duration:', elapsedSec, 'seconds. Proceeding to transcription.');
+      transcribeRecording(transcriber);
+    } else {
+      console.log('[VoiceRecorder] Recording too short or no audio data captured.');
+      transcriber.abort();
+      transcriberRef.current = null;
+      setIsPreparing(false);
+      setError('Recording was too short. Please try again and speak clearly.');
+    }
+  };
+
   // Start recording function
   const startRecording = async (): Promise<void> => {
     try {
@@ -166,55 +265,13 @@ export default function VoiceTaskRecorder({
         }
       };
       
-      // Set up MediaRecorder
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm;codecs=opus'
-      });
-      mediaRecorderRef.current = mediaRecorder;
-      audioChunksRef.current = [];
-      
-      mediaRecorder.ondataavailable = (event: BlobEvent) => {
-        if (event.data.size > 0) {
-          audioChunksRef.current.push(event.data);
-        }
-      };
-      
-      mediaRecorder.onstop = () => {
-        console.log('[VoiceRecorder] Recording stopped, processing audio...');
-        
-        // Calculate real recording duration
-        const elapsedSec = startTimeRef.current
-          ? (Date.now() - startTimeRef.current) / 1000
-          : 0;
-
-        // Create blob from recorded chunks
-        const audioBlob = new Blob(audioChunksRef.current, { type: 'audio/webm' });
-        setAudioBlob(audioBlob);
-        
-        // Stop all tracks to release the microphone
-        if (streamRef.current) {
-          streamRef.current.getTracks().forEach(track => track.stop());
-        }
-        
-        // Clear timers
-        if (timerRef.current) clearInterval(timerRef.current);
-        if (animationFrameRef.current) cancelAnimationFrame(animationFrameRef.current);
-        
-        // Only proceed to transcription if we have recorded something meaningful
-        // threshold 0.5 s
-        if (elapsedSec > 0.5 && audioChunksRef.current.length > 0) {
-          console.log('[VoiceRecorder] Recording duration:', elapsedSec, 'seconds. Proceeding to transcription.');
-          transcribeAudio(audioBlob);
-        } else {
-          console.log('[VoiceRecorder] Recording too short or no audio data captured.');
-          setIsRecording(false);
-          setIsPreparing(false);
-          setError('Recording was too short. Please try again and speak clearly.');
-        }
-      };
+      // Segments upload and transcribe while the user is still talking
+      const transcriber = new StreamingTranscriber(setPartialTranscript);
+      transcriberRef.current = transcriber;
       
       // Start recording
-      mediaRecorder.start(100); // Capture data in smaller chunks (100ms)
+      startSegment(stream, transcriber);
+      segmentTimerRef.current = setInterval(rotateSegment, VOICE_SEGMENT_MS);
       setIsRecording(true);
       setIsPreparing(false);
 
@@ -249,6 +306,10 @@ export default function VoiceTaskRecorder({
   // Stop recording function
   const stopRecording = (): void => {
     console.log('[VoiceRecorder] Stopping recording...');
+    if (segmentTimerRef.current) {
+      clearInterval(segmentTimerRef.current);
+      segmentTimerRef.current = null;
+    }
     if (mediaRecorderRef.current && mediaRecorderRef.current.state !== 'inactive') {
       try {
         mediaRecorderRef.current.stop();
@@ -268,6 +329,9 @@ export default function VoiceTaskRecorder({
   const cancelRecording = (): void => {
     console.log('[VoiceRecorder] Cancelling recording...');
     
+    transcriberRef.current?.abort();
+    transcriberRef.current = null;
+    
     if (mediaRecorderRef.current && mediaRecorderRef.current.state !== 'inactive') {
       try {
         mediaRecorderRef.current.stop();
@@ -280,45 +344,32 @@ export default function VoiceTaskRecorder({
     setExtractedTasks([]);
   };
 
-  // Transcribe audio using OpenAI Whisper API
-  const transcribeAudio = async (blob: Blob): Promise<void> => {
+  // Wait for the outstanding segments; by the time recording stops most of
+  // the audio has already been transcribed
+  const transcribeRecording = async (transcriber: StreamingTranscriber): Promise<void> => {
     try {
       setIsTranscribing(true);
-      console.log('[VoiceRecorder] Starting transcription, audio size:', Math.round(blob.size / 1024), 'KB');
-      
-      // Create form data for the API request
-      const formData = new FormData();
-      formData.append('file', blob, 'recording.webm');
+      const text = await transcriber.finish();
       
-      // Send to our secure server-side transcription endpoint
-      console.log('[VoiceRecorder] Sending audio to transcription API...');
-      const response = await fetch('/api/transcribe', {
-        method: 'POST',
-        body: formData,
-      });
-      
-      if (!response.ok) {
-        const errorData = await response.json().catch(() => ({}));
-        const errorMessage = errorData.error || response.statusText || 'Unknown error';
-        console.error('[VoiceRecorder] Transcription API error:', response.status, errorMessage);
-        throw new Error(`Transcription failed: ${errorMessage}`);
-      }
-      
-      const data = await response.json();
+      // Cancelled while the last segment was in flight
+      if (transcriber.aborted) return;
+      transcriberRef.current = null;
       
-      if (!data.text || data.text.trim() === '') {
+      if (!text) {
         console.warn('[VoiceRecorder] Transcription returned empty text');
         throw new Error('No speech detected. Please try again and speak clearly.');
       }
       
-      console.log('[VoiceRecorder] Transcription successful:', data.text);
-      setTranscript(data.text);
+      console.log('[VoiceRecorder] Transcription successful:', text);
+      setTranscript(text);
       setIsTranscribing(false);
       
       // Extract tasks from transcript
-      await extractTasks(data.text);
+      await extractTasks(text);
       
     } catch (err) {
+      if (transcriber.aborted) return;
+      transcriberRef.current = null;
       console.error('[VoiceRecorder] Transcription error:', err);
       const error = err as Error;
       setIsTranscribing(false);
@@ -600,6 +651,11 @@ export default function VoiceTaskRecorder({
             </div>
           </div>
           
+          {/* Partial transcript, filled in segment by segment */}
+          {partialTranscript && (
+            <p className="text-sm text-gray-600 mb-3 line-clamp-3">{partialTranscript}</p>
+          )}
+          
           {/* Recording controls */}
           <div className="flex justify-center space-x-4">
             <button
@@ -627,6 +683,9 @@ export default function VoiceTaskRecorder({
           <p className="text-gray-600">
             {isTranscribing ? 'Transcribing your recording...' : 'Processing tasks...'}
           </p>
+          {isTranscribing && partialTranscript && (
+            <p className="text-sm text-gray-500 mt-2 text-center line-clamp-3">{partialTranscript}</p>
+          )}
         </div>
       )}
       
@@ -0,0 +1,194 @@
+/**
+ * Incremental duplicate detection for tasks
+ *
+ * Rather than rescanning every user's tasks, each run reads only the tasks
+ * whose `updatedAt` moved past a stored watermark. Each changed task gets a
+ * normalized title+detail `dedupHash`. That user's open tasks with the same
+ * hash are then read with one equality query, so the work done is
+ * proportional to what changed. Duplicates are merged the way
+ * lib/duplicateHandler.ts resolves them - the most recent task is kept - but
+ * the older ones are soft-deleted (`deleted: true`, `duplicateOf`) rather
+ * than removed.
+ *
+ * Not every client writes `updatedAt`, so the `stampTaskUpdatedAt` trigger
+ * stamps it on any task write that could create a duplicate (see
+ * needsUpdatedAtStamp), and scripts/backfill-task-updated-at.js stamps tasks
+ * written before the trigger existed.
+ */
+
+const crypto = require('crypto');
+const admin = require('firebase-admin');
+
+const TASKS = 'tasks';
+const CHECKPOINTS = 'jobCheckpoints';
+const CHECKPOINT_ID = 'duplicateDetector';
+
+const PAGE_SIZE = 300;
+const GROUP_QUERY_BATCH = 20;           // duplicate-group lookups in flight at once
+const SETTLE_MS = 5 * 60 * 1000;        // leave recent writes for the next run so late commits and client clocks can't slip under the watermark
+
+function normalizeText(value) {
+  return String(value || '')
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
+function dedupHash(title, detail) {
+  return crypto
+    .createHash('sha1')
+    .update(`${normalizeText(title)}\n${normalizeText(detail)}`)
+    .digest('hex');
+}
+
+function isOpenTask(data) {
+  return !data.completed && !data.completedAt && !data.dismissed &&
+    data.status !== 'dismissed' && !data.deleted;
+}
+
+// A change to any of these can turn a task into someone's duplicate
+const DEDUP_FIELDS = ['userId', 'title', 'detail'];
+
+function sameValue(a, b) {
+  if (a?.isEqual && b) return a.isEqual(b);
+  return a === b;
+}
+
+/**
+ * Whether a task write needs `updatedAt` stamped so the detector sees it: a
+ * new task, a changed owner/title/detail or a task becoming open again, when
+ * the writer didn't move updatedAt itself. The detector's own writes
+ * (dedupHash, soft deletes) never qualify, so they don't re-enter a run.
+ */
+function needsUpdatedAtStamp(before, after) {
+  if (!after) return false;
+  if (before && !sameValue(before.updatedAt, after.updatedAt)) return false;
+  if (!before) return !after.updatedAt;
+
+  return DEDUP_FIELDS.some(field => !sameValue(before[field], after[field])) ||
+    (!isOpenTask(before) && isOpenTask(after));
+}
+
+function createdMillis(data) {
+  return data.createdAt?.toMillis?.() || 0;
+}
+
+/**
+ * Resolve one (userId, hash) group: keep the most recent open task and
+ * soft-delete the rest. `changed` holds this page's fresh copies, which win
+ * over the query results (their hash may not be written yet).
+ */
+async function mergeGroup(db, writer, userId, hash, changed, handled, stats) {
+  const snapshot = await db.collection(TASKS)
+    .where('userId', '==', userId)
+    .where('dedupHash', '==', hash)
+    .get();
+
+  const tasks = new Map(snapshot.docs.map(doc => [doc.id, doc]));
+  changed.forEach(doc => tasks.set(doc.id, doc));
+
+  const open = [...tasks.values()]
+    .filter(doc => !handled.has(doc.id) && isOpenTask(doc.data()))
+    .sort((a, b) => createdMillis(b.data()) - createdMillis(a.data()));
+  if (open.length < 2) return;
+
+  const [keep, ...duplicates] = open;
+  stats.groups++;
+  duplicates.forEach(doc => {
+    handled.add(doc.id);
+    // updatedAt is left alone so the merge itself doesn't re-enter the next run
+    writer.update(doc.ref, {
+      deleted: true,
+      duplicateOf: keep.id,
+      deletedAt: admin.firestore.FieldValue.serverTimestamp()
+    });
+    stats.merged++;
+  });
+}
+
+/**
+ * Process tasks changed since the watermark until `deadline`; returns run stats.
+ */
+async function detectDuplicates(db, { deadline, now = Date.now() }) {
+  const checkpointRef = db.collection(CHECKPOINTS).doc(CHECKPOINT_ID);
+  const checkpoint = (await checkpointRef.get()).data() || {};
+  const settledBefore = admin.firestore.Timestamp.fromMillis(now - SETTLE_MS);
+
+  let watermark = checkpoint.watermark || admin.firestore.Timestamp.fromMillis(0);
+  let lastId = checkpoint.lastId || null;
+  const stats = { resumedFrom: watermark.toDate().toISOString(), pages: 0, scanned: 0, hashed: 0, groups: 0, merged: 0, complete: false };
+
+  const writer = db.bulkWriter();
+  writer.onWriteError(error => {
+    console.error(`Duplicate detector write failed for ${error.documentRef.path}:`, error.message);
+    return error.failedAttempts < 3;
+  });
+
+  while (Date.now() < deadline) {
+    let pageQuery = db.collection(TASKS)
+      .where('updatedAt', '>=', watermark)
+      .where('updatedAt', '<', settledBefore)
+      .orderBy('updatedAt')
+      .orderBy(admin.firestore.FieldPath.documentId())
+      .limit(PAGE_SIZE);
+    if (lastId) pageQuery = pageQuery.startAfter(watermark, lastId);
+
+    const page = await pageQuery.get();
+    stats.pages++;
+    stats.scanned += page.size;
+
+    // Hash the changed tasks and bucket the open ones by owner + hash
+    const groups = new Map();
+    for (const doc of page.docs) {
+      const data = doc.data();
+      const hash = dedupHash(data.title, data.detail);
+      if (data.dedupHash !== hash) {
+        writer.update(doc.ref, { dedupHash: hash });
+        stats.hashed++;
+      }
+      if (!data.userId || !normalizeText(data.title) || !isOpenTask(data)) continue;
+
+      const key = `${data.userId}\n${hash}`;
+      if (!groups.has(key)) groups.set(key, { userId: data.userId, hash, changed: [] });
+      groups.get(key).changed.push(doc);
+    }
+
+    const handled = new Set();
+    const pending = [...groups.values()];
+    for (let i = 0; i < pending.length; i += GROUP_QUERY_BATCH) {
+      await Promise.all(pending.slice(i, i + GROUP_QUERY_BATCH).map(group =>
+        mergeGroup(db, writer, group.userId, group.hash, group.changed, handled, stats)
+      ));
+    }
+
+    // Writes must land before the watermark moves past them
+    await writer.flush();
+
+    if (page.size > 0) {
+      const last = page.docs[page.docs.length - 1];
+      watermark = last.data().updatedAt;
+      lastId = last.id;
+    }
+    stats.complete = page.size < PAGE_SIZE;
+
+    await checkpointRef.set({
+      watermark,
+      lastId,
+      updatedAt: admin.firestore.FieldValue.serverTimestamp(),
+      ...(stats.complete ? { lastCompletedAt: admin.firestore.FieldValue.serverTimestamp() } : {})
+    }, { merge: true });
+
+    if (stats.complete) break;
+  }
+
+  await writer.close();
+  return stats;
+}
+
+module.exports = {
+  normalizeText,
+  dedupHash,
+  needsUpdatedAtStamp,
+  detectDuplicates
+};
@@ -5,122 +5,286 @@ admin.initializeApp();
 const db = admin.firestore();
 const messaging = admin.messaging();
 
+const {
+  REMINDER_QUEUE,
+  REMINDER_BUCKETS,
+  bucketFor,
+  queuePlacement,
+  claimBucket,
+  releaseBucket
+} = require('./reminderQueue');
+const userCache = require('./userCache');
+const { materializeRecurringTasks } = require('./recurringMaterializer');
+const { detectDuplicates, needsUpdatedAtStamp } = require('./duplicateDetector');
+
+// Dispatcher tuning: each run drains pages of due reminders until the time
+// budget is spent, leaving headroom before the next scheduled tick
+const DISPATCH_PAGE_SIZE = 500;            // FCM sendEach accepts up to 500 messages
+const DISPATCH_TIME_BUDGET_MS = 50 * 1000;
+const DISPATCH_CLAIM_BATCH = 20;           // bucket slices claimed and drained in parallel
+const MAX_REMINDER_ATTEMPTS = 3;
+
+// FCM errors that will never succeed on retry
+const PERMANENT_FCM_ERRORS = new Set([
+  'messaging/registration-token-not-registered',
+  'messaging/invalid-registration-token',
+  'messaging/invalid-argument'
+]);
+
 /**
- * Scheduled function to process reminder notifications
- * Runs every minute to check for due reminders
+ * Build the FCM message for a reminder
  */
-exports.processReminderNotifications = functions.pubsub.schedule('every 1 minutes').onRun(async (context) => {
-  console.log('Processing reminder notifications...');
-  
-  try {
-    const now = admin.firestore.Timestamp.now();
-    
-    // Get all unsent reminders that are due
-    const dueRemindersQuery = db.collection('scheduledNotifications')
-      .where('sent', '==', false)
-      .where('scheduledFor', '<=', now)
-      .limit(50); // Process in batches
-    
-    const dueReminders = await dueRemindersQuery.get();
-    console.log(`Found ${dueReminders.size} due reminders`);
-    
-    const promises = dueReminders.docs.map(async (reminderDoc) => {
-      const reminder = reminderDoc.data();
-      
-      try {
-        // Get user's FCM token and notification preferences
-        const userDoc = await db.collection('users').doc(reminder.userId).get();
-        const userData = userDoc.data();
-        
-        if (!userData || !userData.fcmToken || !userData.notificationsEnabled) {
-          console.log(`Skipping reminder for user ${reminder.userId} - no token or disabled`);
-          await reminderDoc.ref.delete();
-          return;
-        }
-        
-        // Get the associated task to ensure it still exists and isn't completed
-        const taskDoc = await db.collection('tasks').doc(reminder.taskId).get();
-        const taskData = taskDoc.data();
-        
-        if (!taskData || taskData.completed || taskData.deleted) {
-          console.log(`Skipping reminder for completed/deleted task ${reminder.taskId}`);
-          await reminderDoc.ref.delete();
-          return;
-        }
-        
-        // Send the push notification
-        const message = {
-          token: userData.fcmToken,
-          notification: {
-            title: reminder.payload.title,
-            body: reminder.payload.body || taskData.detail || 'Tap to view details'
-          },
-          data: {
-            type: 'reminder',
-            taskId: reminder.taskId,
-            userId: reminder.userId
-          },
-          android: {
-            notification: {
-              channelId: 'task-reminders',
-              priority: 'high',
-              sound: 'default',
-              icon: 'ic_notification',
-              color: '#3B82F6'
-            }
-          },
-          apns: {
-            payload: {
-              aps: {
-                sound: 'default',
-                badge: 1,
-                category: 'TASK_REMINDER'
-              }
-            }
-          }
-        };
-        
-        await messaging.send(message);
-        console.log(`Reminder sent successfully for task ${reminder.taskId}`);
-        
-        // Mark as sent and record delivery
-        await reminderDoc.ref.update({
-          sent: true,
-          sentAt: admin.firestore.Timestamp.now(),
-          deliveryStatus: 'sent'
-        });
-        
-        // Update task to clear the reminder setting
-        await taskDoc.ref.update({
-          'reminder.sent': true
-        });
-        
-      } catch (error) {
-        console.error(`Failed to send reminder for task ${reminder.taskId}:`, error);
-        
-        // Increment failure count
-        const attempts = (reminder.attempts || 0) + 1;
-        
-        if (attempts >= 3) {
-          // Delete after 3 failed attempts
-          console.log(`Deleting reminder after ${attempts} failed attempts`);
-          await reminderDoc.ref.delete();
-        } else {
-          // Retry later
-          await reminderDoc.ref.update({ 
-            attempts,
-            lastError: error.message,
-            lastAttemptAt: admin.firestore.Timestamp.now()
-          });
+function buildReminderMessage(reminder, userData, taskData) {
+  return {
+    token: userData.fcmToken,
+    notification: {
+      title: reminder.payload.title,
+      body: reminder.payload.body || taskData.detail || 'Tap to view details'
+    },
+    data: {
+      type: 'reminder',
+      taskId: reminder.taskId,
+      userId: reminder.userId
+    },
+    android: {
+      notification: {
+        channelId: 'task-reminders',
+        priority: 'high',
+        sound: 'default',
+        icon: 'ic_notification',
+        color: '#3B82F6'
+      }
+    },
+    apns: {
+      payload: {
+        aps: {
+          sound: 'default',
+          badge: 1,
+          category: 'TASK_REMINDER'
         }
       }
-    });
-    
-    await Promise.all(promises);
-    console.log('Finished processing reminder notifications');
-    
+    }
+  };
+}
+
+/**
+ * Read many documents in one round trip, keyed by id
+ */
+async function getAllById(collectionName, ids) {
+  const uniqueIds = [...new Set(ids.filter(Boolean))];
+  if (uniqueIds.length === 0) return new Map();
+
+  const refs = uniqueIds.map(id => db.collection(collectionName).doc(id));
+  const snapshots = await db.getAll(...refs);
+  return new Map(snapshots.map(snap => [snap.id, snap]));
+}
+
+/**
+ * Record a failed delivery - retry later or give up after MAX_REMINDER_ATTEMPTS
+ * Returns true when the reminder stays queued for a retry
+ */
+function recordReminderFailure(writer, reminderDoc, error, permanent) {
+  const reminder = reminderDoc.data();
+  const attempts = (reminder.attempts || 0) + 1;
+
+  if (permanent || attempts >= MAX_REMINDER_ATTEMPTS) {
+    console.log(`Deleting reminder ${reminderDoc.id} after ${attempts} failed attempts`);
+    writer.delete(reminderDoc.ref);
+    return false;
+  }
+
+  writer.update(reminderDoc.ref, {
+    attempts,
+    lastError: error.message || String(error),
+    lastAttemptAt: admin.firestore.Timestamp.now()
+  });
+  return true;
+}
+
+/**
+ * Send one page of due reminders: batch-read users and tasks, send through
+ * FCM in a single sendEach call and queue all result writes on the BulkWriter
+ * Returns the number of reminders left queued for a retry
+ */
+async function dispatchReminderPage(reminderDocs, writer, stats) {
+  const reminders = reminderDocs.map(doc => doc.data());
+  const [users, tasks] = await Promise.all([
+    userCache.getUsers(db, reminders.map(r => r.userId)),
+    getAllById('tasks', reminders.map(r => r.taskId))
+  ]);
+
+  const outgoing = [];
+  const nowMillis = Date.now();
+
+  reminderDocs.forEach((reminderDoc, i) => {
+    const reminder = reminders[i];
+    const userData = users.get(reminder.userId);
+    const taskSnap = tasks.get(reminder.taskId);
+    const taskData = taskSnap?.data();
+
+    if (!userData || !userData.fcmToken || !userData.notificationsEnabled) {
+      console.log(`Skipping reminder for user ${reminder.userId} - no token or disabled`);
+      writer.delete(reminderDoc.ref);
+      stats.skipped++;
+      return;
+    }
+
+    if (!taskData || taskData.completed || taskData.deleted) {
+      console.log(`Skipping reminder for completed/deleted task ${reminder.taskId}`);
+      writer.delete(reminderDoc.ref);
+      stats.skipped++;
+      return;
+    }
+
+    const lagMs = nowMillis - reminder.scheduledFor.toMillis();
+    stats.maxLagMs = Math.max(stats.maxLagMs, lagMs);
+    stats.totalLagMs += lagMs;
+
+    outgoing.push({ reminderDoc, taskRef: taskSnap.ref, message: buildReminderMessage(reminder, userData, taskData) });
+  });
+
+  if (outgoing.length === 0) return 0;
+
+  let responses;
+  try {
+    const result = await messaging.sendEach(outgoing.map(o => o.message));
+    responses = result.responses;
+  } catch (error) {
+    // The whole batch call failed (network, quota) - count an attempt for each
+    console.error('FCM batch send failed:', error);
+    stats.failed += outgoing.length;
+    return outgoing.filter(o => recordReminderFailure(writer, o.reminderDoc, error, false)).length;
+  }
+
+  let retryable = 0;
+  responses.forEach((response, i) => {
+    const { reminderDoc, taskRef } = outgoing[i];
+
+    if (response.success) {
+      writer.update(reminderDoc.ref, {
+        sent: true,
+        sentAt: admin.firestore.Timestamp.now(),
+        deliveryStatus: 'sent'
+      });
+      writer.update(taskRef, { 'reminder.sent': true });
+      stats.sent++;
+    } else {
+      console.error(`Failed to send reminder for task ${reminderDoc.data().taskId}:`, response.error);
+      if (recordReminderFailure(writer, reminderDoc, response.error, PERMANENT_FCM_ERRORS.has(response.error?.code))) {
+        retryable++;
+      }
+      stats.failed++;
+    }
+  });
+
+  return retryable;
+}
+
+/**
+ * Drain every due reminder in one claimed (bucket, shard) slice.
+ * Equality-only reads keep each slice on its own index range.
+ */
+async function drainBucket(bucketDoc, claimedVersion, writer, stats, deadline) {
+  const { bucket, shard } = bucketDoc.data();
+  let lastDoc = null;
+  let retryable = 0;
+  let complete = false;
+
+  while (Date.now() < deadline) {
+    // Cursor-paged so reminders left for retry aren't re-read this run
+    let pageQuery = db.collection(REMINDER_QUEUE)
+      .where('bucket', '==', bucket)
+      .where('shard', '==', shard)
+      .where('sent', '==', false)
+      .limit(DISPATCH_PAGE_SIZE);
+    if (lastDoc) pageQuery = pageQuery.startAfter(lastDoc);
+
+    const page = await pageQuery.get();
+    stats.pages++;
+    stats.fetched += page.size;
+
+    if (!page.empty) {
+      lastDoc = page.docs[page.docs.length - 1];
+      retryable += await dispatchReminderPage(page.docs, writer, stats);
+    }
+    if (page.size < DISPATCH_PAGE_SIZE) {
+      complete = true;
+      break;
+    }
+  }
+
+  // Result writes must land before the slice can be declared drained
+  await writer.flush();
+  await releaseBucket(db, bucketDoc.ref, complete && retryable === 0, claimedVersion);
+  stats.buckets++;
+}
+
+/**
+ * Scheduled function to process reminder notifications
+ * Runs every minute, claims due (bucket, shard) slices with a lease and drains
+ * them in parallel until the time budget is spent
+ */
+exports.processReminderNotifications = functions
+  .runWith({ timeoutSeconds: 120, memory: '512MB' })
+  .pubsub.schedule('every 1 minutes').onRun(async (context) => {
+  const startedAt = Date.now();
+  const deadline = startedAt + DISPATCH_TIME_BUDGET_MS;
+  const owner = context.eventId || `dispatch_${startedAt}`;
+  const stats = { buckets: 0, pages: 0, fetched: 0, sent: 0, skipped: 0, failed: 0, maxLagMs: 0, totalLagMs: 0 };
+
+  const writer = db.bulkWriter();
+  writer.onWriteError(error => {
+    console.error(`Reminder write failed for ${error.documentRef.path}:`, error.message);
+    return error.failedAttempts < MAX_REMINDER_ATTEMPTS;
+  });
+
+  try {
+    await userCache.syncInvalidations(db);
+    // Only minutes that have fully passed: every reminder in them is due, so
+    // none go out early. The next run picks up the current minute.
+    const nowBucket = bucketFor(new Date(startedAt));
+    let lastBucketDoc = null;
+
+    while (Date.now() < deadline) {
+      // Drained slices drop out of this query, so finished minutes cost nothing
+      let openBucketsQuery = db.collection(REMINDER_BUCKETS)
+        .where('drained', '==', false)
+        .where('bucket', '<', nowBucket)
+        .orderBy('bucket')
+        .limit(DISPATCH_CLAIM_BATCH);
+      if (lastBucketDoc) openBucketsQuery = openBucketsQuery.startAfter(lastBucketDoc);
+
+      const openBuckets = await openBucketsQuery.get();
+      if (openBuckets.empty) break;
+      lastBucketDoc = openBuckets.docs[openBuckets.docs.length - 1];
+
+      const claims = await Promise.all(openBuckets.docs.map(bucketDoc =>
+        claimBucket(db, bucketDoc.ref, owner).catch(error => {
+          console.warn(`Could not claim reminder bucket ${bucketDoc.id}:`, error.message);
+          return null;
+        })
+      ));
+
+      await Promise.all(openBuckets.docs.map((bucketDoc, i) => claims[i] === null
+        ? null
+        : drainBucket(bucketDoc, claims[i], writer, stats, deadline)));
+      if (openBuckets.size < DISPATCH_CLAIM_BATCH) break;
+    }
   } catch (error) {
     console.error('Error processing reminder notifications:', error);
+  } finally {
+    await writer.close();
+
+    const elapsedMs = Date.now() - startedAt;
+    const delivered = stats.sent + stats.failed;
+    console.log('Reminder dispatch finished', JSON.stringify({
+      ...stats,
+      elapsedMs,
+      perSecond: Number(((stats.fetched * 1000) / Math.max(elapsedMs, 1)).toFixed(1)),
+      avgLagMs: delivered > 0 ? Math.round(stats.totalLagMs / delivered) : 0,
+      budgetExhausted: elapsedMs >= DISPATCH_TIME_BUDGET_MS,
+      userCache: userCache.cacheStats()
+    }));
   }
 });
 
@@ -172,12 +336,14 @@ exports.scheduleReminder = functions.https.onCall(async (data, context) => {
         throw new functions.https.HttpsError('invalid-argument', 'Invalid reminder type');
     }
     
-    // Create the scheduled notification
+    // Create the scheduled notification in its (bucket, shard) slice
+    const placement = queuePlacement(db, taskId, scheduledFor);
     const reminderData = {
       userId,
       taskId,
       type: 'reminder',
       scheduledFor: admin.firestore.Timestamp.fromDate(scheduledFor),
+      ...placement.fields,
       payload: {
         title: `⏰ Your Reminder: ${taskData.title}`,
         body: taskData.detail || 'Tap to view details'
@@ -187,10 +353,15 @@ exports.scheduleReminder = functions.https.onCall(async (data, context) => {
       createdAt: admin.firestore.Timestamp.now()
     };
     
-    const reminderRef = await db.collection('scheduledNotifications').add(reminderData);
+    const reminderRef = db.collection(REMINDER_QUEUE).doc();
+    const batch = db.batch();
+    
+    batch.set(reminderRef, reminderData);
+    // Reopen the slice in case it was already drained
+    batch.set(placement.bucketRef, placement.bucketData, { merge: true });
     
     // Update the task with reminder info
-    await taskDoc.ref.update({
+    batch.update(taskDoc.ref, {
       reminder: {
         enabled: true,
         type: reminderType,
@@ -201,6 +372,8 @@ exports.scheduleReminder = functions.https.onCall(async (data, context) => {
       }
     });
     
+    await batch.commit();
+    
     console.log(`Reminder scheduled for task ${taskId} at ${scheduledFor}`);
     
     return {
@@ -226,28 +399,41 @@ exports.cancelReminder = functions.https.onCall(async (data, context) => {
   }
   
   try {
-    // Find and delete the scheduled notification
-    const scheduledQuery = db.collection('scheduledNotifications')
-      .where('taskId', '==', taskId)
-      .where('userId', '==', userId)
-      .where('sent', '==', false);
+    const taskDoc = await db.collection('tasks').doc(taskId).get();
+    const notificationId = taskDoc.exists ? taskDoc.data().reminder?.notificationId : null;
     
-    const scheduledNotifications = await scheduledQuery.get();
+    // Find the scheduled notification - directly by id when the task knows it
+    let reminderDocs;
+    if (notificationId) {
+      const reminderDoc = await db.collection(REMINDER_QUEUE).doc(notificationId).get();
+      reminderDocs = reminderDoc.exists && !reminderDoc.data().sent && reminderDoc.data().userId === userId
+        ? [reminderDoc]
+        : [];
+    } else {
+      const scheduledNotifications = await db.collection(REMINDER_QUEUE)
+        .where('taskId', '==', taskId)
+        .where('userId', '==', userId)
+        .where('sent', '==', false)
+        .get();
+      reminderDocs = scheduledNotifications.docs;
+    }
     
-    const deletePromises = scheduledNotifications.docs.map(doc => doc.ref.delete());
-    await Promise.all(deletePromises);
+    // Emptied slices are marked drained by the dispatcher on its next pass
+    const batch = db.batch();
+    reminderDocs.forEach(doc => batch.delete(doc.ref));
     
     // Remove reminder info from task
-    const taskDoc = await db.collection('tasks').doc(taskId).get();
     if (taskDoc.exists) {
-      await taskDoc.ref.update({
+      batch.update(taskDoc.ref, {
         reminder: admin.firestore.FieldValue.delete()
       });
     }
     
+    await batch.commit();
+    
     console.log(`Reminder cancelled for task ${taskId}`);
     
-    return { success: true, cancelled: scheduledNotifications.size };
+    return { success: true, cancelled: reminderDocs.length };
     
   } catch (error) {
     console.error('Error cancelling reminder:', error);
@@ -257,27 +443,122 @@ exports.cancelReminder = functions.https.onCall(async (data, context) => {
 
 /**
  * Clean up completed or deleted tasks from scheduled notifications
- * Triggered when a task is updated
+ * Triggered when a task is updated - only does work when the task has a pending
+ * reminder and just flipped to completed or deleted
  */
 exports.cleanupReminderOnTaskUpdate = functions.firestore.document('tasks/{taskId}').onUpdate(async (change, context) => {
-  const newData = change.after.data();
+  const before = change.before.data();
+  const after = change.after.data();
   const taskId = context.params.taskId;
   
-  // If task is completed or deleted, remove its scheduled reminders
-  if (newData.completed || newData.deleted) {
-    try {
-      const reminderQuery = db.collection('scheduledNotifications')
+  const justCompleted = !before.completed && !!after.completed;
+  const justDeleted = !before.deleted && !!after.deleted;
+  if (!justCompleted && !justDeleted) return;
+  
+  // Most tasks never get a reminder - skip the query entirely for them
+  const reminder = after.reminder || before.reminder;
+  if (!reminder || reminder.sent) return;
+  
+  try {
+    let reminderRefs;
+    if (reminder.notificationId) {
+      reminderRefs = [db.collection(REMINDER_QUEUE).doc(reminder.notificationId)];
+    } else {
+      const reminders = await db.collection(REMINDER_QUEUE)
         .where('taskId', '==', taskId)
-        .where('sent', '==', false);
-      
-      const reminders = await reminderQuery.get();
-      const deletePromises = reminders.docs.map(doc => doc.ref.delete());
-      
-      await Promise.all(deletePromises);
-      console.log(`Cleaned up ${reminders.size} reminders for task ${taskId}`);
-      
-    } catch (error) {
-      console.error(`Error cleaning up reminders for task ${taskId}:`, error);
+        .where('sent', '==', false)
+        .get();
+      reminderRefs = reminders.docs.map(doc => doc.ref);
+    }
+    
+    // Deleting a missing doc is a no-op, so the direct path needs no read
+    for (let i = 0; i < reminderRefs.length; i += 500) {
+      const batch = db.batch();
+      reminderRefs.slice(i, i + 500).forEach(ref => batch.delete(ref));
+      await batch.commit();
     }
+    console.log(`Cleaned up ${reminderRefs.length} reminders for task ${taskId}`);
+    
+  } catch (error) {
+    console.error(`Error cleaning up reminders for task ${taskId}:`, error);
   }
-});
\ No newline at end of file
+});
+
+/**
+ * Invalidate cached FCM token / notification preferences when a user doc changes
+ * Writes that don't touch the cached fields are ignored
+ */
+exports.invalidateUserCacheOnWrite = functions.firestore.document('users/{uid}').onWrite(async (change, context) => {
+  const before = change.before.exists ? change.before.data() : null;
+  const after = change.after.exists ? change.after.data() : null;
+
+  if (!userCache.affectsCachedFields(before, after)) return;
+
+  try {
+    await userCache.recordInvalidation(db, context.params.uid);
+  } catch (error) {
+    console.error(`Error invalidating user cache for ${context.params.uid}:`, error);
+  }
+});
+
+/**
+ * Scheduled function to create today's instances of recurring tasks
+ * Runs hourly so every time zone is picked up shortly after local midnight;
+ * deterministic task ids make repeated and resumed runs idempotent
+ */
+exports.materializeRecurringTasks = functions
+  .runWith({ timeoutSeconds: 540, memory: '512MB' })
+  .pubsub.schedule('every 60 minutes').onRun(async (context) => {
+  const startedAt = Date.now();
+
+  try {
+    const stats = await materializeRecurringTasks(db, { deadline: startedAt + 480 * 1000 });
+    console.log('Recurring task materialization finished', JSON.stringify({
+      ...stats,
+      elapsedMs: Date.now() - startedAt
+    }));
+  } catch (error) {
+    console.error('Error materializing recurring tasks:', error);
+  }
+});
+
+/**
+ * Stamp updatedAt on task writes that could create a duplicate
+ * Several clients create and edit tasks without updatedAt, and the duplicate
+ * detector only reads tasks by updatedAt. The stamp itself moves updatedAt,
+ * so it doesn't trigger another one.
+ */
+exports.stampTaskUpdatedAt = functions.firestore.document('tasks/{taskId}').onWrite(async (change, context) => {
+  const before = change.before.exists ? change.before.data() : null;
+  const after = change.after.exists ? change.after.data() : null;
+
+  if (!needsUpdatedAtStamp(before, after)) return;
+
+  try {
+    await change.after.ref.update({ updatedAt: admin.firestore.FieldValue.serverTimestamp() });
+  } catch (error) {
+    // The task may have been deleted in the meantime
+    console.error(`Error stamping updatedAt on task ${context.params.taskId}:`, error);
+  }
+});
+
+/**
+ * Scheduled function to merge duplicate tasks across all users
+ * Each run only reads tasks changed since the last watermark, so cost tracks
+ * write volume rather than the total number of tasks
+ */
+exports.detectDuplicateTasks = functions
+  .runWith({ timeoutSeconds: 300, memory: '512MB' })
+  .pubsub.schedule('every 15 minutes').onRun(async (context) => {
+  const startedAt = Date.now();
+
+  try {
+    const stats = await detectDuplicates(db, { deadline: startedAt + 240 * 1000 });
+    console.log('Duplicate detection finished', JSON.stringify({
+      ...stats,
+      elapsedMs: Date.now() - startedAt
+    }));
+  } catch (error) {
+    console.error('Error detecting duplicate tasks:', error);
+  }
+});
@@ -0,0 +1,194 @@
+/**
+ * Server-side materialization of recurring task templates
+ *
+ * Streams every active template in `recurringTasks`, works out the owner's
+ * local date and creates that day's task with a deterministic id
+ * (`${templateId}_${YYYY-MM-DD}`), so overlapping runs or a resumed run can
+ * never create a duplicate. Progress is checkpointed after every page, so a
+ * run cut off by the time budget resumes where it stopped.
+ */
+
+const admin = require('firebase-admin');
+
+const RECURRING_TEMPLATES = 'recurringTasks';
+const CHECKPOINTS = 'jobCheckpoints';
+const CHECKPOINT_ID = 'recurringMaterializer';
+
+const PAGE_SIZE = 300;
+const DEFAULT_TIMEZONE = 'America/New_York';
+const ALREADY_EXISTS = 6; // gRPC status code
+
+// Mirrors RECURRENCE_TYPES / shouldCreateToday in lib/recurringTasks.js -
+// the functions bundle can't import from the Next.js app
+const RECURRENCE_TYPES = {
+  DAILY: 'daily',
+  WEEKDAYS: 'weekdays',
+  WEEKENDS: 'weekends',
+  WEEKLY: 'weekly',
+  SPECIFIC_DAYS: 'specific_days'
+};
+
+function shouldCreateOn(template, dayOfWeek) {
+  switch (template.recurrenceType) {
+    case RECURRENCE_TYPES.DAILY:
+      return true;
+    case RECURRENCE_TYPES.WEEKDAYS:
+      return dayOfWeek >= 1 && dayOfWeek <= 5;
+    case RECURRENCE_TYPES.WEEKENDS:
+      return dayOfWeek === 0 || dayOfWeek === 6;
+    case RECURRENCE_TYPES.WEEKLY:
+      return dayOfWeek === template.weekDay;
+    case RECURRENCE_TYPES.SPECIFIC_DAYS:
+      return Array.isArray(template.specificDays) && template.specificDays.includes(dayOfWeek);
+    default:
+      return false;
+  }
+}
+
+const dateFormatters = new Map();
+
+/**
+ * Calendar date and weekday in the given IANA time zone
+ */
+function localDate(now, timeZone) {
+  let formatter = dateFormatters.get(timeZone);
+  if (!formatter) {
+    try {
+      formatter = new Intl.DateTimeFormat('en-CA', { timeZone, year: 'numeric', month: '2-digit', day: '2-digit' });
+    } catch (error) {
+      return localDate(now, DEFAULT_TIMEZONE);
+    }
+    dateFormatters.set(timeZone, formatter);
+  }
+
+  const dateKey = formatter.format(now); // YYYY-MM-DD
+  const [year, month, day] = dateKey.split('-').map(Number);
+  return { dateKey, dayOfWeek: new Date(Date.UTC(year, month - 1, day)).getUTCDay() };
+}
+
+function instanceId(templateId, dateKey) {
+  return `${templateId}_${dateKey}`;
+}
+
+function buildTaskInstance(templateDoc, dateKey) {
+  const template = templateDoc.data();
+  const now = admin.firestore.FieldValue.serverTimestamp();
+  return {
+    title: template.title,
+    description: template.detail || '',
+    detail: template.detail || '',
+    category: template.category || 'personal',
+    priority: template.priority || 'medium',
+    status: 'active',
+    isProject: false,
+    subtasks: [],
+    source: 'manual',
+    tags: ['recurring'],
+    userId: template.userId,
+    recurringTaskId: templateDoc.id,
+    recurrenceDate: dateKey,
+    createdAt: now,
+    updatedAt: now,
+    completed: false,
+    completedAt: null,
+    snoozedUntil: null,
+    dismissed: false,
+    deleted: false
+  };
+}
+
+/**
+ * Time zones for template owners that don't carry one on the template itself
+ */
+async function ownerTimezones(db, templateDocs) {
+  const userIds = [...new Set(templateDocs
+    .filter(doc => !doc.data().timezone)
+    .map(doc => doc.data().userId)
+    .filter(Boolean))];
+  if (userIds.length === 0) return new Map();
+
+  const snapshots = await db.getAll(...userIds.map(uid => db.collection('users').doc(uid)));
+  return new Map(snapshots.map(snap => [snap.id, snap.data()?.profile?.timezone]));
+}
+
+/**
+ * Materialize today's instances until `deadline`; returns run stats.
+ */
+async function materializeRecurringTasks(db, { deadline, now = new Date() }) {
+  const checkpointRef = db.collection(CHECKPOINTS).doc(CHECKPOINT_ID);
+  const checkpoint = (await checkpointRef.get()).data() || {};
+  const stats = { resumedFrom: checkpoint.cursor || null, pages: 0, scanned: 0, created: 0, existing: 0, skipped: 0, complete: false };
+
+  const writer = db.bulkWriter();
+  writer.onWriteError(error => {
+    if (error.code === ALREADY_EXISTS) {
+      // Another run (or an earlier attempt of this one) already made it
+      stats.existing++;
+      stats.created--;
+      return false;
+    }
+    console.error(`Recurring materializer write failed for ${error.documentRef.path}:`, error.message);
+    return error.failedAttempts < 3;
+  });
+
+  let cursor = checkpoint.cursor || null;
+
+  while (Date.now() < deadline) {
+    let pageQuery = db.collection(RECURRING_TEMPLATES)
+      .where('isActive', '==', true)
+      .orderBy(admin.firestore.FieldPath.documentId())
+      .limit(PAGE_SIZE);
+    if (cursor) pageQuery = pageQuery.startAfter(cursor);
+
+    const page = await pageQuery.get();
+    stats.pages++;
+    stats.scanned += page.size;
+
+    const timezones = await ownerTimezones(db, page.docs);
+
+    for (const templateDoc of page.docs) {
+      const template = templateDoc.data();
+      const timeZone = template.timezone || timezones.get(template.userId) || DEFAULT_TIMEZONE;
+      const { dateKey, dayOfWeek } = localDate(now, timeZone);
+
+      if (!template.userId || template.lastMaterializedDate === dateKey || !shouldCreateOn(template, dayOfWeek)) {
+        stats.skipped++;
+        continue;
+      }
+
+      const taskRef = db.collection('tasks').doc(instanceId(templateDoc.id, dateKey));
+      writer.create(taskRef, buildTaskInstance(templateDoc, dateKey));
+      writer.update(templateDoc.ref, { lastMaterializedDate: dateKey });
+      stats.created++;
+    }
+
+    // Writes must land before the checkpoint moves past them
+    await writer.flush();
+
+    if (page.size < PAGE_SIZE) {
+      cursor = null;
+      stats.complete = true;
+    } else {
+      cursor = page.docs[page.docs.length - 1].id;
+    }
+
+    await checkpointRef.set({
+      cursor,
+      updatedAt: admin.firestore.FieldValue.serverTimestamp(),
+      ...(stats.complete ? { lastCompletedAt: admin.firestore.FieldValue.serverTimestamp() } : {})
+    }, { merge: true });
+
+    if (stats.complete) break;
+  }
+
+  await writer.close();
+  return stats;
+}
+
+module.exports = {
+  RECURRENCE_TYPES,
+  shouldCreateOn,
+  localDate,
+  instanceId,
+  materializeRecurringTasks
+};
@@ -0,0 +1,110 @@
+/**
+ * Bucketed, sharded layout for the scheduledNotifications queue
+ *
+ * Every reminder is filed under a per-minute `bucket` and a `shard` derived
+ * from its task id. A marker doc in `reminderBuckets` (id `${bucket}_${shard}`)
+ * tracks whether that slice still has work, so dispatchers can:
+ *   - claim slices in parallel with a lease instead of scanning one hot range
+ *   - read reminders with equality-only queries (bucket, shard, sent)
+ *   - skip already-drained slices without touching their reminders
+ */
+
+const admin = require('firebase-admin');
+
+const REMINDER_QUEUE = 'scheduledNotifications';
+const REMINDER_BUCKETS = 'reminderBuckets';
+
+const BUCKET_WIDTH_MS = 60 * 1000;   // one bucket per minute
+const REMINDER_SHARDS = 10;          // parallel slices per minute
+const BUCKET_LEASE_MS = 2 * 60 * 1000;
+const BUCKET_RETENTION_MS = 7 * 24 * 60 * 60 * 1000; // TTL policy on expireAt removes old markers
+
+function bucketFor(date) {
+  const millis = date instanceof Date ? date.getTime() : date.toMillis();
+  return Math.floor(millis / BUCKET_WIDTH_MS);
+}
+
+// Stable string hash so a task always lands on the same shard
+function shardFor(taskId) {
+  let hash = 0;
+  for (let i = 0; i < taskId.length; i++) {
+    hash = (hash * 31 + taskId.charCodeAt(i)) | 0;
+  }
+  return Math.abs(hash) % REMINDER_SHARDS;
+}
+
+function bucketId(bucket, shard) {
+  return `${bucket}_${shard}`;
+}
+
+/**
+ * Queue placement for a reminder: the fields to store on the reminder doc
+ * plus the marker doc to (re)open for its slice
+ */
+function queuePlacement(db, taskId, scheduledFor) {
+  const bucket = bucketFor(scheduledFor);
+  const shard = shardFor(taskId);
+  return {
+    fields: { bucket, shard },
+    bucketRef: db.collection(REMINDER_BUCKETS).doc(bucketId(bucket, shard)),
+    bucketData: {
+      bucket,
+      shard,
+      drained: false,
+      version: admin.firestore.FieldValue.increment(1),
+      expireAt: admin.firestore.Timestamp.fromMillis((bucket + 1) * BUCKET_WIDTH_MS + BUCKET_RETENTION_MS)
+    }
+  };
+}
+
+/**
+ * Take a lease on a bucket slice. Resolves to the slice version seen at claim
+ * time, or null when another dispatcher holds an unexpired lease or the slice
+ * is already drained.
+ */
+async function claimBucket(db, bucketRef, owner, nowMillis = Date.now()) {
+  return db.runTransaction(async (transaction) => {
+    const snap = await transaction.get(bucketRef);
+    const data = snap.data();
+    if (!data || data.drained) return null;
+    if (data.leaseUntil && data.leaseUntil > nowMillis) return null;
+
+    transaction.update(bucketRef, {
+      leaseOwner: owner,
+      leaseUntil: nowMillis + BUCKET_LEASE_MS
+    });
+    return data.version || 0;
+  });
+}
+
+/**
+ * Give a slice back. It is marked drained only when nothing is left to retry
+ * and no reminder was filed into it since the claim; otherwise the lease is
+ * dropped so the next run picks it up again.
+ */
+async function releaseBucket(db, bucketRef, drained, claimedVersion) {
+  const release = { leaseOwner: null, leaseUntil: 0 };
+  if (!drained) {
+    await bucketRef.update(release);
+    return;
+  }
+
+  await db.runTransaction(async (transaction) => {
+    const snap = await transaction.get(bucketRef);
+    const unchanged = (snap.data()?.version || 0) === claimedVersion;
+    transaction.update(bucketRef, unchanged ? { ...release, drained: true } : release);
+  });
+}
+
+module.exports = {
+  REMINDER_QUEUE,
+  REMINDER_BUCKETS,
+  REMINDER_SHARDS,
+  BUCKET_LEASE_MS,
+  bucketFor,
+  shardFor,
+  bucketId,
+  queuePlacement,
+  claimBucket,
+  releaseBucket
+};
@@ -0,0 +1,151 @@
+/**
+ * Warm-instance cache for the user fields the reminder dispatcher needs
+ *
+ * Module scope survives between invocations on a warm instance, so a user
+ * with several due reminders (or reminders in consecutive runs) is read once.
+ * Entries expire after USER_CACHE_TTL_MS and the map is LRU-bounded.
+ *
+ * Cloud Functions instances don't share memory, so the users/{uid} onWrite
+ * trigger can't evict entries here directly. It records the change in
+ * `cacheInvalidations`, and each dispatcher run applies the invalidations
+ * written since its previous sync with one small query.
+ */
+
+const admin = require('firebase-admin');
+
+const USER_CACHE_MAX_ENTRIES = 5000;
+const USER_CACHE_TTL_MS = 5 * 60 * 1000;
+const CACHE_INVALIDATIONS = 'cacheInvalidations';
+const INVALIDATION_RETENTION_MS = 60 * 60 * 1000;
+const CLOCK_SKEW_MS = 5 * 1000; // overlap syncs so server/instance clock drift can't skip a change
+
+// Only these fields are cached - changes to anything else don't invalidate
+const CACHED_USER_FIELDS = ['fcmToken', 'notificationsEnabled'];
+
+class TtlLruCache {
+  constructor(maxEntries, ttlMs) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+    this.stats = { hits: 0, misses: 0, evictions: 0, invalidations: 0 };
+  }
+
+  get(key, now = Date.now()) {
+    const entry = this.entries.get(key);
+    if (!entry || entry.expiresAt <= now) {
+      if (entry) this.entries.delete(key);
+      this.stats.misses++;
+      return undefined;
+    }
+    // Re-insert to mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.stats.hits++;
+    return entry.value;
+  }
+
+  set(key, value, now = Date.now()) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: now + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+      this.stats.evictions++;
+    }
+  }
+
+  delete(key) {
+    if (this.entries.delete(key)) this.stats.invalidations++;
+  }
+
+  snapshot() {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.entries.size,
+      hitRate: lookups > 0 ? Number((this.stats.hits / lookups).toFixed(3)) : 0
+    };
+  }
+}
+
+const userCache = new TtlLruCache(USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_MS);
+let lastInvalidationSync = null;
+
+function pickCachedFields(data) {
+  if (!data) return null;
+  return CACHED_USER_FIELDS.reduce((picked, field) => {
+    picked[field] = data[field] ?? null;
+    return picked;
+  }, {});
+}
+
+/**
+ * Did a users/{uid} write touch any cached field?
+ */
+function affectsCachedFields(before, after) {
+  if (!before || !after) return true;
+  return CACHED_USER_FIELDS.some(field => before[field] !== after[field]);
+}
+
+/**
+ * Evict users changed since the last sync on this instance
+ */
+async function syncInvalidations(db) {
+  const since = lastInvalidationSync;
+  lastInvalidationSync = admin.firestore.Timestamp.now();
+  if (!since) return; // cold instance, cache is empty anyway
+
+  const changed = await db.collection(CACHE_INVALIDATIONS)
+    .where('changedAt', '>', admin.firestore.Timestamp.fromMillis(since.toMillis() - CLOCK_SKEW_MS))
+    .get();
+  changed.docs.forEach(doc => userCache.delete(doc.id));
+}
+
+/**
+ * Cached user fields for many users; misses are fetched with one getAll.
+ * Missing users map to null.
+ */
+async function getUsers(db, userIds) {
+  const result = new Map();
+  const missing = [];
+
+  for (const uid of new Set(userIds.filter(Boolean))) {
+    const cached = userCache.get(uid);
+    if (cached !== undefined) result.set(uid, cached);
+    else missing.push(uid);
+  }
+
+  if (missing.length > 0) {
+    const snapshots = await db.getAll(...missing.map(uid => db.collection('users').doc(uid)));
+    snapshots.forEach(snap => {
+      const value = pickCachedFields(snap.data());
+      userCache.set(snap.id, value);
+      result.set(snap.id, value);
+    });
+  }
+
+  return result;
+}
+
+/**
+ * Record a users/{uid} change for every warm dispatcher to pick up
+ */
+function recordInvalidation(db, uid) {
+  userCache.delete(uid);
+  return db.collection(CACHE_INVALIDATIONS).doc(uid).set({
+    changedAt: admin.firestore.FieldValue.serverTimestamp(),
+    expireAt: admin.firestore.Timestamp.fromMillis(Date.now() + INVALIDATION_RETENTION_MS)
+  });
+}
+
+function cacheStats() {
+  return userCache.snapshot();
+}
+
+module.exports = {
+  TtlLruCache,
+  getUsers,
+  syncInvalidations,
+  affectsCachedFields,
+  recordInvalidation,
+  cacheStats
+};
@@ -22,6 +22,7 @@ import {
   AiConfig
 } from '@/types/ai';
 import { getGrokService } from './GrokService';
+import { dedupeSuggestions } from '@/lib/taskSimilarity';
 
 export class AiService {
   private config: AiConfig;
@@ -60,19 +61,27 @@ export class AiService {
    * Generate personalized daily task mix based on user patterns
    * Returns 3-5 tasks balanced across categories
    */
-  async generateDailyMix(user: User, existingTasks: Task[]): Promise<AiResponse<AiSuggestion>> {
+  async generateDailyMix(
+    user: User,
+    existingTasks: Task[],
+    options: { signal?: AbortSignal } = {}
+  ): Promise<AiResponse<AiSuggestion>> {
     try {
       // Use Grok if available, otherwise fall back to local generation
       if (this.useGrok) {
         const grokService = getGrokService();
-        return await grokService.generateDailyMix(user, existingTasks);
+        const response = await grokService.generateDailyMix(user, existingTasks, options);
+        // The response may be a shared cache entry - filter into a copy
+        return response.data?.tasks
+          ? { ...response, data: { ...response.data, tasks: dedupeSuggestions(response.data.tasks, existingTasks) } }
+          : response;
       }
       
       // Analyze existing task distribution
       const tasksByCategory = this.analyzeTaskDistribution(existingTasks);
       
       // Determine which categories need attention
-      const suggestions = this.createBalancedSuggestions(user, tasksByCategory);
+      const suggestions = dedupeSuggestions(this.createBalancedSuggestions(user, tasksByCategory), existingTasks);
       
       return {
         data: {
@@ -0,0 +1,49 @@
+/**
+ * Firestore-backed second tier for the AI response cache
+ * Lets a result computed on one server instance serve the others. Opt in with
+ * AI_CACHE_FIRESTORE=true; expired docs are removed by the TTL policy on
+ * `expireAt` (see firestore.indexes.json). Values round-trip through JSON, so
+ * cache plain model output (strings, parsed fields) - never Dates or per-request ids.
+ */
+
+import { CacheTier, getAiResponseCache } from './ResponseCache';
+
+const COLLECTION = 'aiResponseCache';
+
+class FirestoreCacheTier implements CacheTier {
+  // Loaded lazily so importing this module never pulls in the Admin SDK
+  private db = import('@/lib/firebase-admin').then(module => module.adminDb);
+
+  async get(key: string) {
+    const db = await this.db;
+    if (!db) return null;
+
+    const snapshot = await db.collection(COLLECTION).doc(key).get();
+    const data = snapshot.data();
+    if (!data) return null;
+    return { value: JSON.parse(data.payload), expiresAt: data.expireAt.toMillis() };
+  }
+
+  async set(key: string, namespace: string, value: unknown, expiresAt: number) {
+    const db = await this.db;
+    if (!db) return;
+
+    const { Timestamp } = await import('firebase-admin/firestore');
+    await db.collection(COLLECTION).doc(key).set({
+      namespace,
+      payload: JSON.stringify(value),
+      expireAt: Timestamp.fromMillis(expiresAt)
+    });
+  }
+}
+
+let enabled = false;
+
+/**
+ * Attach the Firestore tier to the shared cache (server routes only)
+ */
+export function enableFirestoreCacheTier(): void {
+  if (enabled || process.env.AI_CACHE_FIRESTORE !== 'true') return;
+  getAiResponseCache().setSecondTier(new FirestoreCacheTier());
+  enabled = true;
+}
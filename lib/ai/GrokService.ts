@@ -15,6 +15,7 @@ import {
   AiResponse, 
   AiSuggestion 
 } from '@/types/ai';
+import { getAiResponseCache } from './ResponseCache';
 
 interface GrokMessage {
   role: 'system' | 'user' | 'assistant';
@@ -60,8 +61,14 @@ export class GrokService {
 
   /**
    * Generate daily task suggestions using Grok
+   * Identical concurrent requests share one API call; `signal` lets a caller
+   * stop waiting (the call itself is aborted once nobody is waiting)
    */
-  async generateDailyMix(user: User, existingTasks: Task[]): Promise<AiResponse<AiSuggestion>> {
+  async generateDailyMix(
+    user: User,
+    existingTasks: Task[],
+    options: { signal?: AbortSignal } = {}
+  ): Promise<AiResponse<AiSuggestion>> {
     // Use mock mode in development if API key is missing
     if (this.useMockMode) {
       return this.getMockResponse(user, existingTasks);
@@ -72,28 +79,25 @@ export class GrokService {
     }
 
     try {
-      const prompt = this.buildDailyMixPrompt(user, existingTasks);
-      const response = await this.callGrokAPI({
-        messages: [
-          {
-            role: 'system',
-            content: `You are helping a busy dad manage household tasks to be more present with his family. 
-                     Generate 3-5 balanced task suggestions that help him win at home.
-                     Focus on: relationship, household, baby care, and personal wellness.
-                     Keep tasks specific, actionable, and achievable in under 30 minutes.`
-          },
-          {
-            role: 'user',
-            content: prompt
-          }
-        ],
-        temperature: 0.7,
-        max_tokens: 500
-      });
+      // Everything the prompt depends on, plus the day so the mix refreshes daily
+      const cacheInputs = {
+        model: this.model,
+        userId: user.uid,
+        date: new Date().toISOString().slice(0, 10),
+        userContext: this.getUserContext(user),
+        distribution: this.analyzeTaskDistribution(existingTasks),
+        format: 'reply' // Older entries were parsed responses
+      };
 
-      const suggestions = this.parseGrokResponse(response, user);
+      // Only the reply text is cached; tasks get fresh ids and dates per request
+      const reply = await getAiResponseCache().wrap(
+        'dailyMix',
+        cacheInputs,
+        (signal) => this.requestDailyMix(user, existingTasks, signal),
+        { signal: options.signal }
+      );
       return {
-        data: suggestions
+        data: this.parseGrokResponse(reply, user)
       };
     } catch (error) {
       console.error('Grok API error:', error);
@@ -101,11 +105,38 @@ export class GrokService {
     }
   }
 
+  /**
+   * Ask Grok for today's mix (uncached) - returns the raw reply text
+   */
+  private async requestDailyMix(user: User, existingTasks: Task[], signal?: AbortSignal): Promise<string> {
+    const prompt = this.buildDailyMixPrompt(user, existingTasks);
+    const response = await this.callGrokAPI({
+      messages: [
+        {
+          role: 'system',
+          content: `You are helping a busy dad manage household tasks to be more present with his family. 
+                     Generate 3-5 balanced task suggestions that help him win at home.
+                     Focus on: relationship, household, baby care, and personal wellness.
+                     Keep tasks specific, actionable, and achievable in under 30 minutes.`
+        },
+        {
+          role: 'user',
+          content: prompt
+        }
+      ],
+      temperature: 0.7,
+      max_tokens: 500
+    }, signal);
+
+    return response.choices[0]?.message?.content || '';
+  }
+
   /**
    * Call Grok API
    */
-  private async callGrokAPI(request: GrokRequest): Promise<GrokResponse> {
+  private async callGrokAPI(request: GrokRequest, signal?: AbortSignal): Promise<GrokResponse> {
     const response = await fetch(`${this.baseUrl}/chat/completions`, {
+      signal,
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -156,8 +187,7 @@ Why: [brief reason this helps - supportive tone, no shaming]
   /**
    * Parse Grok's response into structured suggestions
    */
-  private parseGrokResponse(response: GrokResponse, user: User): AiSuggestion {
-    const content = response.choices[0]?.message?.content || '';
+  private parseGrokResponse(content: string, user: User): AiSuggestion {
     const tasks: Task[] = [];
     
     // Parse the text response into structured tasks
@@ -0,0 +1,214 @@
+/**
+ * AI Response Cache - Bounded LRU cache for model output
+ * Keys are a canonical hash of the inputs that shape an answer, so repeat
+ * requests with the same profile, date and task mix skip the model round trip.
+ * An optional second tier (see FirestoreCacheTier) shares entries across
+ * server instances, and concurrent misses for the same key are coalesced
+ * into one call (see SingleFlight).
+ */
+
+import { SingleFlight } from './SingleFlight';
+
+export interface CacheTier {
+  get(key: string): Promise<{ value: unknown; expiresAt: number } | null>;
+  set(key: string, namespace: string, value: unknown, expiresAt: number): Promise<void>;
+}
+
+export interface CacheNamespaceStats {
+  hits: number;
+  secondTierHits: number;
+  misses: number;
+  writes: number;
+  evictions: number;
+}
+
+// Per-endpoint TTLs
+export const AI_CACHE_TTLS = {
+  dailyMix: 6 * 60 * 60 * 1000,              // profile + task mix for the day
+  taskBreakdown: 7 * 24 * 60 * 60 * 1000     // same task title, same steps
+} as const;
+
+export type AiCacheNamespace = keyof typeof AI_CACHE_TTLS;
+
+// Per-endpoint limits for the shared model call
+export const AI_REQUEST_TIMEOUTS: Record<AiCacheNamespace, number> = {
+  dailyMix: 20 * 1000,
+  taskBreakdown: 15 * 1000
+};
+
+export interface AiCacheWrapOptions<T> {
+  shouldCache?: (value: T) => boolean;  // veto results such as fallbacks
+  signal?: AbortSignal;                 // caller cancellation, e.g. request.signal in a route
+  timeoutMs?: number;                   // overrides AI_REQUEST_TIMEOUTS
+}
+
+const MAX_ENTRIES = 500;
+
+interface CacheEntry {
+  namespace: AiCacheNamespace;
+  value: unknown;
+  expiresAt: number;
+}
+
+/**
+ * Stable serialization: object keys sorted, undefined dropped, Dates as ISO
+ */
+export function canonicalize(value: unknown): string {
+  if (value === undefined) return 'null';
+  if (value instanceof Date) return JSON.stringify(value.toISOString());
+  if (value === null || typeof value !== 'object') return JSON.stringify(value);
+  if (Array.isArray(value)) return `[${value.map(canonicalize).join(',')}]`;
+
+  const record = value as Record<string, unknown>;
+  return `{${Object.keys(record)
+    .filter(key => record[key] !== undefined)
+    .sort()
+    .map(key => `${JSON.stringify(key)}:${canonicalize(record[key])}`)
+    .join(',')}}`;
+}
+
+// 53-bit string hash (cyrb53); no Node crypto so the module stays client-safe
+function hash53(input: string, seed: number): string {
+  let h1 = 0xdeadbeef ^ seed;
+  let h2 = 0x41c6ce57 ^ seed;
+  for (let i = 0; i < input.length; i++) {
+    const ch = input.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(36);
+}
+
+export function cacheKey(namespace: AiCacheNamespace, inputs: unknown): string {
+  const canonical = canonicalize(inputs);
+  // Two seeds make accidental collisions between different inputs negligible
+  return `${namespace}_${hash53(canonical, 1)}${hash53(canonical, 2)}`;
+}
+
+function cloneValue<T>(value: T): T {
+  return typeof structuredClone === 'function' ? structuredClone(value) : value;
+}
+
+export class AiResponseCache {
+  private entries = new Map<string, CacheEntry>();
+  private secondTier: CacheTier | null = null;
+  private flights = new SingleFlight();
+  private stats: Partial<Record<AiCacheNamespace, CacheNamespaceStats>> = {};
+
+  constructor(private maxEntries: number = MAX_ENTRIES) {}
+
+  setSecondTier(tier: CacheTier | null): void {
+    this.secondTier = tier;
+  }
+
+  /**
+   * Return the cached answer for `inputs`, or run `compute` and cache its
+   * result. Concurrent misses share one `compute` call, which receives an
+   * AbortSignal for timeouts and cancellation. Errors thrown by `compute`
+   * propagate and are never cached.
+   */
+  async wrap<T>(
+    namespace: AiCacheNamespace,
+    inputs: unknown,
+    compute: (signal: AbortSignal) => Promise<T>,
+    options: AiCacheWrapOptions<T> = {}
+  ): Promise<T> {
+    const { shouldCache = () => true } = options;
+    const key = cacheKey(namespace, inputs);
+    const stats = this.statsFor(namespace);
+    const now = Date.now();
+
+    const local = this.entries.get(key);
+    if (local && local.expiresAt > now) {
+      // Re-insert to mark as most recently used
+      this.entries.delete(key);
+      this.entries.set(key, local);
+      stats.hits++;
+      return cloneValue(local.value as T);
+    }
+    if (local) this.entries.delete(key);
+
+    if (this.secondTier) {
+      try {
+        const remote = await this.secondTier.get(key);
+        if (remote && remote.expiresAt > now) {
+          this.store(key, { namespace, value: remote.value, expiresAt: remote.expiresAt });
+          stats.secondTierHits++;
+          return cloneValue(remote.value as T);
+        }
+      } catch (error) {
+        console.warn('AI cache second tier read failed:', error);
+      }
+    }
+
+    stats.misses++;
+    const value = await this.flights.do(key, async (signal) => {
+      const computed = await compute(signal);
+      // Only the caller that ran compute stores the result
+      if (shouldCache(computed)) {
+        const expiresAt = Date.now() + AI_CACHE_TTLS[namespace];
+        this.store(key, { namespace, value: cloneValue(computed), expiresAt });
+        stats.writes++;
+        this.secondTier?.set(key, namespace, computed, expiresAt).catch(error => {
+          console.warn('AI cache second tier write failed:', error);
+        });
+      }
+      return computed;
+    }, {
+      signal: options.signal,
+      timeoutMs: options.timeoutMs ?? AI_REQUEST_TIMEOUTS[namespace]
+    });
+
+    // Coalesced callers share one result - hand each its own copy
+    return cloneValue(value);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  /**
+   * Hit/miss counters per endpoint plus overall size
+   */
+  snapshot() {
+    const namespaces: Record<string, CacheNamespaceStats & { hitRate: number }> = {};
+    Object.entries(this.stats).forEach(([namespace, stats]) => {
+      const lookups = stats!.hits + stats!.secondTierHits + stats!.misses;
+      namespaces[namespace] = {
+        ...stats!,
+        hitRate: lookups > 0 ? Number(((stats!.hits + stats!.secondTierHits) / lookups).toFixed(3)) : 0
+      };
+    });
+    return { size: this.entries.size, maxEntries: this.maxEntries, namespaces, inFlight: this.flights.snapshot() };
+  }
+
+  private store(key: string, entry: CacheEntry): void {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    while (this.entries.size > this.maxEntries) {
+      const oldestKey = this.entries.keys().next().value as string;
+      const oldest = this.entries.get(oldestKey)!;
+      this.entries.delete(oldestKey);
+      this.statsFor(oldest.namespace).evictions++;
+    }
+  }
+
+  private statsFor(namespace: AiCacheNamespace): CacheNamespaceStats {
+    if (!this.stats[namespace]) {
+      this.stats[namespace] = { hits: 0, secondTierHits: 0, misses: 0, writes: 0, evictions: 0 };
+    }
+    return this.stats[namespace]!;
+  }
+}
+
+// Singleton instance
+let aiResponseCacheInstance: AiResponseCache | null = null;
+
+export function getAiResponseCache(): AiResponseCache {
+  if (!aiResponseCacheInstance) {
+    aiResponseCacheInstance = new AiResponseCache();
+  }
+  return aiResponseCacheInstance;
+}
@@ -0,0 +1,225 @@
+/**
+ * Sidekick Prompt Builder - Token-budgeted chat prompt for /api/sidekick-chat
+ * The persona + task context prefix is built once per task state and reused,
+ * so it stays byte-identical across turns. Recent turns are sent verbatim
+ * within HISTORY_TOKEN_BUDGET; anything older is folded into a rolling
+ * summary that the client stores with the chat and sends back each turn.
+ */
+
+export interface ChatTurn {
+  role: 'user' | 'assistant';
+  content: string;
+}
+
+export interface HistorySummary {
+  text: string;
+  count: number; // leading conversationHistory messages already folded into text
+}
+
+export interface SidekickTask {
+  id?: string;
+  title: string;
+  detail?: string;
+  category?: string;
+  subtasks?: Array<{ title: string; completed?: boolean }>;
+}
+
+export interface SidekickPrompt {
+  messages: Array<{ role: 'system' | 'user' | 'assistant'; content: string }>;
+  summary: HistorySummary;
+  estimatedTokens: number;
+}
+
+const HISTORY_TOKEN_BUDGET = 1200;   // verbatim recent turns
+const SUMMARY_TOKEN_BUDGET = 300;    // rolling summary of older turns
+const MAX_TURN_TOKENS = 600;         // a single oversized turn is truncated to this
+const SUMMARY_LINE_CHARS = 160;
+const PREFIX_CACHE_SIZE = 100;
+
+// ~4 characters per token for English text; close enough for budgeting
+export function estimateTokens(text: string): number {
+  return Math.ceil(text.length / 4);
+}
+
+function truncateToTokens(text: string, maxTokens: number): string {
+  const maxChars = maxTokens * 4;
+  return text.length > maxChars ? `${text.slice(0, maxChars - 1)}…` : text;
+}
+
+const prefixCache = new Map<string, string>();
+
+function prefixKey(task: SidekickTask): string {
+  return JSON.stringify([
+    task.id,
+    task.title,
+    task.detail,
+    task.category,
+    task.subtasks?.map(st => [st.title, !!st.completed])
+  ]);
+}
+
+function renderPrefix(task: SidekickTask): string {
+  const isProject = task.category === 'project' && task.subtasks;
+
+  let taskContext;
+  if (isProject) {
+    const completedSubtasks = task.subtasks!.filter(st => st.completed);
+    const pendingSubtasks = task.subtasks!.filter(st => !st.completed);
+
+    taskContext = `
+CURRENT PROJECT CONTEXT:
+- Project: "${task.title}"
+- Progress: ${completedSubtasks.length}/${task.subtasks!.length} steps completed
+- Remaining steps: ${pendingSubtasks.map(st => st.title).join(', ')}
+- Completed steps: ${completedSubtasks.length > 0 ? completedSubtasks.map(st => st.title).join(', ') : 'None yet'}`;
+  } else {
+    taskContext = `
+CURRENT TASK CONTEXT:
+- Task: "${task.title}"
+- Detail: "${task.detail}"
+- Category: ${task.category}`;
+  }
+
+  return `You are a knowledgeable, supportive dad friend helping another modern father. Your name is "Sidekick" and you talk like a helpful neighbor dad who's been through this before.
+
+${taskContext}
+
+YOUR PERSONALITY:
+- Practical and encouraging
+- Slightly humorous but not cheesy
+- Assumes he's competent but needs guidance
+- Provides specific product recommendations with rough prices
+- Mentions YouTube channels or tutorials when relevant
+- Keeps responses conversational and under 150 words
+- Never condescending - treat him as an equal
+
+RESPONSE GUIDELINES:
+- Start responses naturally (no "As a dad friend..." intros)
+- Include specific brands/products when helpful
+- Mention rough time estimates ("this usually takes about 30 minutes")
+- Suggest backup plans for common problems
+- Reference YouTube, Home Depot, Amazon when relevant
+- Keep it practical and actionable
+${isProject ? '- For projects, focus on the current step or offer advice on tackling remaining steps efficiently' : ''}
+
+USER CONTEXT:
+- Modern father trying to manage home, family, and personal responsibilities
+- Values efficiency and competence
+- Has limited time but wants to do things right
+
+Respond as the Dad Sidekick to help with this ${isProject ? 'project' : 'task'}. Be conversational, practical, and supportive.`;
+}
+
+/**
+ * Persona + task context, cached per task state (LRU-bounded)
+ */
+export function getSidekickPrefix(task: SidekickTask): string {
+  const key = prefixKey(task);
+  let prefix = prefixCache.get(key);
+  if (prefix === undefined) {
+    prefix = renderPrefix(task);
+  } else {
+    prefixCache.delete(key);
+  }
+  prefixCache.set(key, prefix);
+  if (prefixCache.size > PREFIX_CACHE_SIZE) {
+    prefixCache.delete(prefixCache.keys().next().value as string);
+  }
+  return prefix;
+}
+
+// First sentence of a turn, clipped - enough to keep the thread of the conversation
+function summarizeTurn(turn: ChatTurn): string {
+  const flat = turn.content.replace(/\s+/g, ' ').trim();
+  const firstSentence = flat.match(/^.+?[.!?](\s|$)/)?.[0].trim() || flat;
+  const clipped = firstSentence.length > SUMMARY_LINE_CHARS
+    ? `${firstSentence.slice(0, SUMMARY_LINE_CHARS - 1)}…`
+    : firstSentence;
+  return `${turn.role === 'user' ? 'Dad' : 'Sidekick'}: ${clipped}`;
+}
+
+// Append folded turns to the summary, dropping its oldest lines past the budget
+function foldIntoSummary(previous: string, turns: ChatTurn[]): string {
+  const lines = [...(previous ? previous.split('\n') : []), ...turns.map(summarizeTurn)];
+  while (lines.length > 1 && estimateTokens(lines.join('\n')) > SUMMARY_TOKEN_BUDGET) {
+    lines.shift();
+  }
+  return truncateToTokens(lines.join('\n'), SUMMARY_TOKEN_BUDGET);
+}
+
+/**
+ * The summary comes back from the client, so only a well-formed one that
+ * lines up with this history is used, and its text is held to the budget
+ */
+function validSummary(value: unknown, historyLength: number): HistorySummary {
+  const summary = value as Partial<HistorySummary> | null;
+  if (
+    !summary ||
+    typeof summary.text !== 'string' ||
+    !Number.isInteger(summary.count) ||
+    (summary.count as number) < 0 ||
+    (summary.count as number) > historyLength
+  ) {
+    return { text: '', count: 0 };
+  }
+  return { text: truncateToTokens(summary.text, SUMMARY_TOKEN_BUDGET), count: summary.count as number };
+}
+
+function isChatTurn(turn: any): turn is ChatTurn {
+  return (turn?.role === 'user' || turn?.role === 'assistant') && typeof turn.content === 'string';
+}
+
+/**
+ * Build the Grok messages for one turn within the token budget.
+ * `previousSummary` is the summary returned with the last reply; the new one
+ * is returned for the client to keep.
+ */
+export function buildSidekickPrompt({
+  task,
+  conversationHistory = [],
+  message,
+  previousSummary = null
+}: {
+  task: SidekickTask;
+  conversationHistory?: ChatTurn[];
+  message: string;
+  previousSummary?: unknown;
+}): SidekickPrompt {
+  const history = Array.isArray(conversationHistory) ? conversationHistory.filter(isChatTurn) : [];
+
+  // A malformed summary, or one that doesn't line up with this history (e.g. a reset chat), is dropped
+  const prior = validSummary(previousSummary, history.length);
+  const unsummarized = history.slice(prior.count);
+
+  // Walk back from the newest turn until the verbatim budget is spent
+  let keepFrom = unsummarized.length;
+  let historyTokens = 0;
+  while (keepFrom > 0) {
+    const turnTokens = Math.min(estimateTokens(unsummarized[keepFrom - 1].content), MAX_TURN_TOKENS);
+    if (historyTokens + turnTokens > HISTORY_TOKEN_BUDGET) break;
+    historyTokens += turnTokens;
+    keepFrom--;
+  }
+
+  const folded = unsummarized.slice(0, keepFrom);
+  const summary: HistorySummary = folded.length > 0
+    ? { text: foldIntoSummary(prior.text, folded), count: prior.count + folded.length }
+    : prior;
+
+  const prefix = getSidekickPrefix(task);
+  const messages: SidekickPrompt['messages'] = [{ role: 'system', content: prefix }];
+  if (summary.text) {
+    // Client-supplied, so it goes in as context from the user, never with system authority
+    messages.push({ role: 'user', content: `For context, a summary of earlier in this conversation:\n${summary.text}` });
+  }
+  unsummarized.slice(keepFrom).forEach(turn => {
+    messages.push({ role: turn.role, content: truncateToTokens(turn.content, MAX_TURN_TOKENS) });
+  });
+  messages.push({ role: 'user', content: message });
+
+  return {
+    messages,
+    summary,
+    estimatedTokens: messages.reduce((sum, m) => sum + estimateTokens(m.content), 0)
+  };
+}
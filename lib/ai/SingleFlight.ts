@@ -0,0 +1,131 @@
+/**
+ * Single-flight coalescing for AI requests
+ * Concurrent callers with the same key share one in-flight promise, so a
+ * double tap or two pages mounting together cost a single model call. The
+ * shared work gets an AbortSignal that fires on timeout, or once every
+ * caller waiting on it has cancelled.
+ */
+
+export class AiRequestTimeoutError extends Error {
+  constructor(timeoutMs: number) {
+    super(`AI request timed out after ${timeoutMs}ms`);
+    this.name = 'AiRequestTimeoutError';
+  }
+}
+
+export interface SingleFlightOptions {
+  timeoutMs?: number;     // abort the shared work after this long
+  signal?: AbortSignal;   // this caller's cancellation; others keep waiting
+}
+
+interface Flight {
+  promise: Promise<unknown>;
+  controller: AbortController;
+  waiters: number;
+}
+
+const DEFAULT_TIMEOUT_MS = 30 * 1000;
+
+function abortReason(signal: AbortSignal): Error {
+  return signal.reason instanceof Error ? signal.reason : new Error('AI request cancelled');
+}
+
+// Reject as soon as `signal` aborts, even if `promise` ignores it
+function raceAbort<T>(promise: Promise<T>, signal: AbortSignal | undefined, onAbort?: () => void): Promise<T> {
+  if (!signal) return promise;
+  if (signal.aborted) {
+    onAbort?.();
+    return Promise.reject(abortReason(signal));
+  }
+
+  return new Promise<T>((resolve, reject) => {
+    const abort = () => {
+      onAbort?.();
+      reject(abortReason(signal));
+    };
+    signal.addEventListener('abort', abort, { once: true });
+    promise.then(
+      value => {
+        signal.removeEventListener('abort', abort);
+        resolve(value);
+      },
+      error => {
+        signal.removeEventListener('abort', abort);
+        reject(error);
+      }
+    );
+  });
+}
+
+export class SingleFlight {
+  private inFlight = new Map<string, Flight>();
+  private stats = { started: 0, coalesced: 0, timedOut: 0, cancelled: 0 };
+
+  /**
+   * Run `fn` for `key`, or join the call already in flight for it.
+   * Errors are shared by every waiter and never remembered - the next call
+   * after a failure starts fresh.
+   */
+  do<T>(key: string, fn: (signal: AbortSignal) => Promise<T>, options: SingleFlightOptions = {}): Promise<T> {
+    let flight = this.inFlight.get(key);
+
+    if (flight) {
+      this.stats.coalesced++;
+    } else {
+      flight = this.start(key, fn, options.timeoutMs ?? DEFAULT_TIMEOUT_MS);
+    }
+
+    const joined = flight;
+    joined.waiters++;
+    let left = false;
+    const leave = () => {
+      if (left) return;
+      left = true;
+      joined.waiters--;
+    };
+
+    return raceAbort(joined.promise as Promise<T>, options.signal, () => {
+      leave();
+      // Nobody is waiting any more - stop the model call
+      if (joined.waiters === 0 && !joined.controller.signal.aborted) {
+        this.stats.cancelled++;
+        joined.controller.abort(new Error('AI request cancelled'));
+        this.finish(key, joined);
+      }
+    }).finally(leave);
+  }
+
+  snapshot() {
+    return { ...this.stats, inFlight: this.inFlight.size };
+  }
+
+  private start<T>(key: string, fn: (signal: AbortSignal) => Promise<T>, timeoutMs: number): Flight {
+    const controller = new AbortController();
+    const timer = setTimeout(() => {
+      this.stats.timedOut++;
+      controller.abort(new AiRequestTimeoutError(timeoutMs));
+    }, timeoutMs);
+
+    const flight: Flight = { promise: Promise.resolve(), controller, waiters: 0 };
+    const run = Promise.resolve().then(() => {
+      // Every caller may have left before the work got going
+      if (controller.signal.aborted) throw abortReason(controller.signal);
+      return fn(controller.signal);
+    });
+    flight.promise = raceAbort(run, controller.signal)
+      .finally(() => {
+        clearTimeout(timer);
+        this.finish(key, flight);
+      });
+    // Waiters handle rejection; this keeps an abandoned flight from reporting unhandled
+    flight.promise.catch(() => {});
+
+    this.inFlight.set(key, flight);
+    this.stats.started++;
+    return flight;
+  }
+
+  private finish(key: string, flight: Flight): void {
+    if (this.inFlight.get(key) === flight) this.inFlight.delete(key);
+  }
+}
@@ -0,0 +1,100 @@
+/**
+ * Boundary Scheduler - one timer for all time-based refreshes
+ * Suggestions only depend on the clock through the local hour, the day and
+ * weekday vs weekend, and all of those change on the hour. So instead of
+ * polling on fixed intervals, a single timeout is armed for the next top of
+ * the hour and listeners are told which boundaries were crossed.
+ *
+ * While the page is hidden the timer is off; when it becomes visible again,
+ * whatever was crossed in the meantime is delivered at once, coalesced.
+ */
+
+const BOUNDARY_SLACK_MS = 250; // Land just after the boundary, never before
+
+const listeners = new Set();
+let timer = null;
+let last = null;
+
+function snapshot(now) {
+  return {
+    hour: now.getHours(),
+    day: `${now.getFullYear()}-${now.getMonth()}-${now.getDate()}`,
+    isWeekend: now.getDay() === 0 || now.getDay() === 6
+  };
+}
+
+function isHidden() {
+  return typeof document !== 'undefined' && document.visibilityState === 'hidden';
+}
+
+/**
+ * Milliseconds from `now` to the next local top of the hour
+ */
+export function msUntilNextHour(now = new Date()) {
+  const next = new Date(now);
+  next.setMinutes(60, 0, 0);
+  return next - now;
+}
+
+function check() {
+  const current = snapshot(new Date());
+  const changes = {
+    dayChanged: current.day !== last.day,
+    hourChanged: current.hour !== last.hour || current.day !== last.day,
+    weekendChanged: current.isWeekend !== last.isWeekend
+  };
+  last = current;
+
+  if (!changes.hourChanged) return; // Woke early, nothing crossed yet
+  listeners.forEach(listener => {
+    Promise.resolve()
+      .then(() => listener(changes))
+      .catch(error => console.error('Boundary listener failed:', error));
+  });
+}
+
+function arm() {
+  clearTimeout(timer);
+  timer = null;
+  if (!listeners.size || isHidden()) return;
+
+  timer = setTimeout(() => {
+    check();
+    arm();
+  }, msUntilNextHour() + BOUNDARY_SLACK_MS);
+}
+
+function handleVisibilityChange() {
+  if (isHidden()) {
+    clearTimeout(timer);
+    timer = null;
+    return;
+  }
+  // Catch up on anything crossed while hidden, then wait for the next one
+  check();
+  arm();
+}
+
+/**
+ * Call `listener({ hourChanged, dayChanged, weekendChanged })` whenever the
+ * local hour changes. Returns an unsubscribe function.
+ */
+export function subscribeToTimeBoundaries(listener) {
+  if (!listeners.size) {
+    last = snapshot(new Date());
+    if (typeof document !== 'undefined') {
+      document.addEventListener('visibilitychange', handleVisibilityChange);
+    }
+  }
+  listeners.add(listener);
+  arm();
+
+  return () => {
+    if (!listeners.delete(listener) || listeners.size) return;
+    clearTimeout(timer);
+    timer = null;
+    if (typeof document !== 'undefined') {
+      document.removeEventListener('visibilitychange', handleVisibilityChange);
+    }
+  };
+}
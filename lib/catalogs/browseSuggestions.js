@@ -0,0 +1,70 @@
+// Static browse suggestions by category, the fallback when personalized
+// suggestions fail; loaded on demand by lib/aiMentor.js
+const BROWSE_SUGGESTIONS = {
+  'seasonal': [
+    { title: 'Check holiday travel prices', description: 'Prices jump significantly after October', category: 'personal', priority: 'high', timeEstimate: '10 minutes', isSeasonal: true },
+    { title: 'Schedule flu shots', description: 'Beat the rush before flu season peaks', category: 'health', priority: 'medium', timeEstimate: '5 minutes', isSeasonal: true },
+    { title: 'Test heating system', description: 'Before you really need it', category: 'household', priority: 'medium', timeEstimate: '15 minutes', isSeasonal: true },
+    { title: 'Order holiday cards', description: 'Good ones sell out early', category: 'personal', priority: 'low', timeEstimate: '10 minutes', isSeasonal: true },
+    { title: 'Book end-of-year appointments', description: 'Dentist, eye doctor - use those benefits', category: 'health', priority: 'medium', timeEstimate: '10 minutes', isSeasonal: true },
+    { title: 'Plan gift budget', description: 'Avoid December panic spending', category: 'personal', priority: 'medium', timeEstimate: '20 minutes', isSeasonal: true }
+  ],
+  'quick-wins': [
+    { title: 'Delete 10 old photos', description: 'Free up phone storage instantly', category: 'personal', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Unsubscribe from 3 emails', description: 'Clean up that inbox', category: 'personal', priority: 'low', timeEstimate: '3 minutes' },
+    { title: 'Wipe down kitchen counters', description: 'Quick reset that feels good', category: 'household', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Make tomorrow\'s coffee tonight', description: 'Future you will thank you', category: 'household', priority: 'low', timeEstimate: '1 minute' },
+    { title: 'Put phone in another room', description: 'Instant focus boost', category: 'personal', priority: 'low', timeEstimate: '30 seconds' },
+    { title: 'Water your plants', description: 'They\'re counting on you', category: 'household', priority: 'low', timeEstimate: '2 minutes' }
+  ],
+  'prevention': [
+    { title: 'Check tire pressure', description: 'Prevents uneven wear and blowouts', category: 'personal', priority: 'medium', timeEstimate: '10 minutes', prevents: 'Expensive tire replacement' },
+    { title: 'Clean dryer vent', description: 'Fire prevention that takes minutes', category: 'household', priority: 'high', timeEstimate: '15 minutes', prevents: 'House fires' },
+    { title: 'Update important passwords', description: 'Before you get hacked', category: 'personal', priority: 'medium', timeEstimate: '15 minutes', prevents: 'Identity theft' },
+    { title: 'Check smoke detector batteries', description: 'Better safe than sorry', category: 'household', priority: 'high', timeEstimate: '5 minutes', prevents: 'Fire danger' },
+    { title: 'Back up phone photos', description: 'Before they\'re gone forever', category: 'personal', priority: 'medium', timeEstimate: '10 minutes', prevents: 'Lost memories' },
+    { title: 'Schedule car maintenance', description: 'Oil change saves your engine', category: 'personal', priority: 'medium', timeEstimate: '5 minutes', prevents: 'Expensive repairs' }
+  ],
+  'personal': [
+    { title: 'Drink a full glass of water', description: 'Start hydrating right now', category: 'personal', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Take 10 deep breaths', description: 'Reset your nervous system', category: 'personal', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Schedule doctor checkup', description: 'When did you last go?', category: 'personal', priority: 'medium', timeEstimate: '5 minutes' },
+    { title: 'Update LinkedIn profile', description: 'Keep career options open', category: 'personal', priority: 'low', timeEstimate: '15 minutes' },
+    { title: 'Listen to 1 podcast episode', description: 'Learn something new today', category: 'personal', priority: 'low', timeEstimate: '30 minutes' },
+    { title: 'Read for 15 minutes', description: 'Books make you smarter', category: 'personal', priority: 'low', timeEstimate: '15 minutes' }
+  ],
+  'household': [
+    { title: 'Run one load of laundry', description: 'Just start it, that\'s all', category: 'household', priority: 'medium', timeEstimate: '3 minutes' },
+    { title: 'Empty the dishwasher', description: 'Future cooking-you will thank you', category: 'household', priority: 'low', timeEstimate: '5 minutes' },
+    { title: 'Make your bed', description: 'Instant bedroom upgrade', category: 'household', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Vacuum one room', description: 'Pick the messiest one', category: 'household', priority: 'medium', timeEstimate: '10 minutes' },
+    { title: 'Organize one drawer', description: 'Start with the junk drawer', category: 'household', priority: 'low', timeEstimate: '10 minutes' },
+    { title: 'Take out the trash', description: 'Before it overflows', category: 'household', priority: 'medium', timeEstimate: '2 minutes' }
+  ],
+  'kids': [
+    { title: 'Plan tomorrow\'s outfit', description: 'Avoid morning meltdowns', category: 'baby', priority: 'medium', timeEstimate: '5 minutes' },
+    { title: 'Read one story together', description: 'Connection that matters', category: 'baby', priority: 'high', timeEstimate: '10 minutes' },
+    { title: 'Ask about their favorite part of today', description: 'Actually listen to the answer', category: 'baby', priority: 'high', timeEstimate: '5 minutes' },
+    { title: 'Plan a fun weekend activity', description: 'Something they\'ll remember', category: 'baby', priority: 'medium', timeEstimate: '10 minutes' },
+    { title: 'Check backpack for important papers', description: 'Stay in the loop', category: 'baby', priority: 'medium', timeEstimate: '3 minutes' },
+    { title: 'Take a silly photo together', description: 'Capture the everyday joy', category: 'baby', priority: 'low', timeEstimate: '2 minutes' }
+  ],
+  'relationships': [
+    { title: 'Text an old friend', description: 'Just "thinking of you" works', category: 'relationship', priority: 'low', timeEstimate: '2 minutes' },
+    { title: 'Plan a date night', description: 'Even if it\'s just takeout at home', category: 'relationship', priority: 'medium', timeEstimate: '10 minutes' },
+    { title: 'Call your parents', description: 'They miss your voice', category: 'relationship', priority: 'medium', timeEstimate: '15 minutes' },
+    { title: 'Ask about their day first', description: 'Before talking about yours', category: 'relationship', priority: 'high', timeEstimate: '30 seconds', prevents: 'Feeling like roommates' },
+    { title: 'Give a real hug', description: 'Not while multitasking', category: 'relationship', priority: 'medium', timeEstimate: '10 seconds' },
+    { title: 'Send a funny meme', description: 'To someone who needs a smile', category: 'relationship', priority: 'low', timeEstimate: '1 minute' }
+  ],
+  'projects': [
+    { title: 'Organize the garage', description: 'Break it into weekend chunks - she\'ll be so impressed', category: 'home_projects', priority: 'medium', timeEstimate: 'Multiple weekends', isProject: true },
+    { title: 'Install closet shelving', description: 'Double the storage space in one weekend', category: 'home_projects', priority: 'medium', timeEstimate: '4-6 hours', isProject: true },
+    { title: 'Paint the bedroom', description: 'Fresh look, better sleep environment', category: 'home_projects', priority: 'low', timeEstimate: '2 weekends', isProject: true },
+    { title: 'Fix squeaky door hinges', description: 'All of them - you know which ones', category: 'home_projects', priority: 'low', timeEstimate: '1 hour', isProject: true },
+    { title: 'Install smart thermostat', description: 'Save money and look tech-savvy', category: 'home_projects', priority: 'medium', timeEstimate: '2 hours', isProject: true },
+    { title: 'Weatherstrip doors and windows', description: 'Draft-proof before winter hits', category: 'home_projects', priority: 'medium', timeEstimate: '3-4 hours', isProject: true }
+  ]
+};
+
+export default BROWSE_SUGGESTIONS;
@@ -0,0 +1,35 @@
+// Emergency mode tasks for overwhelmed days, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'emergency_001',
+    title: 'Kids fed and safe',
+    detail: 'That\'s enough for today',
+    category: 'survival',
+    priority: 'emergency'
+  },
+  {
+    id: 'emergency_002', 
+    title: 'Order pizza',
+    detail: 'No cooking tonight',
+    category: 'survival',
+    priority: 'emergency'
+  },
+  {
+    id: 'emergency_003',
+    title: 'Early bedtime for everyone',
+    detail: 'Including you',
+    category: 'survival',
+    priority: 'emergency'
+  },
+  {
+    id: 'emergency_004',
+    title: 'Try again tomorrow',
+    detail: 'Today was hard, tomorrow is fresh',
+    category: 'survival',
+    priority: 'emergency'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,132 @@
+// Essential tasks, loaded on demand by lib/seasonalTasks.ts
+import type { EssentialTasks, SeasonalTask } from '../seasonalTasks';
+
+// The 80/20 principle: These prevent 80% of problems
+const DAILY_ESSENTIALS: SeasonalTask[] = [
+  {
+    id: 'daily_001',
+    title: 'Ask about her day first',
+    detail: 'Before talking about yours - she feels seen',
+    category: 'relationship',
+    priority: 'disaster-prevention',
+    timeEstimate: '30 seconds',
+    prevents: 'Roommate syndrome'
+  },
+  {
+    id: 'daily_002', 
+    title: 'Real kiss hello/goodbye',
+    detail: 'Not while doing something else',
+    category: 'relationship',
+    priority: 'disaster-prevention',
+    timeEstimate: '5 seconds',
+    prevents: 'Physical disconnection'
+  },
+  {
+    id: 'daily_003',
+    title: 'Take something off her plate',
+    detail: 'Like "I\'ll handle bedtime tonight"',
+    category: 'relationship', 
+    priority: 'disaster-prevention',
+    timeEstimate: '2 minutes',
+    prevents: 'Partner burnout'
+  }
+];
+
+const WEEKLY_ESSENTIALS: SeasonalTask[] = [
+  {
+    id: 'weekly_001',
+    title: 'Give her 1 hour alone',
+    detail: 'Take kids out Saturday morning',
+    category: 'relationship',
+    priority: 'disaster-prevention', 
+    timeEstimate: '1 hour',
+    prevents: 'Burnout and resentment'
+  },
+  {
+    id: 'weekly_002',
+    title: 'Plan something for next week',
+    detail: 'Date, family activity, anything',
+    category: 'relationship',
+    priority: 'disaster-prevention',
+    timeEstimate: '5 minutes',
+    prevents: 'Relationship drift'
+  },
+  {
+    id: 'weekly_003', 
+    title: 'Check in with one friend',
+    detail: 'Text "How\'s it going?"',
+    category: 'personal',
+    priority: 'sanity-maintenance',
+    timeEstimate: '2 minutes',
+    prevents: 'Social isolation'
+  }
+];
+
+const MONTHLY_ESSENTIALS: SeasonalTask[] = [
+  {
+    id: 'monthly_001',
+    title: 'Look under all sinks',
+    detail: '30 seconds per sink, check for leaks',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '5 minutes',
+    prevents: '$5,000 water damage'
+  },
+  {
+    id: 'monthly_002',
+    title: 'Check credit card charges', 
+    detail: 'Scan for fraud or forgotten subscriptions',
+    category: 'admin',
+    priority: 'disaster-prevention',
+    timeEstimate: '3 minutes',
+    prevents: 'Fraud and surprise charges'
+  },
+  {
+    id: 'monthly_003',
+    title: 'Schedule something medical',
+    detail: 'Yours or kids\', stay ahead of problems',
+    category: 'health',
+    priority: 'disaster-prevention', 
+    timeEstimate: '5 minutes',
+    prevents: 'Health emergencies'
+  }
+];
+
+const QUARTERLY_ESSENTIALS: SeasonalTask[] = [
+  {
+    id: 'quarterly_001',
+    title: 'Change HVAC filter',
+    detail: 'Every 3 months prevents AC death',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '5 minutes', 
+    prevents: 'AC repair ($3,000+)'
+  },
+  {
+    id: 'quarterly_002',
+    title: 'Test sump pump',
+    detail: 'Pour water in pit - if you have one',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '2 minutes',
+    prevents: 'Basement flooding'
+  },
+  {
+    id: 'quarterly_003',
+    title: 'Clean gutters',
+    detail: 'Or pay someone $150 to do it',
+    category: 'maintenance', 
+    priority: 'disaster-prevention',
+    timeEstimate: '1 hour',
+    prevents: 'Foundation damage'
+  }
+];
+
+const essentials: EssentialTasks = {
+  daily: DAILY_ESSENTIALS,
+  weekly: WEEKLY_ESSENTIALS,
+  monthly: MONTHLY_ESSENTIALS,
+  quarterly: QUARTERLY_ESSENTIALS
+};
+
+export default essentials;
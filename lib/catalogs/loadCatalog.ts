@@ -0,0 +1,17 @@
+/**
+ * Catalog loader - static task catalogs live in their own chunks under
+ * lib/catalogs and are imported on first use. Each chunk is loaded once per
+ * process (or page); a failed chunk load is forgotten so the next call retries.
+ */
+
+const loaded = new Map<string, Promise<unknown>>();
+
+export function loadCatalog<T>(key: string, loader: () => Promise<{ default: T }>): Promise<T> {
+  let catalog = loaded.get(key) as Promise<T> | undefined;
+  if (!catalog) {
+    catalog = loader().then(module => module.default);
+    catalog.catch(() => loaded.delete(key));
+    loaded.set(key, catalog);
+  }
+  return catalog;
+}
@@ -0,0 +1,34 @@
+// April seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'apr_001',
+    title: 'Clean gutters',
+    detail: 'After pollen season, before summer storms',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '1 hour or hire someone',
+    deadline: 'Before May storms'
+  },
+  {
+    id: 'apr_002',
+    title: 'Sign up for swim lessons',
+    detail: 'Summer spots fill up fast',
+    category: 'kids',
+    priority: 'time-sensitive',
+    timeEstimate: '10 minutes',
+    deadline: 'End of April'
+  },
+  {
+    id: 'apr_003',
+    title: 'Mother\'s Day planning',
+    detail: 'Card, gift, restaurant reservation',
+    category: 'relationship',
+    priority: 'disaster-prevention',
+    timeEstimate: '15 minutes',
+    deadline: 'Early April'
+  }
+];
+
+export default tasks;
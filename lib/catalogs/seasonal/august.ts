@@ -0,0 +1,34 @@
+// August seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'aug_001',
+    title: 'School supplies shopping',
+    detail: 'Before the back-to-school rush',
+    category: 'kids',
+    priority: 'time-sensitive',
+    timeEstimate: '1 hour',
+    deadline: 'Early August'
+  },
+  {
+    id: 'aug_002',
+    title: 'Update school emergency cards',
+    detail: 'New teacher, new contact cards needed',
+    category: 'kids',
+    priority: 'deadline',
+    timeEstimate: '10 minutes',
+    deadline: 'Before school starts'
+  },
+  {
+    id: 'aug_003',
+    title: 'Fall clothes check',
+    detail: 'Kids grew all summer - what fits?',
+    category: 'kids',
+    priority: 'planning',
+    timeEstimate: '15 minutes',
+    deadline: 'End of August'
+  }
+];
+
+export default tasks;
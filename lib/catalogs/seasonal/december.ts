@@ -0,0 +1,34 @@
+// December seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'dec_001',
+    title: 'Summer camp research',
+    detail: 'For January registration opening',
+    category: 'kids',
+    priority: 'planning',
+    timeEstimate: '20 minutes',
+    deadline: 'End of December'
+  },
+  {
+    id: 'dec_002',
+    title: 'Update insurance needs',
+    detail: 'New year changes coming up',
+    category: 'admin',
+    priority: 'planning',
+    timeEstimate: '15 minutes',
+    deadline: 'Before year end'
+  },
+  {
+    id: 'dec_003',
+    title: 'Plan next year\'s vacation time',
+    detail: 'Coordinate with partner early',
+    category: 'planning',
+    priority: 'planning',
+    timeEstimate: '10 minutes',
+    deadline: 'End of December'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// February seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'feb_001',
+    title: 'Book spring break travel',
+    detail: 'If going anywhere - prices jumping',
+    category: 'planning',
+    priority: 'time-sensitive',
+    timeEstimate: '20 minutes',
+    deadline: 'Mid February'
+  },
+  {
+    id: 'feb_002',
+    title: 'Schedule AC service',
+    detail: 'For May appointment before heat hits',
+    category: 'maintenance',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'End of February'
+  },
+  {
+    id: 'feb_003',
+    title: 'Preschool tours',
+    detail: 'For fall enrollment - book tours now',
+    category: 'kids',
+    priority: 'time-sensitive', 
+    timeEstimate: '10 minutes to schedule',
+    deadline: 'End of February'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// January seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'jan_001',
+    title: 'Register for summer camps',
+    detail: 'Opens now, fills fast - check community centers',
+    category: 'kids',
+    priority: 'time-sensitive',
+    timeEstimate: '15 minutes',
+    deadline: 'End of January'
+  },
+  {
+    id: 'jan_002', 
+    title: 'Plan Valentine\'s Day',
+    detail: 'Restaurant reservations book up early',
+    category: 'relationship',
+    priority: 'time-sensitive',
+    timeEstimate: '10 minutes',
+    deadline: 'Mid January'
+  },
+  {
+    id: 'jan_003',
+    title: 'Start tax document gathering',
+    detail: 'W2s, receipts - less stress in April',
+    category: 'admin',
+    priority: 'planning',
+    timeEstimate: '5 minutes setup',
+    deadline: 'End of January'
+  }
+];
+
+export default tasks;
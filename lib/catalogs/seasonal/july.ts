@@ -0,0 +1,34 @@
+// July seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'jul_001',
+    title: 'School registration tasks',
+    detail: 'Avoid the August panic rush',
+    category: 'kids',
+    priority: 'time-sensitive',
+    timeEstimate: '20 minutes',
+    deadline: 'End of July'
+  },
+  {
+    id: 'jul_002',
+    title: 'Halloween costume ideas',
+    detail: 'Good ones sell out by September',
+    category: 'kids',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'End of July'
+  },
+  {
+    id: 'jul_003',
+    title: 'Schedule fall dentist',
+    detail: 'During school breaks when possible',
+    category: 'health',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'End of July'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// June seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'jun_001', 
+    title: 'Fall activity registration',
+    detail: 'Soccer, dance, gymnastics - opens now',
+    category: 'kids',
+    priority: 'time-sensitive',
+    timeEstimate: '15 minutes',
+    deadline: 'Mid June'
+  },
+  {
+    id: 'jun_002',
+    title: 'Back-to-school planning',
+    detail: 'Supplies lists usually come out now',
+    category: 'kids', 
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'End of June'
+  },
+  {
+    id: 'jun_003',
+    title: 'Check vacation time',
+    detail: 'Use it or lose it policies kick in',
+    category: 'personal',
+    priority: 'planning',
+    timeEstimate: '2 minutes',
+    deadline: 'Mid June'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// March seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'mar_001',
+    title: 'Summer camp payment',
+    detail: 'Usually due now to secure spot',
+    category: 'kids',
+    priority: 'deadline',
+    timeEstimate: '5 minutes',
+    deadline: 'Check camp deadlines'
+  },
+  {
+    id: 'mar_002',
+    title: 'Test sump pump',
+    detail: 'Before spring rain season starts',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '2 minutes',
+    deadline: 'Before April rains'
+  },
+  {
+    id: 'mar_003', 
+    title: 'Change smoke detector batteries',
+    detail: 'Spring forward = battery change reminder',
+    category: 'safety',
+    priority: 'disaster-prevention',
+    timeEstimate: '10 minutes',
+    deadline: 'Daylight saving weekend'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// May seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'may_001',
+    title: 'Update emergency contacts',
+    detail: 'For summer babysitters and camps',
+    category: 'safety',
+    priority: 'planning',
+    timeEstimate: '10 minutes',
+    deadline: 'Before summer starts'
+  },
+  {
+    id: 'may_002',
+    title: 'Check car AC',
+    detail: 'Before road trip season starts',
+    category: 'maintenance',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'Before summer trips'
+  },
+  {
+    id: 'may_003',
+    title: 'Plan Father\'s Day hints',
+    detail: 'Tell your wife what you actually want',
+    category: 'personal',
+    priority: 'planning',
+    timeEstimate: '2 minutes',
+    deadline: 'Mid May'
+  }
+];
+
+export default tasks;
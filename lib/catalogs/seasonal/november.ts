@@ -0,0 +1,34 @@
+// November seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'nov_001',
+    title: 'Black Friday planning',
+    detail: 'Big purchases only - make list now',
+    category: 'planning',
+    priority: 'planning',
+    timeEstimate: '10 minutes',
+    deadline: 'Before Thanksgiving'
+  },
+  {
+    id: 'nov_002',
+    title: 'Year-end FSA spending',
+    detail: 'Use it or lose it deadline approaching',
+    category: 'admin',
+    priority: 'deadline',
+    timeEstimate: '10 minutes',
+    deadline: 'Check your deadline'
+  },
+  {
+    id: 'nov_003',
+    title: 'Teacher holiday gifts',
+    detail: 'Before December chaos hits',
+    category: 'kids',
+    priority: 'planning',
+    timeEstimate: '15 minutes',
+    deadline: 'End of November'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// October seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'oct_001',
+    title: 'Holiday card photos', 
+    detail: 'When leaves look good, before everyone books',
+    category: 'planning',
+    priority: 'time-sensitive',
+    timeEstimate: '20 minutes to schedule',
+    deadline: 'Mid October'
+  },
+  {
+    id: 'oct_002',
+    title: 'Start holiday gift list',
+    detail: 'Add ideas as you see them throughout season',
+    category: 'planning',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'Early October'
+  },
+  {
+    id: 'oct_003',
+    title: 'Clean gutters again',
+    detail: 'After leaves fall, before winter storms',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '1 hour',
+    deadline: 'End of October'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,34 @@
+// September seasonal tasks, loaded on demand by lib/seasonalTasks.ts
+import type { SeasonalTask } from '../../seasonalTasks';
+
+const tasks: SeasonalTask[] = [
+  {
+    id: 'sep_001',
+    title: 'Holiday travel booking',
+    detail: 'Prices jump in October for Thanksgiving/Christmas',
+    category: 'planning',
+    priority: 'time-sensitive',
+    timeEstimate: '30 minutes',
+    deadline: 'Mid September'
+  },
+  {
+    id: 'sep_002',
+    title: 'Winterize outdoor faucets',
+    detail: 'Before first freeze prevents pipe burst',
+    category: 'maintenance',
+    priority: 'disaster-prevention',
+    timeEstimate: '15 minutes',
+    deadline: 'End of September'
+  },
+  {
+    id: 'sep_003',
+    title: 'Schedule heating service',
+    detail: 'Before you need it and everyone calls',
+    category: 'maintenance',
+    priority: 'planning',
+    timeEstimate: '5 minutes',
+    deadline: 'End of September'
+  }
+];
+
+export default tasks;
@@ -0,0 +1,31 @@
+/**
+ * Chat Usage - the one monthly Sidekick chat meter
+ * chatUsage/{userId}_{YYYY-MM} counts a user's chats for a UTC calendar
+ * month. /api/sidekick-chat reserves and refunds against it; the client only
+ * reads it to show what's left, so both sides always agree.
+ */
+
+export const CHAT_USAGE_COLLECTION = 'chatUsage';
+
+// Monthly Sidekick chats per tier
+export const MONTHLY_CHAT_LIMITS = {
+  free: 3,
+  premium: 100,
+  family: 150
+};
+
+export function monthlyChatLimit(tier) {
+  return MONTHLY_CHAT_LIMITS[tier] ?? MONTHLY_CHAT_LIMITS.free;
+}
+
+export function isUnlimitedTesting() {
+  return process.env.NODE_ENV === 'development' || process.env.NEXT_PUBLIC_UNLIMITED_TESTING === 'true';
+}
+
+/**
+ * Usage doc id for the UTC month containing `now`
+ */
+export function monthlyUsageKey(userId, now = new Date()) {
+  const monthKey = `${now.getUTCFullYear()}-${(now.getUTCMonth() + 1).toString().padStart(2, '0')}`;
+  return { monthKey, usageId: `${userId}_${monthKey}` };
+}
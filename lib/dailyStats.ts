@@ -0,0 +1,162 @@
+/**
+ * Daily Stats - per-day completion rollups
+ * users/{uid}/dailyStats/{YYYY-MM-DD} (the user's local date) holds that
+ * day's completions by hour and category plus the streak running through it.
+ * The rollup is written in the same transaction that completes or
+ * uncompletes a task, so stats, insights, streaks and the mentor read one or
+ * two small docs instead of counting tasks.
+ */
+
+import {
+  collection,
+  doc,
+  documentId,
+  getDocs,
+  increment,
+  query,
+  serverTimestamp,
+  where,
+  DocumentReference,
+  Firestore,
+  Query,
+  Transaction
+} from 'firebase/firestore';
+import { UserId } from '../types/models';
+
+export interface DailyStats {
+  date: string;                          // YYYY-MM-DD, local
+  completed: number;
+  byHour: Record<string, number>;        // "8": 2
+  byCategory: Record<string, number>;    // household: 3
+  streak: number;                        // Consecutive days with completions, through this one
+}
+
+export interface RecentDailyStats {
+  today: DailyStats | null;
+  yesterday: DailyStats | null;
+}
+
+// A completion (+1) or uncompletion (-1) to roll up
+export interface CompletionChange {
+  userId: UserId;
+  category?: string;
+  at: Date;     // When it was completed, local time
+  delta: 1 | -1;
+}
+
+/**
+ * Local calendar date as YYYY-MM-DD
+ */
+export function localDateKey(date: Date = new Date()): string {
+  const month = String(date.getMonth() + 1).padStart(2, '0');
+  const day = String(date.getDate()).padStart(2, '0');
+  return `${date.getFullYear()}-${month}-${day}`;
+}
+
+export function previousDay(date: Date): Date {
+  const previous = new Date(date);
+  previous.setDate(previous.getDate() - 1);
+  return previous;
+}
+
+export function dailyStatsRef(db: Firestore, userId: UserId, date: Date): DocumentReference {
+  return doc(db, 'users', userId, 'dailyStats', localDateKey(date));
+}
+
+/**
+ * Rollups from `from` (local date) onwards, oldest first
+ */
+export function dailyStatsSince(db: Firestore, userId: UserId, from: Date): Query {
+  return query(
+    collection(db, 'users', userId, 'dailyStats'),
+    where(documentId(), '>=', localDateKey(from))
+  );
+}
+
+/**
+ * Rollups for `from`..`to` inclusive, keyed by date
+ */
+export async function getDailyStatsRange(db: Firestore, userId: UserId, from: Date, to: Date): Promise<Record<string, DailyStats>> {
+  const snapshot = await getDocs(query(
+    collection(db, 'users', userId, 'dailyStats'),
+    where(documentId(), '>=', localDateKey(from)),
+    where(documentId(), '<=', localDateKey(to))
+  ));
+  return Object.fromEntries(snapshot.docs.map(docSnap => [docSnap.id, docSnap.data() as DailyStats]));
+}
+
+export function recentFromRollups(rollups: Record<string, DailyStats>, now: Date = new Date()): RecentDailyStats {
+  return {
+    today: rollups[localDateKey(now)] || null,
+    yesterday: rollups[localDateKey(previousDay(now))] || null
+  };
+}
+
+/**
+ * Current streak: through today if there's a completion today, otherwise
+ * through yesterday (today isn't over yet)
+ */
+export function currentStreak({ today, yesterday }: RecentDailyStats): number {
+  if (today && today.completed > 0) return today.streak || 1;
+  if (yesterday && yesterday.completed > 0) return yesterday.streak || 1;
+  return 0;
+}
+
+/**
+ * Roll completion changes into a transaction. Call after the transaction's
+ * other reads and before its writes: it reads the affected rollups (and
+ * yesterday's, to carry the streak) and returns a function that queues the
+ * rollup writes.
+ */
+export async function prepareRollupWrites(
+  transaction: Transaction,
+  db: Firestore,
+  changes: CompletionChange[]
+): Promise<() => void> {
+  // Net changes per user and day
+  const days = new Map<string, { userId: UserId; date: Date; completed: number; byHour: Record<string, number>; byCategory: Record<string, number> }>();
+  changes.forEach(({ userId, category, at, delta }) => {
+    const key = `${userId}/${localDateKey(at)}`;
+    let day = days.get(key);
+    if (!day) {
+      day = { userId, date: at, completed: 0, byHour: {}, byCategory: {} };
+      days.set(key, day);
+    }
+    const hour = String(at.getHours());
+    const categoryKey = category || 'uncategorized';
+    day.completed += delta;
+    day.byHour[hour] = (day.byHour[hour] || 0) + delta;
+    day.byCategory[categoryKey] = (day.byCategory[categoryKey] || 0) + delta;
+  });
+
+  // Reads first: a day gaining its first completion starts or extends the streak
+  const writes = await Promise.all([...days.values()].map(async day => {
+    const ref = dailyStatsRef(db, day.userId, day.date);
+    let streak: number | undefined;
+    if (day.completed > 0) {
+      const current = await transaction.get(ref);
+      if (!current.exists() || !(current.data() as DailyStats).completed) {
+        const yesterday = await transaction.get(dailyStatsRef(db, day.userId, previousDay(day.date)));
+        const previous = yesterday.exists() ? yesterday.data() as DailyStats : null;
+        streak = previous && previous.completed > 0 ? (previous.streak || 1) + 1 : 1;
+      }
+    }
+    return { ref, day, streak };
+  }));
+
+  return () => {
+    writes.forEach(({ ref, day, streak }) => {
+      const counts = (values: Record<string, number>) =>
+        Object.fromEntries(Object.entries(values).map(([key, delta]) => [key, increment(delta)]));
+
+      transaction.set(ref, {
+        date: localDateKey(day.date),
+        completed: increment(day.completed),
+        byHour: counts(day.byHour),
+        byCategory: counts(day.byCategory),
+        ...(streak !== undefined && { streak }),
+        updatedAt: serverTimestamp()
+      }, { merge: true });
+    });
+  };
+}
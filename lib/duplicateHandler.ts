@@ -1,11 +1,18 @@
 import { collection, query, where, getDocs, deleteDoc, doc, Timestamp, DocumentData } from 'firebase/firestore';
 import { db } from '@/lib/firebase';
+import { normalizeTitle, TaskSimilarityIndex } from '@/lib/taskSimilarity';
+
+// Exact mode feeds autoDelete, so it only matches titles that are the same
+// apart from case and surrounding whitespace
+function exactKey(value: string | null | undefined): string {
+  return (value || '').trim().toLowerCase();
+}
 
 // Types
 export interface DuplicateHandlerOptions {
   autoDelete?: boolean;     // Set to true to auto-delete
   timeWindow?: number;      // Hours to look back
-  requireExactMatch?: boolean; // Require exact title AND detail match
+  requireExactMatch?: boolean; // Require exact title AND detail match, otherwise similar titles group
   dryRun?: boolean;         // Just return duplicates, don't delete
 }
 
@@ -63,6 +70,8 @@ export async function findAndHandleDuplicates(
     // Group tasks by similarity key
     const taskGroups = new Map();
     const allTasks = [];
+    // Lenient mode: each group's first title, so near-identical titles join it
+    const groupTitles = new TaskSimilarityIndex<string>();
 
     snapshot.docs.forEach(docSnap => {
       const data: DocumentData = docSnap.data();
@@ -80,12 +89,22 @@ export async function findAndHandleDuplicates(
 
       allTasks.push(task);
 
-      // Create similarity key
-      const similarityKey = requireExactMatch 
-        ? `${data.title?.toLowerCase()}-${data.detail?.toLowerCase()}`
-        : data.title?.toLowerCase();
+      // Create similarity key; tasks without a usable title never group
+      let similarityKey: string;
+      if (requireExactMatch) {
+        if (!exactKey(data.title)) return;
+        similarityKey = `${exactKey(data.title)}-${exactKey(data.detail)}`;
+      } else {
+        // Titles with nothing to normalize (e.g. non-Latin script) only group exactly
+        const normalized = normalizeTitle(data.title);
+        if (!normalized && !exactKey(data.title)) return;
+        similarityKey = normalized
+          ? groupTitles.findSimilar(data.title)?.item ?? normalized
+          : exactKey(data.title);
+      }
 
       if (!taskGroups.has(similarityKey)) {
+        if (!requireExactMatch) groupTitles.add(data.title, similarityKey);
         taskGroups.set(similarityKey, []);
       }
       taskGroups.get(similarityKey).push(task);
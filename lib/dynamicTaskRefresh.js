@@ -9,13 +9,14 @@
 
 import { getAIContext } from './patternTracking';
 import { generatePersonalizedTasks } from './contextualTasks';
+import { subscribeToTimeBoundaries } from './boundaryScheduler';
 
 /**
  * Main orchestrator for dynamic task updates
  */
 export class DynamicTaskRefresh {
   constructor() {
-    this.refreshIntervals = new Map(); // Track active refresh intervals
+    this.boundarySubscriptions = new Map(); // Unsubscribe functions per user
     this.lastRefreshTimes = new Map(); // Track last refresh per user/category
     this.contextCache = new Map(); // Cache context to detect changes
   }
@@ -24,20 +25,12 @@ export class DynamicTaskRefresh {
    * Initialize dynamic refresh for a user session
    */
   initializeForUser(userId, callbacks = {}) {
-    const refreshConfig = {
-      // Callback functions for different update types
-      onTimeBasedRefresh: callbacks.onTimeBasedRefresh || (() => {}),
-      onTaskCompletionRefresh: callbacks.onTaskCompletionRefresh || (() => {}),
-      onContextChangeRefresh: callbacks.onContextChangeRefresh || (() => {}),
-      onPatternLearningRefresh: callbacks.onPatternLearningRefresh || (() => {}),
-    };
+    const refreshConfig = this.withDefaultCallbacks(callbacks);
 
-    // Set up time-based refresh intervals
+    // Set up context monitoring and time-based refreshes
+    this.setupContextMonitoring(userId);
     this.setupTimeBasedRefresh(userId, refreshConfig);
     
-    // Set up context monitoring
-    this.setupContextMonitoring(userId, refreshConfig);
-    
     return {
       refreshNow: (category) => this.forceRefresh(userId, category, refreshConfig),
       onTaskCompleted: (task) => this.handleTaskCompletion(userId, task, refreshConfig),
@@ -46,46 +39,45 @@ export class DynamicTaskRefresh {
   }
 
   /**
-   * Set up automatic time-based refreshes
+   * Fill in no-op callbacks for any update type the caller doesn't handle
    */
-  setupTimeBasedRefresh(userId, callbacks) {
-    // Hourly context check (energy levels, time-of-day tasks)
-    const hourlyInterval = setInterval(async () => {
-      await this.checkForContextChanges(userId, 'hourly', callbacks);
-    }, 60 * 60 * 1000); // Every hour
-
-    // Daily refresh (new day, different priorities)
-    const dailyInterval = setInterval(async () => {
-      await this.triggerDailyRefresh(userId, callbacks);
-    }, 24 * 60 * 60 * 1000); // Every 24 hours
-
-    // Weekend/weekday transition refresh
-    const transitionInterval = setInterval(async () => {
-      await this.checkForWeekdayTransition(userId, callbacks);
-    }, 6 * 60 * 60 * 1000); // Every 6 hours
-
-    this.refreshIntervals.set(userId, {
-      hourly: hourlyInterval,
-      daily: dailyInterval,
-      transition: transitionInterval
-    });
+  withDefaultCallbacks(callbacks = {}) {
+    return {
+      // Callback functions for different update types
+      onTimeBasedRefresh: callbacks.onTimeBasedRefresh || (() => {}),
+      onTaskCompletionRefresh: callbacks.onTaskCompletionRefresh || (() => {}),
+      onContextChangeRefresh: callbacks.onContextChangeRefresh || (() => {}),
+      onPatternLearningRefresh: callbacks.onPatternLearningRefresh || (() => {}),
+    };
   }
 
   /**
-   * Set up context monitoring for immediate updates
+   * Set up time-based refreshes, driven by the shared boundary scheduler so
+   * they fire right at the hour/day boundary instead of polling
    */
-  setupContextMonitoring(userId, callbacks) {
-    // Initialize context cache
-    this.updateContextCache(userId);
+  setupTimeBasedRefresh(userId, callbacks) {
+    this.boundarySubscriptions.get(userId)?.();
+
+    const unsubscribe = subscribeToTimeBoundaries(async ({ dayChanged, weekendChanged }) => {
+      // Daily refresh (new day, different priorities)
+      if (dayChanged) await this.triggerDailyRefresh(userId, callbacks);
 
-    // Set up periodic context comparison
-    const contextInterval = setInterval(async () => {
+      // Weekend/weekday transition refresh
+      if (weekendChanged) await this.checkForWeekdayTransition(userId, callbacks);
+
+      // Hourly context check (energy levels, time-of-day tasks)
       await this.detectContextChanges(userId, callbacks);
-    }, 5 * 60 * 1000); // Every 5 minutes
+    });
 
-    const intervals = this.refreshIntervals.get(userId) || {};
-    intervals.context = contextInterval;
-    this.refreshIntervals.set(userId, intervals);
+    this.boundarySubscriptions.set(userId, unsubscribe);
+  }
+
+  /**
+   * Set up context monitoring: remember the current context so boundary
+   * ticks and task completions can tell what changed
+   */
+  setupContextMonitoring(userId) {
+    this.updateContextCache(userId);
   }
 
   /**
@@ -256,6 +248,9 @@ export class DynamicTaskRefresh {
    * Handle task completion and trigger relevant updates
    */
   async handleTaskCompletion(userId, completedTask, callbacks) {
+    // Callers may pass only the callbacks they care about
+    callbacks = this.withDefaultCallbacks(callbacks);
+
     try {
       // Update pattern tracking
       await import('./patternTracking').then(module => 
@@ -286,6 +281,9 @@ export class DynamicTaskRefresh {
 
       // Check for achievement milestones that unlock new task types
       await this.checkForAchievementUnlocks(userId, completedTask, callbacks);
+
+      // Completions can flip overwhelm/productive state
+      await this.detectContextChanges(userId, callbacks);
       
     } catch (error) {
       console.error('Error handling task completion refresh:', error);
@@ -438,7 +436,7 @@ export class DynamicTaskRefresh {
       }
       
       // Update context cache
-      this.updateContextCache(userId);
+      await this.updateContextCache(userId);
     }
   }
 
@@ -509,14 +507,11 @@ export class DynamicTaskRefresh {
   }
 
   /**
-   * Clean up intervals when user session ends
+   * Stop time-based refreshes when user session ends
    */
   cleanup(userId) {
-    const intervals = this.refreshIntervals.get(userId);
-    if (intervals) {
-      Object.values(intervals).forEach(interval => clearInterval(interval));
-      this.refreshIntervals.delete(userId);
-    }
+    this.boundarySubscriptions.get(userId)?.();
+    this.boundarySubscriptions.delete(userId);
     
     this.contextCache.delete(userId);
     
@@ -2,21 +2,49 @@
  * Pattern Tracking System
  * Learns user behavior to enable smart AI suggestions
  * This is the foundation for the AI mentor system
+ *
+ * Completions and suggestion responses are buffered in memory as deltas and
+ * flushed as one merge write of increments - every few seconds, and right
+ * away when the page is hidden or unloaded. Only a user's first flush reads
+ * the patterns doc, in a transaction that fills in whichever defaults it is
+ * missing; after that the write path never reads, and increments from
+ * different devices add up instead of overwriting each other.
+ *
+ * Reads go through a per-user pattern store: in the browser one onSnapshot
+ * listener keeps the doc and its insights current, and each insight is only
+ * recomputed when the fields it depends on change (or, for the time-based
+ * ones, when the hour moves on). A second listener follows the user's daily
+ * completion rollups (lib/dailyStats) for today and yesterday, which give
+ * today's count and the streak.
  */
 
 import { 
   doc, 
   updateDoc, 
   getDoc, 
+  getDocs,
   setDoc,
   serverTimestamp,
   arrayUnion,
   increment,
+  onSnapshot,
+  runTransaction,
   Timestamp,
+  Unsubscribe,
   DocumentReference,
   DocumentSnapshot
 } from 'firebase/firestore';
-import { db } from './firebase';
+import { onAuthStateChanged } from 'firebase/auth';
+import { auth, db } from './firebase';
+import {
+  currentStreak,
+  dailyStatsSince,
+  localDateKey,
+  previousDay,
+  recentFromRollups,
+  DailyStats,
+  RecentDailyStats
+} from './dailyStats';
 import { Task, TaskCategory, UserId } from '../types/models';
 
 // Pattern tracking interfaces
@@ -102,6 +130,7 @@ export interface PatternInsights {
   preferredTaskSize: 'short' | 'medium' | 'long';
   isOverwhelmed: boolean;
   suggestionsEffectiveness: number;
+  favoriteCategories: string[];
 }
 
 export interface UserPatternsWithInsights extends BehavioralPatterns {
@@ -134,13 +163,9 @@ export interface AIContext {
   todayCompletions?: number;
 }
 
-/**
- * Initialize pattern tracking for a new user
- */
-export async function initializePatternTracking(userId: UserId): Promise<UserPatternsWithInsights> {
-  const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-  
-  const initialPatterns: BehavioralPatterns = {
+// Defaults for a new user's patterns doc
+function initialPatterns(): BehavioralPatterns {
+  return {
     initialized: true,
     createdAt: serverTimestamp() as Timestamp,
     schemaVersion: 1,
@@ -188,63 +213,266 @@ export async function initializePatternTracking(userId: UserId): Promise<UserPat
     seasonalTasksCompleted: [],
     missedSeasonalTasks: []
   };
+}
+
+/**
+ * Defaults the patterns doc is missing: every field it doesn't have, plus
+ * any default category absent from categoryLastUsed. Never touches a field
+ * that's already there, so counters survive.
+ */
+function missingDefaults(existing: Partial<BehavioralPatterns> | undefined): Partial<BehavioralPatterns> {
+  const defaults = initialPatterns();
+  if (!existing) return defaults;
+
+  const seeds: Record<string, any> = {};
+  Object.entries(defaults).forEach(([field, value]) => {
+    if ((existing as Record<string, any>)[field] === undefined) seeds[field] = value;
+  });
+  if (existing.categoryLastUsed) {
+    const absent = Object.keys(defaults.categoryLastUsed).filter(category => !(category in existing.categoryLastUsed!));
+    if (absent.length > 0) seeds.categoryLastUsed = Object.fromEntries(absent.map(category => [category, null]));
+  }
+  return seeds;
+}
+
+/**
+ * Initialize pattern tracking for a new user. Create-if-absent: only the
+ * defaults the doc is missing are written, so it never clobbers counters a
+ * flush has already landed.
+ */
+export async function initializePatternTracking(userId: UserId): Promise<UserPatternsWithInsights> {
+  const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
   
-  await setDoc(patternsRef, initialPatterns);
+  const patterns = await runTransaction(db, async (transaction) => {
+    const current = await transaction.get(patternsRef);
+    const existing = current.exists() ? current.data() as BehavioralPatterns : undefined;
+    const seeds = missingDefaults(existing);
+    if (Object.keys(seeds).length > 0) transaction.set(patternsRef, seeds, { merge: true });
+    return withSeeds(seeds, existing || {}) as BehavioralPatterns;
+  });
+  seededUsers.add(userId);
   
   // Calculate insights for new patterns
-  const insights = analyzePatterns(initialPatterns);
+  const insights = analyzePatterns(patterns);
   
   return {
-    ...initialPatterns,
+    ...patterns,
     insights
   } as UserPatternsWithInsights;
 }
 
+// =============================================
+// EVENT BUFFER
+// =============================================
+
+const FLUSH_DELAY_MS = 10 * 1000;
+const PRODUCTIVE_DAY_COMPLETIONS = 5;
+
+type CounterMap = Record<string, number>;
+
+interface PendingPatternEvents {
+  counters: CounterMap;                                    // totalTasksCompleted, suggestionsAccepted...
+  maps: Record<string, CounterMap>;                        // completionsByHour, completionsByDay...
+  categoriesUsed: Set<string>;
+  suggestionHistory: Record<string, { accepted: boolean; category: string }>;
+  productiveDays: Set<string>;
+  active: boolean;
+}
+
+const pendingEvents = new Map<UserId, PendingPatternEvents>();
+// Users whose patterns doc is known to have its defaults; their flushes are blind merges
+const seededUsers = new Set<UserId>();
+// Completions this session, per user, for the productive-day check without a read
+const sessionCompletionsToday = new Map<UserId, { day: string; count: number }>();
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let pageListenersBound = false;
+
+function emptyEvents(): PendingPatternEvents {
+  return {
+    counters: {},
+    maps: {},
+    categoriesUsed: new Set(),
+    suggestionHistory: {},
+    productiveDays: new Set(),
+    active: false
+  };
+}
+
+function eventsFor(userId: UserId): PendingPatternEvents {
+  let events = pendingEvents.get(userId);
+  if (!events) {
+    events = emptyEvents();
+    pendingEvents.set(userId, events);
+  }
+  return events;
+}
+
+function addCount(counts: CounterMap, key: string, delta: number): void {
+  counts[key] = (counts[key] || 0) + delta;
+}
+
+function addMapCount(events: PendingPatternEvents, field: string, key: string, delta = 1): void {
+  addCount(events.maps[field] ||= {}, key, delta);
+}
+
+// Put events from a failed flush back in front of anything recorded since
+function requeueEvents(userId: UserId, failed: PendingPatternEvents): void {
+  const events = eventsFor(userId);
+  Object.entries(failed.counters).forEach(([field, delta]) => addCount(events.counters, field, delta));
+  Object.entries(failed.maps).forEach(([field, counts]) => {
+    Object.entries(counts).forEach(([key, delta]) => addMapCount(events, field, key, delta));
+  });
+  failed.categoriesUsed.forEach(category => events.categoriesUsed.add(category));
+  events.suggestionHistory = { ...failed.suggestionHistory, ...events.suggestionHistory };
+  failed.productiveDays.forEach(day => events.productiveDays.add(day));
+  events.active ||= failed.active;
+}
+
+function buildPatternUpdate(events: PendingPatternEvents): Record<string, any> {
+  const update: Record<string, any> = {};
+
+  Object.entries(events.counters).forEach(([field, delta]) => {
+    update[field] = increment(delta);
+  });
+  Object.entries(events.maps).forEach(([field, counts]) => {
+    update[field] = Object.fromEntries(Object.entries(counts).map(([key, delta]) => [key, increment(delta)]));
+  });
+  if (events.categoriesUsed.size > 0) {
+    update.categoryLastUsed = Object.fromEntries([...events.categoriesUsed].map(category => [category, serverTimestamp()]));
+  }
+  const suggestionIds = Object.keys(events.suggestionHistory);
+  if (suggestionIds.length > 0) {
+    update.suggestionHistory = Object.fromEntries(suggestionIds.map(id => [
+      id,
+      { timestamp: serverTimestamp(), ...events.suggestionHistory[id] }
+    ]));
+  }
+  if (events.productiveDays.size > 0) {
+    update.productiveDays = arrayUnion(...events.productiveDays);
+  }
+  if (events.active) {
+    update.lastActiveDate = serverTimestamp();
+  }
+
+  return update;
+}
+
+// Defaults under the update: counters and categories it touches win
+function withSeeds(seeds: Partial<BehavioralPatterns>, update: Record<string, any>): Record<string, any> {
+  const merged: Record<string, any> = { ...seeds, ...update };
+  if (seeds.categoryLastUsed && update.categoryLastUsed) {
+    merged.categoryLastUsed = { ...seeds.categoryLastUsed, ...update.categoryLastUsed };
+  }
+  return merged;
+}
+
+/**
+ * Write buffered pattern events - for one user, or everyone pending.
+ * Each user's deltas go out as a single merge write; on failure they are
+ * requeued for the next flush. The first write for a user also seeds any
+ * missing defaults, so a doc created by a flush is complete.
+ */
+export async function flushPatternEvents(userId?: UserId): Promise<void> {
+  const userIds = userId ? [userId] : [...pendingEvents.keys()];
+  if (!userId && flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+
+  await Promise.all(userIds.map(async id => {
+    const events = pendingEvents.get(id);
+    if (!events) return;
+    pendingEvents.delete(id);
+
+    try {
+      const patternsRef = doc(db, 'users', id, 'patterns', 'behavioral');
+      const update = buildPatternUpdate(events);
+      if (seededUsers.has(id) || patternStores.get(id)?.memo?.patterns.initialized) {
+        // Nested maps merge key by key
+        await setDoc(patternsRef, update, { merge: true });
+      } else {
+        // First write this session: also fill in any defaults the doc is
+        // missing (it may not exist yet), without touching fields it has
+        await runTransaction(db, async (transaction) => {
+          const current = await transaction.get(patternsRef);
+          const seeds = missingDefaults(current.exists() ? current.data() as BehavioralPatterns : undefined);
+          transaction.set(patternsRef, withSeeds(seeds, update), { merge: true });
+        });
+      }
+      seededUsers.add(id);
+    } catch (error) {
+      console.error('Error flushing pattern events:', error);
+      requeueEvents(id, events);
+      // Retry on the next timer in the browser; server-side the events wait for the next call
+      if (typeof window !== 'undefined') scheduleFlush();
+    }
+  }));
+}
+
+function bindPageListeners(): void {
+  if (pageListenersBound) return;
+  pageListenersBound = true;
+
+  // Last chance to write before the page goes away (or into the bfcache)
+  window.addEventListener('pagehide', () => { flushPatternEvents(); });
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushPatternEvents();
+  });
+}
+
+function scheduleFlush(): void {
+  // No page lifecycle to lean on server-side - write straight away
+  if (typeof window === 'undefined') {
+    flushPatternEvents();
+    return;
+  }
+
+  bindPageListeners();
+  if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      flushTimer = null;
+      flushPatternEvents();
+    }, FLUSH_DELAY_MS);
+  }
+}
+
 /**
  * Track when a task is completed
  */
 export async function trackTaskCompletion(userId: UserId, task: Task): Promise<void> {
   try {
-    const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-    const patternsDoc = await getDoc(patternsRef);
-    
-    if (!patternsDoc.exists()) {
-      await initializePatternTracking(userId);
-    }
-    
     const now = new Date();
-    const hour = now.getHours().toString();
-    const dayOfWeek = now.getDay().toString();
+    // Local date, the same key the daily rollups use
+    const today = localDateKey(now);
     const category = task.category || 'uncategorized';
-    
-    // Update multiple patterns in one transaction
-    const updates: Record<string, any> = {
-      [`categoryLastUsed.${category}`]: serverTimestamp(),
-      [`completionsByHour.${hour}`]: increment(1),
-      [`completionsByDay.${dayOfWeek}`]: increment(1),
-      [`completionsByCategory.${category}`]: increment(1),
-      lastActiveDate: serverTimestamp(),
-      totalTasksCompleted: increment(1)
-    };
-    
-    // Track task duration preference  
+    const events = eventsFor(userId);
+
+    addMapCount(events, 'completionsByHour', now.getHours().toString());
+    addMapCount(events, 'completionsByDay', now.getDay().toString());
+    addMapCount(events, 'completionsByCategory', category);
+    addCount(events.counters, 'totalTasksCompleted', 1);
+    events.categoriesUsed.add(category);
+    events.active = true;
+
+    // Track task duration preference
     if ((task as any).duration) {
       const taskDuration = (task as any).duration;
-      const duration = taskDuration < 15 ? 'short' : 
+      const duration = taskDuration < 15 ? 'short' :
                       taskDuration < 30 ? 'medium' : 'long';
-      updates[`durationPreference.${duration}`] = increment(1);
+      addMapCount(events, 'durationPreference', duration);
     }
-    
-    await updateDoc(patternsRef, updates);
-    
-    // Check for productive day (>5 tasks)
-    const todayCompletions = await getTodayCompletions(userId);
-    if (todayCompletions >= 5) {
-      await updateDoc(patternsRef, {
-        productiveDays: arrayUnion(now.toISOString().split('T')[0])
-      });
+
+    // Productive day (>5 tasks): today's rollup if we're following it, else this session's count
+    const session = sessionCompletionsToday.get(userId);
+    const sessionCount = session?.day === today ? session.count + 1 : 1;
+    sessionCompletionsToday.set(userId, { day: today, count: sessionCount });
+    const rollups = patternStores.get(userId)?.rollups;
+    const rollupCount = rollups ? recentFromRollups(rollups, now).today?.completed || 0 : 0;
+    if (Math.max(sessionCount, rollupCount) >= PRODUCTIVE_DAY_COMPLETIONS) {
+      events.productiveDays.add(today);
     }
-    
+
+    scheduleFlush();
   } catch (error) {
     console.error('Error tracking task completion:', error);
     // Don't throw - pattern tracking should never break the app
@@ -256,18 +484,15 @@ export async function trackTaskCompletion(userId: UserId, task: Task): Promise<v
  */
 export async function trackSuggestionResponse(userId: UserId, suggestion: Suggestion, accepted: boolean): Promise<void> {
   try {
-    const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-    
-    const field = accepted ? 'suggestionsAccepted' : 'suggestionsDismissed';
-    await updateDoc(patternsRef, {
-      [field]: increment(1),
-      [`suggestionHistory.${suggestion.id}`]: {
-        timestamp: serverTimestamp(),
-        accepted,
-        category: suggestion.category
-      }
-    });
-    
+    const events = eventsFor(userId);
+
+    addCount(events.counters, accepted ? 'suggestionsAccepted' : 'suggestionsDismissed', 1);
+    events.suggestionHistory[suggestion.id] = {
+      accepted,
+      category: suggestion.category
+    };
+
+    scheduleFlush();
   } catch (error) {
     console.error('Error tracking suggestion response:', error);
   }
@@ -279,7 +504,7 @@ export async function trackSuggestionResponse(userId: UserId, suggestion: Sugges
 export async function trackEmergencyMode(userId: UserId): Promise<void> {
   try {
     const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-    const today = new Date().toISOString().split('T')[0];
+    const today = localDateKey();
     
     await updateDoc(patternsRef, {
       overwhelmDays: arrayUnion(today),
@@ -291,125 +516,288 @@ export async function trackEmergencyMode(userId: UserId): Promise<void> {
   }
 }
 
-/**
- * Get user's behavior patterns for AI context
- */
-export async function getUserPatterns(userId: UserId): Promise<UserPatternsWithInsights | null> {
-  try {
-    const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-    const patternsDoc = await getDoc(patternsRef);
-    
-    if (!patternsDoc.exists()) {
-      return await initializePatternTracking(userId);
+// =============================================
+// INSIGHTS
+// =============================================
+
+interface InsightMemo {
+  patterns: BehavioralPatterns;
+  insights: PatternInsights;
+  clock: string; // Local date + hour the time-based insights were computed for
+}
+
+interface InsightDefinition {
+  key: keyof PatternInsights;
+  fields: Array<keyof BehavioralPatterns>;
+  timeBased?: boolean; // Depends on "now" as well as the fields
+  compute: (patterns: BehavioralPatterns, now: Date) => any;
+}
+
+// Key with the highest count; the first one wins ties
+function busiestKey(counts: CompletionsByTime | undefined): number | null {
+  let best: string | null = null;
+  let bestCount = -Infinity;
+  for (const key in counts) {
+    if (counts[key] > bestCount) {
+      best = key;
+      bestCount = counts[key];
+    }
+  }
+  return best === null ? null : parseInt(best);
+}
+
+const INSIGHTS: InsightDefinition[] = [
+  // Most productive hour and day
+  { key: 'mostProductiveHour', fields: ['completionsByHour'], compute: patterns => busiestKey(patterns.completionsByHour) },
+  { key: 'mostProductiveDay', fields: ['completionsByDay'], compute: patterns => busiestKey(patterns.completionsByDay) },
+  {
+    key: 'favoriteCategories',
+    fields: ['completionsByCategory'],
+    compute: patterns => Object.entries(patterns.completionsByCategory || {})
+      .sort((a, b) => b[1] - a[1])
+      .slice(0, 3)
+      .map(([category]) => category)
+  },
+  {
+    // Neglected categories (not used in 7+ days)
+    key: 'neglectedCategories',
+    fields: ['categoryLastUsed'],
+    timeBased: true,
+    compute: (patterns, now) => {
+      const sevenDaysAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
+      return Object.entries(patterns.categoryLastUsed || {})
+        .filter(([, lastUsed]) => !lastUsed || new Date((lastUsed as any).seconds * 1000) < sevenDaysAgo)
+        .map(([category]) => category);
+    }
+  },
+  {
+    // Overwhelmed (emergency mode in last 3 days)
+    key: 'isOverwhelmed',
+    fields: ['overwhelmDays'],
+    timeBased: true,
+    compute: (patterns, now) => {
+      const threeDaysAgo = new Date(now.getTime() - 3 * 24 * 60 * 60 * 1000);
+      return (patterns.overwhelmDays || []).some(day => new Date(day) > threeDaysAgo);
+    }
+  },
+  {
+    key: 'suggestionsEffectiveness',
+    fields: ['suggestionsAccepted', 'suggestionsDismissed'],
+    compute: patterns => {
+      const accepted = patterns.suggestionsAccepted || 0;
+      const total = accepted + (patterns.suggestionsDismissed || 0);
+      return total > 0 ? (accepted / total) * 100 : 0;
     }
-    
-    const patterns = patternsDoc.data() as BehavioralPatterns;
-    
-    // Calculate insights
-    const insights = analyzePatterns(patterns);
-    
-    return {
-      ...patterns,
-      insights
-    } as UserPatternsWithInsights;
-    
-  } catch (error) {
-    console.error('Error getting user patterns:', error);
-    return null;
   }
+];
+
+function sameValue(a: any, b: any): boolean {
+  if (a === b) return true;
+  if (!a || !b || typeof a !== 'object' || typeof b !== 'object') return false;
+  const keys = Object.keys(a);
+  if (keys.length !== Object.keys(b).length) return false;
+  return keys.every(key => sameValue(a[key], b[key]));
+}
+
+function clockKey(now: Date): string {
+  return `${now.toDateString()} ${now.getHours()}`;
 }
 
 /**
- * Analyze patterns to generate insights
+ * Insights for `patterns`, reusing every insight from `previous` whose
+ * inputs haven't changed
  */
-function analyzePatterns(patterns: BehavioralPatterns): PatternInsights {
-  const insights: PatternInsights = {
+function computeInsights(patterns: BehavioralPatterns, now: Date, previous?: InsightMemo | null): InsightMemo {
+  const clock = clockKey(now);
+  const insights: PatternInsights = previous ? { ...previous.insights } : {
     mostProductiveHour: null,
     mostProductiveDay: null,
     neglectedCategories: [],
     preferredTaskSize: 'medium',
     isOverwhelmed: false,
-    suggestionsEffectiveness: 0
+    suggestionsEffectiveness: 0,
+    favoriteCategories: []
   };
-  
-  // Find most productive hour
-  if (patterns.completionsByHour) {
-    const hours = Object.entries(patterns.completionsByHour);
-    if (hours.length > 0) {
-      hours.sort((a, b) => b[1] - a[1]);
-      insights.mostProductiveHour = parseInt(hours[0][0]);
+
+  INSIGHTS.forEach(({ key, fields, timeBased, compute }) => {
+    const stale = !previous ||
+      (timeBased && previous.clock !== clock) ||
+      fields.some(field => !sameValue(previous.patterns[field], patterns[field]));
+    if (stale) (insights as any)[key] = compute(patterns, now);
+  });
+
+  return { patterns, insights, clock };
+}
+
+/**
+ * Analyze patterns to generate insights
+ */
+function analyzePatterns(patterns: BehavioralPatterns): PatternInsights {
+  return computeInsights(patterns, new Date()).insights;
+}
+
+// =============================================
+// LIVE PATTERN STORE
+// =============================================
+
+interface PatternStore {
+  ready: Promise<void>;
+  exists: boolean;
+  failed: boolean;
+  memo: InsightMemo | null;
+  current: UserPatternsWithInsights | null;
+  unsubscribe: Unsubscribe;
+  rollups: Record<string, DailyStats>;
+  rollupsSince: string;
+  unsubscribeRollups: Unsubscribe;
+}
+
+const patternStores = new Map<UserId, PatternStore>();
+let stopWatchingAuth: Unsubscribe | null = null;
+
+// Stores belong to the signed-in user: close the others on sign-out or a user switch
+function closeStoresOnSignOut(): void {
+  if (stopWatchingAuth || !auth) return;
+  stopWatchingAuth = onAuthStateChanged(auth, user => {
+    [...patternStores.keys()]
+      .filter(userId => userId !== user?.uid)
+      .forEach(closePatternStore);
+  });
+}
+
+function applyPatterns(store: PatternStore, patterns: BehavioralPatterns, now: Date): void {
+  store.memo = computeInsights(patterns, now, store.memo);
+  store.current = { ...patterns, insights: store.memo.insights };
+}
+
+// Follow today's and yesterday's rollups; re-pointed when the date changes
+function listenToRollups(store: PatternStore, userId: UserId, now: Date, onFirstSnapshot: () => void = () => {}): void {
+  const since = previousDay(now);
+  store.unsubscribeRollups();
+  store.rollupsSince = localDateKey(since);
+  store.unsubscribeRollups = onSnapshot(dailyStatsSince(db, userId, since), snapshot => {
+    store.rollups = Object.fromEntries(snapshot.docs.map(docSnap => [docSnap.id, docSnap.data() as DailyStats]));
+    onFirstSnapshot();
+  }, error => {
+    console.error('Error listening to daily stats:', error);
+    onFirstSnapshot();
+  });
+}
+
+function openPatternStore(userId: UserId): PatternStore {
+  let markPatternsReady: () => void = () => {};
+  let markRollupsReady: () => void = () => {};
+  const store: PatternStore = {
+    ready: Promise.all([
+      new Promise<void>(resolve => { markPatternsReady = resolve; }),
+      new Promise<void>(resolve => { markRollupsReady = resolve; })
+    ]).then(() => {}),
+    exists: false,
+    failed: false,
+    memo: null,
+    current: null,
+    unsubscribe: () => {},
+    rollups: {},
+    rollupsSince: '',
+    unsubscribeRollups: () => {}
+  };
+  patternStores.set(userId, store);
+  closeStoresOnSignOut();
+  listenToRollups(store, userId, new Date(), () => markRollupsReady());
+
+  const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
+  store.unsubscribe = onSnapshot(patternsRef, snapshot => {
+    store.exists = snapshot.exists();
+    if (store.exists) applyPatterns(store, snapshot.data() as BehavioralPatterns, new Date());
+    markPatternsReady();
+  }, error => {
+    console.error('Error listening to user patterns:', error);
+    // Forget the store so the next read tries again
+    store.failed = true;
+    store.unsubscribeRollups();
+    if (patternStores.get(userId) === store) patternStores.delete(userId);
+    markPatternsReady();
+    markRollupsReady();
+  });
+
+  return store;
+}
+
+/**
+ * Stop listening to a user's patterns. Runs on its own when the user signs
+ * out or another user signs in
+ */
+export function closePatternStore(userId: UserId): void {
+  const store = patternStores.get(userId);
+  store?.unsubscribe();
+  store?.unsubscribeRollups();
+  patternStores.delete(userId);
+}
+
+/**
+ * Get user's behavior patterns for AI context
+ */
+export async function getUserPatterns(userId: UserId): Promise<UserPatternsWithInsights | null> {
+  try {
+    // Server-side there's no session to keep a listener alive for - read once
+    if (typeof window === 'undefined') {
+      const patternsDoc = await getDoc(doc(db, 'users', userId, 'patterns', 'behavioral'));
+      if (!patternsDoc.exists()) {
+        // Reads never write here - the doc gets created by the user's own first flush
+        const defaults = initialPatterns();
+        return { ...defaults, insights: analyzePatterns(defaults) } as UserPatternsWithInsights;
+      }
+      const patterns = patternsDoc.data() as BehavioralPatterns;
+      return { ...patterns, insights: analyzePatterns(patterns) } as UserPatternsWithInsights;
     }
-  }
-  
-  // Find most productive day
-  if (patterns.completionsByDay) {
-    const days = Object.entries(patterns.completionsByDay);
-    if (days.length > 0) {
-      days.sort((a, b) => b[1] - a[1]);
-      insights.mostProductiveDay = parseInt(days[0][0]);
+
+    const store = patternStores.get(userId) || openPatternStore(userId);
+    await store.ready;
+    if (store.failed) return null;
+
+    if (!store.exists || !store.memo?.patterns.initialized) {
+      // The listener picks up the new doc; answer with the defaults meanwhile
+      return await initializePatternTracking(userId);
     }
+
+    // Time-based insights move on with the clock, even without a new snapshot
+    const now = new Date();
+    if (store.memo && store.memo.clock !== clockKey(now)) {
+      applyPatterns(store, store.memo.patterns, now);
+    }
+    return store.current;
+    
+  } catch (error) {
+    console.error('Error getting user patterns:', error);
+    return null;
   }
-  
-  // Find neglected categories (not used in 7+ days)
-  const now = new Date();
-  const sevenDaysAgo = new Date(now.getTime() - 7 * 24 * 60 * 60 * 1000);
-  
-  if (patterns.categoryLastUsed) {
-    Object.entries(patterns.categoryLastUsed).forEach(([category, lastUsed]) => {
-      if (!lastUsed || new Date((lastUsed as any).seconds * 1000) < sevenDaysAgo) {
-        insights.neglectedCategories.push(category);
-      }
-    });
-  }
-  
-  // Check if overwhelmed (emergency mode in last 3 days)
-  if (patterns.overwhelmDays && patterns.overwhelmDays.length > 0) {
-    const threeDaysAgo = new Date(now.getTime() - 3 * 24 * 60 * 60 * 1000);
-    const recentOverwhelm = patterns.overwhelmDays.some(day => 
-      new Date(day) > threeDaysAgo
-    );
-    insights.isOverwhelmed = recentOverwhelm;
-  }
-  
-  // Calculate suggestion effectiveness
-  const accepted = patterns.suggestionsAccepted || 0;
-  const dismissed = patterns.suggestionsDismissed || 0;
-  const total = accepted + dismissed;
-  if (total > 0) {
-    insights.suggestionsEffectiveness = (accepted / total) * 100;
-  }
-  
-  return insights;
 }
 
 /**
- * Get count of tasks completed today
+ * Today's and yesterday's completion rollups
  */
-async function getTodayCompletions(userId: UserId): Promise<number> {
+export async function getRecentDailyStats(userId: UserId): Promise<RecentDailyStats> {
+  const now = new Date();
   try {
-    const today = new Date().toISOString().split('T')[0];
-    // Store daily completions in the behavioral patterns doc instead
-    const patternsRef = doc(db, 'users', userId, 'patterns', 'behavioral');
-    const patternsDoc = await getDoc(patternsRef);
-    
-    if (patternsDoc.exists()) {
-      const data = patternsDoc.data();
-      // Get today's completion count from the completions by hour
-      const todayHours = new Date().getHours();
-      let totalToday = 0;
-      
-      // Sum up all completions for today (rough estimate based on hours)
-      for (let h = 0; h <= todayHours; h++) {
-        totalToday += data?.completionsByHour?.[h.toString()] || 0;
-      }
-      
-      return totalToday;
+    if (typeof window === 'undefined') {
+      const snapshot = await getDocs(dailyStatsSince(db, userId, previousDay(now)));
+      return recentFromRollups(
+        Object.fromEntries(snapshot.docs.map(docSnap => [docSnap.id, docSnap.data() as DailyStats])),
+        now
+      );
     }
-    return 0;
-    
+
+    const store = patternStores.get(userId) || openPatternStore(userId);
+    await store.ready;
+    if (store.rollupsSince !== localDateKey(previousDay(now))) {
+      // Date changed: yesterday's doc is already in hand, today's arrives with the new listener
+      listenToRollups(store, userId, now);
+    }
+    return recentFromRollups(store.rollups, now);
+
   } catch (error) {
-    console.error('Error getting today completions:', error);
-    return 0;
+    console.error('Error getting daily stats:', error);
+    return { today: null, yesterday: null };
   }
 }
 
@@ -436,7 +824,10 @@ export async function updatePreferredCheckInTime(userId: UserId): Promise<void>
  * Get smart context for AI suggestions
  */
 export async function getAIContext(userId: UserId): Promise<AIContext> {
-  const patterns = await getUserPatterns(userId);
+  const [patterns, recent] = await Promise.all([
+    getUserPatterns(userId),
+    getRecentDailyStats(userId)
+  ]);
   
   if (!patterns) {
     return {
@@ -455,10 +846,7 @@ export async function getAIContext(userId: UserId): Promise<AIContext> {
     
     // Categories needing attention
     neglectedCategories: patterns.insights.neglectedCategories,
-    favoriteCategories: Object.entries(patterns.completionsByCategory || {})
-      .sort((a, b) => b[1] - a[1])
-      .slice(0, 3)
-      .map(([cat]) => cat),
+    favoriteCategories: patterns.insights.favoriteCategories,
     
     // Timing
     currentHour: new Date().getHours(),
@@ -472,8 +860,8 @@ export async function getAIContext(userId: UserId): Promise<AIContext> {
     
     // Activity
     lastActive: patterns.lastActiveDate,
-    streakDays: patterns.streakDays || 0,
-    todayCompletions: await getTodayCompletions(userId)
+    streakDays: currentStreak(recent),
+    todayCompletions: Math.max(0, recent.today?.completed || 0)
   };
   
   return context;
@@ -483,8 +871,11 @@ const PatternTracking = {
   initializePatternTracking,
   trackTaskCompletion,
   trackSuggestionResponse,
+  flushPatternEvents,
   trackEmergencyMode,
   getUserPatterns,
+  closePatternStore,
+  getRecentDailyStats,
   updatePreferredCheckInTime,
   getAIContext
 };
@@ -0,0 +1,213 @@
+/**
+ * Ranking Engine - Top-k relevance ranking for task suggestions
+ * Each task is a small numeric feature vector; the user's profile, patterns
+ * and current context become a weight vector. A task's relevance score is the
+ * dot product of the two, and a bounded heap keeps only the best k, so
+ * ranking n candidates costs O(n·F + n log k) instead of rescoring with string
+ * comparisons and sorting everything.
+ *
+ * Catalog tasks carry their static features (category, prevention, seasonal)
+ * precomputed; personalization fills in priority, relevance and timing.
+ */
+
+// Categories that get their own one-hot feature (everything the catalog uses)
+export const RANKING_CATEGORIES = ['maintenance', 'household', 'baby', 'personal', 'relationship', 'home_projects', 'health'];
+
+export const RANKING_FEATURES = [
+  'priorityHigh',
+  'priorityMedium',
+  'priorityLow',
+  'relevancePriorityArea',
+  'relevanceParent',
+  'relevanceHomeowner',
+  'relevanceLocation',
+  'timingDoNow',
+  'timingSaveForLater',
+  'timingWeekend',
+  'prevents',
+  'isSeasonal',
+  ...RANKING_CATEGORIES.map(category => `category:${category}`)
+];
+
+export const FEATURE_COUNT = RANKING_FEATURES.length;
+
+const F = Object.fromEntries(RANKING_FEATURES.map((name, index) => [name, index]));
+
+const PRIORITY_FEATURES = { high: F.priorityHigh, medium: F.priorityMedium, low: F.priorityLow };
+const RELEVANCE_FEATURES = {
+  'priority-area': F.relevancePriorityArea,
+  parent: F.relevanceParent,
+  homeowner: F.relevanceHomeowner,
+  location: F.relevanceLocation
+};
+const TIMING_FEATURES = { 'do-now': F.timingDoNow, 'save-for-later': F.timingSaveForLater, weekend: F.timingWeekend };
+
+// =============================================
+// FEATURES
+// =============================================
+
+/**
+ * Features that don't depend on the user - computed once per catalog task
+ */
+export function staticTaskFeatures(task) {
+  const features = new Float32Array(FEATURE_COUNT);
+  if (task.prevents) features[F.prevents] = 1;
+  if (task.isSeasonal) features[F.isSeasonal] = 1;
+  const category = F[`category:${task.category}`];
+  if (category !== undefined) features[category] = 1;
+  return features;
+}
+
+/**
+ * Full feature vector for a personalized task: a copy of its static features
+ * with priority, relevance and timing filled in
+ */
+export function taskFeatures(task, staticFeatures = staticTaskFeatures(task)) {
+  const features = staticFeatures.slice();
+  const priority = PRIORITY_FEATURES[task.priority];
+  if (priority !== undefined) features[priority] = 1;
+  const relevance = RELEVANCE_FEATURES[task.relevance];
+  if (relevance !== undefined) features[relevance] = 1;
+  const timing = TIMING_FEATURES[task.timing];
+  if (timing !== undefined) features[timing] = 1;
+  return features;
+}
+
+// =============================================
+// WEIGHTS
+// =============================================
+
+let weightModel = null;
+
+/**
+ * Plug in learned weights. `model(weights, { profile, patterns, context })`
+ * receives the default weight vector and may adjust it in place or return a
+ * replacement (Float64Array of FEATURE_COUNT, indexed as RANKING_FEATURES).
+ * Pass null to go back to the defaults.
+ */
+export function setRankingWeightModel(model) {
+  weightModel = model;
+}
+
+/**
+ * Default weights for this user and moment
+ */
+export function buildRankingWeights(profile, patterns, context) {
+  const weights = new Float64Array(FEATURE_COUNT);
+
+  // Priority
+  weights[F.priorityHigh] = 30;
+  weights[F.priorityMedium] = 20;
+  weights[F.priorityLow] = 10;
+
+  // Relevance
+  weights[F.relevancePriorityArea] = 25;
+  weights[F.relevanceParent] = profile?.kidsCount > 0 ? 20 : 0;
+  weights[F.relevanceHomeowner] = profile?.homeOwnership === 'own' ? 15 : 0;
+  weights[F.relevanceLocation] = 15;
+
+  // Timing
+  weights[F.timingDoNow] = 15;
+  weights[F.timingSaveForLater] = -10;
+  weights[F.timingWeekend] = context?.isWeekend ? 0 : -15;
+
+  // Prevention and seasonal urgency
+  weights[F.prevents] = 15;
+  weights[F.isSeasonal] = 10;
+
+  // Patterns: neglected categories need attention, favorites get a nudge
+  RANKING_CATEGORIES.forEach(category => {
+    let weight = 0;
+    if (patterns?.neglectedCategories?.includes(category)) weight += 20;
+    if (patterns?.favoriteCategories?.includes(category)) weight += 10;
+    weights[F[`category:${category}`]] = weight;
+  });
+
+  if (!weightModel) return weights;
+
+  // The model works on a copy, so a failure mid-update leaves the defaults intact
+  try {
+    const learned = weights.slice();
+    return weightModel(learned, { profile, patterns, context }) || learned;
+  } catch (error) {
+    console.error('Ranking weight model failed, using defaults:', error);
+    return weights;
+  }
+}
+
+// =============================================
+// SCORING + TOP-K
+// =============================================
+
+/**
+ * Dot product of every feature row with the weights
+ */
+export function scoreBatch(featureRows, weights) {
+  const scores = new Float64Array(featureRows.length);
+  for (let i = 0; i < featureRows.length; i++) {
+    const row = featureRows[i];
+    let score = 0;
+    for (let f = 0; f < FEATURE_COUNT; f++) {
+      score += row[f] * weights[f];
+    }
+    scores[i] = score;
+  }
+  return scores;
+}
+
+// Is candidate a ranked below b? Ties go to the earlier candidate, like a stable sort.
+function ranksBelow(scores, a, b) {
+  return scores[a] < scores[b] || (scores[a] === scores[b] && a > b);
+}
+
+/**
+ * Indices of the k best scores, best first, using a bounded min-heap
+ */
+export function topK(scores, k) {
+  const heap = [];
+
+  const siftUp = (i) => {
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (!ranksBelow(scores, heap[i], heap[parent])) break;
+      [heap[i], heap[parent]] = [heap[parent], heap[i]];
+      i = parent;
+    }
+  };
+  const siftDown = (i) => {
+    for (;;) {
+      const left = 2 * i + 1;
+      const right = left + 1;
+      let lowest = i;
+      if (left < heap.length && ranksBelow(scores, heap[left], heap[lowest])) lowest = left;
+      if (right < heap.length && ranksBelow(scores, heap[right], heap[lowest])) lowest = right;
+      if (lowest === i) break;
+      [heap[i], heap[lowest]] = [heap[lowest], heap[i]];
+      i = lowest;
+    }
+  };
+
+  for (let i = 0; i < scores.length; i++) {
+    if (heap.length < k) {
+      heap.push(i);
+      siftUp(heap.length - 1);
+    } else if (k > 0 && ranksBelow(scores, heap[0], i)) {
+      heap[0] = i;
+      siftDown(0);
+    }
+  }
+
+  return heap.sort((a, b) => (ranksBelow(scores, a, b) ? 1 : -1));
+}
+
+/**
+ * Rank tasks by relevance and keep the top k. Returns the selected tasks,
+ * best first, each with its `relevanceScore` set.
+ */
+export function rankTopK(tasks, featureRows, weights, k) {
+  const scores = scoreBatch(featureRows, weights);
+  return topK(scores, k).map(index => {
+    tasks[index].relevanceScore = scores[index];
+    return tasks[index];
+  });
+}
@@ -0,0 +1,320 @@
+/**
+ * Rate limiting for the AI endpoints
+ * Two algorithms over one pluggable store:
+ *   - slidingWindow: sliding-window counter (current + weighted previous
+ *     window), two counter reads and one increment per check
+ *   - tokenBucket: bursty traffic with a steady refill, one small
+ *     read-modify-write per check
+ * The Firestore store keeps counters in sharded docs so hot keys don't hit
+ * the per-document write limit and every serverless instance sees the same
+ * counts. The memory store is for tests and local development.
+ */
+
+export interface BucketState {
+  tokens: number;
+  updatedAt: number;
+}
+
+export interface RateLimitStore {
+  getCount(key: string): Promise<number>;
+  incrementCount(key: string, cost: number, expiresAt: number): Promise<void>;
+  transactBucket<R>(
+    key: string,
+    update: (state: BucketState | null) => { next: BucketState; result: R },
+    expiresAt: number
+  ): Promise<R>;
+}
+
+export interface RateLimitResult {
+  allowed: boolean;
+  limit: number;
+  remaining: number;
+  retryAfterMs: number;
+}
+
+export interface RateLimiter {
+  check(id: string, cost?: number): Promise<RateLimitResult>;
+}
+
+const RATE_LIMITS = 'rateLimits';
+const RATE_LIMIT_SHARDS = 'rateLimitShards';
+const MEMORY_STORE_MAX_KEYS = 10000;
+
+// =============================================
+// STORES
+// =============================================
+
+export class MemoryRateLimitStore implements RateLimitStore {
+  private counts = new Map<string, { count: number; expiresAt: number }>();
+  private buckets = new Map<string, { state: BucketState; expiresAt: number }>();
+
+  constructor(private clock: () => number = Date.now) {}
+
+  async getCount(key: string): Promise<number> {
+    const entry = this.counts.get(key);
+    return entry && entry.expiresAt > this.clock() ? entry.count : 0;
+  }
+
+  async incrementCount(key: string, cost: number, expiresAt: number): Promise<void> {
+    const current = await this.getCount(key);
+    this.counts.set(key, { count: current + cost, expiresAt });
+    this.sweep(this.counts);
+  }
+
+  async transactBucket<R>(
+    key: string,
+    update: (state: BucketState | null) => { next: BucketState; result: R },
+    expiresAt: number
+  ): Promise<R> {
+    const entry = this.buckets.get(key);
+    const { next, result } = update(entry && entry.expiresAt > this.clock() ? entry.state : null);
+    this.buckets.set(key, { state: next, expiresAt });
+    this.sweep(this.buckets);
+    return result;
+  }
+
+  // Drop expired keys once the map gets large, so it can't grow forever
+  private sweep(map: Map<string, { expiresAt: number }>): void {
+    if (map.size <= MEMORY_STORE_MAX_KEYS) return;
+    const now = this.clock();
+    for (const [key, entry] of map) {
+      if (entry.expiresAt <= now) map.delete(key);
+    }
+    while (map.size > MEMORY_STORE_MAX_KEYS) {
+      map.delete(map.keys().next().value as string);
+    }
+  }
+}
+
+/**
+ * Counters live in `rateLimits/{key}/rateLimitShards/{n}`; an increment
+ * touches one random shard (a blind FieldValue.increment, no read) and a read
+ * sums the shards with one query. Token buckets are a single doc updated in a
+ * transaction. The TTL policy on `expireAt` removes old windows.
+ */
+export class FirestoreRateLimitStore implements RateLimitStore {
+  // Loaded lazily so importing this module never pulls in the Admin SDK
+  private db = import('@/lib/firebase-admin').then(module => module.adminDb);
+  private firestore = import('firebase-admin/firestore');
+
+  constructor(private shards: number = 4) {}
+
+  // Ids come from user ids and IPs; '/' would be read as a path separator
+  private docId(key: string): string {
+    return key.replace(/\//g, '_');
+  }
+
+  private async database() {
+    const db = await this.db;
+    if (!db) throw new Error('Firestore admin not configured');
+    return db;
+  }
+
+  async getCount(key: string): Promise<number> {
+    const db = await this.database();
+    const snapshot = await db.collection(RATE_LIMITS).doc(this.docId(key)).collection(RATE_LIMIT_SHARDS).get();
+    return snapshot.docs.reduce((sum, doc) => sum + (doc.data().count || 0), 0);
+  }
+
+  async incrementCount(key: string, cost: number, expiresAt: number): Promise<void> {
+    const db = await this.database();
+    const { FieldValue, Timestamp } = await this.firestore;
+    const shard = Math.floor(Math.random() * this.shards).toString();
+    await db.collection(RATE_LIMITS).doc(this.docId(key)).collection(RATE_LIMIT_SHARDS).doc(shard).set({
+      count: FieldValue.increment(cost),
+      expireAt: Timestamp.fromMillis(expiresAt)
+    }, { merge: true });
+  }
+
+  async transactBucket<R>(
+    key: string,
+    update: (state: BucketState | null) => { next: BucketState; result: R },
+    expiresAt: number
+  ): Promise<R> {
+    const db = await this.database();
+    const { Timestamp } = await this.firestore;
+    const ref = db.collection(RATE_LIMITS).doc(this.docId(key));
+
+    return db.runTransaction(async (transaction) => {
+      const snapshot = await transaction.get(ref);
+      const data = snapshot.data();
+      const live = data && data.expireAt.toMillis() > Date.now();
+      const { next, result } = update(live ? { tokens: data.tokens, updatedAt: data.updatedAt } : null);
+      transaction.set(ref, { ...next, expireAt: Timestamp.fromMillis(expiresAt) });
+      return result;
+    });
+  }
+}
+
+let defaultStore: RateLimitStore | null = null;
+
+/**
+ * Firestore when the Admin SDK is configured (and RATE_LIMIT_STORE isn't
+ * 'memory'), otherwise process memory
+ */
+export function getDefaultRateLimitStore(): RateLimitStore {
+  if (!defaultStore) {
+    const useFirestore = process.env.RATE_LIMIT_STORE !== 'memory' &&
+      !!process.env.FIREBASE_ADMIN_CLIENT_EMAIL &&
+      !!process.env.FIREBASE_ADMIN_PRIVATE_KEY;
+    defaultStore = useFirestore ? new FirestoreRateLimitStore() : new MemoryRateLimitStore();
+  }
+  return defaultStore;
+}
+
+// =============================================
+// ALGORITHMS
+// =============================================
+
+// A store outage shouldn't take the AI features down with it
+function failOpen(name: string, limit: number, error: unknown): RateLimitResult {
+  console.error(`Rate limiter ${name} unavailable, allowing request:`, error);
+  return { allowed: true, limit, remaining: limit, retryAfterMs: 0 };
+}
+
+/**
+ * Sliding-window counter: the previous fixed window's count is weighted by
+ * how much of it still overlaps the sliding window. Concurrent checks can
+ * overshoot by a request or two - fine for abuse protection.
+ */
+export function slidingWindow({
+  name,
+  limit,
+  windowMs,
+  store = getDefaultRateLimitStore(),
+  clock = Date.now
+}: {
+  name: string;
+  limit: number;
+  windowMs: number;
+  store?: RateLimitStore;
+  clock?: () => number;
+}): RateLimiter {
+  return {
+    async check(id: string, cost = 1): Promise<RateLimitResult> {
+      const now = clock();
+      const window = Math.floor(now / windowMs);
+      const elapsed = (now % windowMs) / windowMs;
+      const currentKey = `${name}_${id}_${window}`;
+
+      try {
+        const [previous, current] = await Promise.all([
+          store.getCount(`${name}_${id}_${window - 1}`),
+          store.getCount(currentKey)
+        ]);
+        const estimate = previous * (1 - elapsed) + current;
+
+        if (estimate + cost > limit) {
+          // Time until enough of the previous window slides out (or this one ends)
+          const retryAfterMs = previous > 0
+            ? Math.ceil(Math.min(1 - elapsed, (estimate + cost - limit) / previous) * windowMs)
+            : Math.ceil((1 - elapsed) * windowMs);
+          return { allowed: false, limit, remaining: 0, retryAfterMs };
+        }
+
+        // Keep each window until the following one has fully slid past it
+        await store.incrementCount(currentKey, cost, (window + 2) * windowMs);
+        return { allowed: true, limit, remaining: Math.max(0, Math.floor(limit - estimate - cost)), retryAfterMs: 0 };
+      } catch (error) {
+        return failOpen(name, limit, error);
+      }
+    }
+  };
+}
+
+/**
+ * Token bucket: up to `capacity` requests at once, refilled at
+ * `refillPerSecond`
+ */
+export function tokenBucket({
+  name,
+  capacity,
+  refillPerSecond,
+  store = getDefaultRateLimitStore(),
+  clock = Date.now
+}: {
+  name: string;
+  capacity: number;
+  refillPerSecond: number;
+  store?: RateLimitStore;
+  clock?: () => number;
+}): RateLimiter {
+  // An idle bucket is full again after this long, so its state can expire
+  const refillMs = Math.ceil((capacity / refillPerSecond) * 1000);
+
+  return {
+    async check(id: string, cost = 1): Promise<RateLimitResult> {
+      const now = clock();
+
+      try {
+        return await store.transactBucket(`${name}_${id}`, (state) => {
+          const elapsedSeconds = state ? Math.max(0, now - state.updatedAt) / 1000 : 0;
+          const tokens = state ? Math.min(capacity, state.tokens + elapsedSeconds * refillPerSecond) : capacity;
+
+          if (tokens < cost) {
+            return {
+              next: { tokens, updatedAt: now },
+              result: {
+                allowed: false,
+                limit: capacity,
+                remaining: 0,
+                retryAfterMs: Math.ceil(((cost - tokens) / refillPerSecond) * 1000)
+              }
+            };
+          }
+
+          return {
+            next: { tokens: tokens - cost, updatedAt: now },
+            result: { allowed: true, limit: capacity, remaining: Math.floor(tokens - cost), retryAfterMs: 0 }
+          };
+        }, now + refillMs);
+      } catch (error) {
+        return failOpen(name, capacity, error);
+      }
+    }
+  };
+}
+
+// =============================================
+// AI ROUTE HELPERS
+// =============================================
+
+const aiLimiters = new Map<string, RateLimiter>();
+
+function aiLimiter(route: string, create: () => RateLimiter): RateLimiter {
+  if (!aiLimiters.has(route)) aiLimiters.set(route, create());
+  return aiLimiters.get(route)!;
+}
+
+// Per-route burst limits, keyed by user (or client IP when there is none)
+export function getAiRateLimiter(route: 'sidekick-chat' | 'ai-checkin' | 'ai-breakdown' | 'transcribe'): RateLimiter {
+  switch (route) {
+    case 'sidekick-chat':
+      return aiLimiter(route, () => tokenBucket({ name: 'sidekickChat', capacity: 5, refillPerSecond: 0.2 }));
+    case 'ai-checkin':
+      return aiLimiter(route, () => slidingWindow({ name: 'aiCheckin', limit: 30, windowMs: 60 * 1000 }));
+    case 'ai-breakdown':
+      return aiLimiter(route, () => slidingWindow({ name: 'aiBreakdown', limit: 20, windowMs: 60 * 1000 }));
+    case 'transcribe':
+      // The voice recorder uploads one request per 10s segment
+      return aiLimiter(route, () => slidingWindow({ name: 'transcribe', limit: 120, windowMs: 10 * 60 * 1000 }));
+  }
+}
+
+/**
+ * Caller identity for rate limiting: the user id when the route has one,
+ * otherwise the first forwarded client IP
+ */
+export function rateLimitId(request: Request, userId?: string | null): string {
+  if (userId) return `user:${userId}`;
+  const forwarded = request.headers.get('x-forwarded-for')?.split(',')[0].trim();
+  return `ip:${forwarded || request.headers.get('x-real-ip') || 'unknown'}`;
+}
+
+export function rateLimitHeaders(result: RateLimitResult): Record<string, string> {
+  return {
+    'X-RateLimit-Limit': String(result.limit),
+    'X-RateLimit-Remaining': String(result.remaining),
+    ...(result.allowed ? {} : { 'Retry-After': String(Math.ceil(result.retryAfterMs / 1000)) })
+  };
+}
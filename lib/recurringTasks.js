@@ -1,3 +1,5 @@
+import { loadCatalog } from './catalogs/loadCatalog';
+
 // Recurring task utilities
 export const RECURRENCE_TYPES = {
   DAILY: 'daily',
@@ -90,180 +92,7 @@ export const getRecurrenceDescription = (recurringTask) => {
   }
 };
 
-// Sample recurring tasks for different dad scenarios
-export const SAMPLE_RECURRING_TASKS = {
-  // Daily routines
-  daily: [
-    {
-      title: 'Make her morning coffee',
-      detail: 'Start her day right',
-      category: 'relationship',
-      priority: 'low',
-      recurrenceType: RECURRENCE_TYPES.DAILY
-    },
-    {
-      title: 'Check diaper bag supplies',
-      detail: 'Diapers, wipes, bottles',
-      category: 'baby',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.DAILY
-    }
-  ],
-  
-  // Weekday routines
-  weekdays: [
-    {
-      title: 'Prep daycare bottles',
-      detail: 'Label and pack for tomorrow',
-      category: 'baby',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKDAYS
-    },
-    {
-      title: 'Check work calendar together',
-      detail: 'Coordinate schedules',
-      category: 'relationship',
-      priority: 'low',
-      recurrenceType: RECURRENCE_TYPES.WEEKDAYS
-    }
-  ],
-  
-  // Weekend routines
-  weekends: [
-    {
-      title: 'Plan family activity',
-      detail: 'Park, zoo, or stay-in fun',
-      category: 'relationship',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKENDS
-    },
-    {
-      title: 'Deep clean kitchen',
-      detail: 'Weekly reset',
-      category: 'household',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKENDS
-    }
-  ],
-  
-  // Specific day routines
-  weekly: [
-    {
-      title: 'Take out trash',
-      detail: 'Pickup is Tuesday',
-      category: 'household',
-      priority: 'low',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.MONDAY
-    },
-    {
-      title: 'Grocery shopping',
-      detail: 'Weekly food run',
-      category: 'household',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SATURDAY
-    },
-    {
-      title: 'Date night planning',
-      detail: 'Book sitter, plan activity',
-      category: 'relationship',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.FRIDAY
-    }
-  ],
-  
-  // Monthly maintenance tasks
-  monthly: [
-    {
-      title: 'Test smoke detectors',
-      detail: 'Check batteries and functionality',
-      category: 'maintenance',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SUNDAY,
-      monthlyInterval: 1 // Every 4 weeks
-    },
-    {
-      title: 'Check HVAC filter',
-      detail: 'Replace if dirty',
-      category: 'maintenance',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SATURDAY,
-      monthlyInterval: 1
-    },
-    {
-      title: 'Clean dryer vent',
-      detail: 'Remove lint buildup',
-      category: 'maintenance',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SUNDAY,
-      monthlyInterval: 3 // Every 3 months
-    }
-  ],
-  
-  // Health & appointment reminders
-  health: [
-    {
-      title: 'Schedule dentist cleanings',
-      detail: 'Family checkups every 6 months',
-      category: 'health',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.MONDAY,
-      monthlyInterval: 6 // Every 6 months
-    },
-    {
-      title: 'Annual physical reminder',
-      detail: 'Book for you and partner',
-      category: 'health', 
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.FRIDAY,
-      monthlyInterval: 12 // Once per year
-    },
-    {
-      title: 'Kids wellness checkup',
-      detail: 'Pediatrician visit',
-      category: 'health',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.TUESDAY,
-      monthlyInterval: 6 // Every 6 months for young kids
-    }
-  ],
-  
-  // Seasonal tasks
-  seasonal: [
-    {
-      title: 'Winterize outdoor faucets',
-      detail: 'Prevent pipe freeze',
-      category: 'maintenance',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SATURDAY,
-      seasonalTiming: 'fall'
-    },
-    {
-      title: 'Schedule HVAC service',
-      detail: 'Before heating/cooling season',
-      category: 'maintenance',
-      priority: 'medium',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SUNDAY,
-      seasonalTiming: 'spring_fall'
-    },
-    {
-      title: 'Inspect roof and gutters',
-      detail: 'Check for winter damage',
-      category: 'maintenance',
-      priority: 'high',
-      recurrenceType: RECURRENCE_TYPES.WEEKLY,
-      weekDay: DAYS_OF_WEEK.SATURDAY,
-      seasonalTiming: 'spring'
-    }
-  ]
-};
+// Sample recurring tasks for different dad scenarios, loaded on first use
+export function loadSampleRecurringTasks() {
+  return loadCatalog('recurringSamples', () => import('./catalogs/recurringSamples'));
+}
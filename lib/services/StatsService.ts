@@ -0,0 +1,183 @@
+/**
+ * StatsService - Aggregation-backed dashboard counters
+ * Uses Firestore count() aggregations and the per-day completion rollups
+ * (lib/dailyStats) so the stats header costs a handful of reads no matter
+ * how many tasks a user has
+ */
+
+import {
+  collection,
+  query,
+  where,
+  orderBy,
+  limit,
+  getDocs,
+  getCountFromServer,
+  startAfter,
+  Timestamp,
+  Firestore,
+  Query,
+  QueryDocumentSnapshot,
+  QuerySnapshot
+} from 'firebase/firestore';
+import { UserId } from '../../types/models';
+import { currentStreak, getDailyStatsRange, localDateKey, previousDay, recentFromRollups } from '@/lib/dailyStats';
+
+export interface DashboardCounts {
+  tasksCompletedToday: number;
+  tasksCreatedToday: number;
+  weeklyCompletions: number[]; // Sun-Sat, future days are 0
+  streak: number; // Consecutive days with completions, through today or yesterday
+}
+
+export interface OverviewCounts {
+  createdToday: number;
+  completedToday: number;
+  upcoming: UpcomingTask[];
+}
+
+export interface UpcomingTask {
+  id: string;
+  title: string;
+  createdAt: any; // Firestore Timestamp
+  completedAt?: any;
+}
+
+// Today's tasks are read this many times `upcomingLimit` at a time while
+// looking for open ones, for at most MAX_OPEN_TASK_PAGES pages
+const OPEN_TASK_PAGE_FACTOR = 4;
+const MAX_OPEN_TASK_PAGES = 2;
+
+// Midnight (local time) of the given date
+export function startOfDay(date: Date = new Date()): Date {
+  const start = new Date(date);
+  start.setHours(0, 0, 0, 0);
+  return start;
+}
+
+class StatsService {
+  private db: Firestore;
+  private readonly collection = 'tasks';
+
+  constructor(db: Firestore) {
+    this.db = db;
+  }
+
+  private async count(q: Query): Promise<number> {
+    const snapshot = await getCountFromServer(q);
+    return snapshot.data().count;
+  }
+
+  private countCreatedSince(userId: UserId, since: Timestamp): Promise<number> {
+    return this.count(query(
+      collection(this.db, this.collection),
+      where('userId', '==', userId),
+      where('createdAt', '>=', since)
+    ));
+  }
+
+  /**
+   * Counters for DashboardStats: completed today, created today and
+   * completions per day of the current week (Sun-Sat), plus the streak
+   * Costs one aggregation plus the week's daily rollups (at most 8 small docs)
+   */
+  async getDashboardCounts(userId: UserId, now: Date = new Date()): Promise<DashboardCounts> {
+    if (!this.db) throw new Error('Database not initialized');
+    if (!userId) throw new Error('User ID is required');
+
+    const today = startOfDay(now);
+    const weekStart = new Date(today);
+    weekStart.setDate(today.getDate() - today.getDay());
+
+    const [tasksCreatedToday, rollups] = await Promise.all([
+      this.countCreatedSince(userId, Timestamp.fromDate(today)),
+      // From yesterday at the latest, for the streak
+      getDailyStatsRange(this.db, userId, weekStart < today ? weekStart : previousDay(today), today)
+    ]);
+
+    const weeklyCompletions = [0, 0, 0, 0, 0, 0, 0];
+    for (let dayIndex = 0; dayIndex <= today.getDay(); dayIndex++) {
+      const date = new Date(weekStart);
+      date.setDate(weekStart.getDate() + dayIndex);
+      weeklyCompletions[dayIndex] = Math.max(0, rollups[localDateKey(date)]?.completed || 0);
+    }
+
+    return {
+      tasksCompletedToday: weeklyCompletions[today.getDay()],
+      tasksCreatedToday,
+      weeklyCompletions,
+      streak: currentStreak(recentFromRollups(rollups, now))
+    };
+  }
+
+  /**
+   * Oldest open tasks created since `since`. Not every task creator writes
+   * completedAt, and an equality filter on null skips docs missing the
+   * field, so today's tasks are paged in creation order and filtered here.
+   * Reads are bounded: after MAX_OPEN_TASK_PAGES pages a busy day returns
+   * fewer than `max`
+   */
+  private async getOpenTasksCreatedSince(userId: UserId, since: Timestamp, max: number): Promise<UpcomingTask[]> {
+    const open: UpcomingTask[] = [];
+    let cursor: QueryDocumentSnapshot | null = null;
+
+    for (let pages = 0; pages < MAX_OPEN_TASK_PAGES && open.length < max; pages++) {
+      const page: QuerySnapshot = await getDocs(query(
+        collection(this.db, this.collection),
+        where('userId', '==', userId),
+        where('createdAt', '>=', since),
+        orderBy('createdAt', 'asc'),
+        ...(cursor ? [startAfter(cursor)] : []),
+        limit(max * OPEN_TASK_PAGE_FACTOR)
+      ));
+
+      page.docs.forEach(docSnap => {
+        const data = docSnap.data();
+        if (!data.completedAt && open.length < max) {
+          open.push({ ...data, id: docSnap.id } as UpcomingTask);
+        }
+      });
+
+      if (page.size < max * OPEN_TASK_PAGE_FACTOR) break;
+      cursor = page.docs[page.docs.length - 1];
+    }
+
+    return open;
+  }
+
+  /**
+   * Counters for QuickOverview: tasks created today, how many of those are
+   * done, and the next few open ones. Two aggregations plus a page or two of today's tasks
+   */
+  async getOverviewCounts(userId: UserId, upcomingLimit = 3, now: Date = new Date()): Promise<OverviewCounts> {
+    if (!this.db) throw new Error('Database not initialized');
+    if (!userId) throw new Error('User ID is required');
+
+    const startOfToday = Timestamp.fromDate(startOfDay(now));
+
+    const [createdToday, completedToday, upcoming] = await Promise.all([
+      this.countCreatedSince(userId, startOfToday),
+      this.count(query(
+        collection(this.db, this.collection),
+        where('userId', '==', userId),
+        where('createdAt', '>=', startOfToday),
+        where('completedAt', '>', Timestamp.fromMillis(0))
+      )),
+      this.getOpenTasksCreatedSince(userId, startOfToday, upcomingLimit)
+    ]);
+
+    return { createdToday, completedToday, upcoming };
+  }
+}
+
+// Export singleton instance factory
+let statsServiceInstance: StatsService | null = null;
+
+export function createStatsService(db: Firestore): StatsService {
+  if (!statsServiceInstance || statsServiceInstance['db'] !== db) {
+    statsServiceInstance = new StatsService(db);
+  }
+  return statsServiceInstance;
+}
+
+export default StatsService;
@@ -18,6 +18,7 @@ import {
   limit,
   serverTimestamp,
   writeBatch,
+  runTransaction,
   Firestore,
   DocumentData,
   QuerySnapshot,
@@ -27,6 +28,7 @@ import {
 import { Task, TaskId, UserId, TaskCategory, TaskPriority, TaskStatus, TaskSource, Subtask, User } from '../../types/models';
 import { getAiService } from '@/lib/ai/AiService';
 import { AiSuggestion } from '@/types/ai';
+import { prepareRollupWrites, CompletionChange } from '@/lib/dailyStats';
 
 // Task Status Constants (using enum from types)
 export { TaskStatus, TaskCategory, TaskPriority, TaskSource } from '../../types/models';
@@ -323,7 +325,22 @@ class TaskService {
 
     try {
       const taskRef = doc(this.db, this.collection, taskId);
-      await updateDoc(taskRef, updateData);
+      if (updates.completed !== undefined) {
+        // Completion changes update the daily rollup in the same transaction
+        await runTransaction(this.db, async (transaction) => {
+          const taskDoc = await transaction.get(taskRef);
+          if (!taskDoc.exists()) throw new Error('Task not found');
+          const writeRollups = await prepareRollupWrites(
+            transaction,
+            this.db,
+            this.completionChanges([taskDoc], updates.completed as boolean)
+          );
+          transaction.update(taskRef, updateData);
+          writeRollups();
+        });
+      } else {
+        await updateDoc(taskRef, updateData);
+      }
       
       console.log('✅ Task updated:', taskId);
       
@@ -348,6 +365,17 @@ class TaskService {
     }
   }
 
+  // Rollup changes for tasks about to be (un)completed; tasks already in that state don't count
+  private completionChanges(taskDocs: DocumentSnapshot[], completed: boolean): CompletionChange[] {
+    const now = new Date();
+    return taskDocs.flatMap(taskDoc => {
+      const data = taskDoc.data();
+      if (!data?.userId || Boolean(data.completedAt) === completed) return [];
+      const at = completed ? now : (data.completedAt?.toDate?.() || new Date(data.completedAt));
+      return [{ userId: data.userId, category: data.category, at, delta: completed ? 1 : -1 }];
+    });
+  }
+
   // Complete a task
   async completeTask(taskId: TaskId): Promise<Task> {
     return this.updateTask(taskId, {
@@ -429,21 +457,25 @@ class TaskService {
       throw new Error('Task IDs array is required');
     }
 
-    const batch = writeBatch(this.db);
     const timestamp = serverTimestamp();
-
-    taskIds.forEach(taskId => {
-      const taskRef = doc(this.db, this.collection, taskId);
-      batch.update(taskRef, {
-        status: TaskStatus.COMPLETED,
-        completed: true,
-        completedAt: timestamp,
-        updatedAt: timestamp
-      });
-    });
+    const taskRefs = taskIds.map(taskId => doc(this.db, this.collection, taskId));
 
     try {
-      await batch.commit();
+      // One transaction so the daily rollup moves with the tasks
+      await runTransaction(this.db, async (transaction) => {
+        const taskDocs = await Promise.all(taskRefs.map(taskRef => transaction.get(taskRef)));
+        const writeRollups = await prepareRollupWrites(transaction, this.db, this.completionChanges(taskDocs, true));
+
+        taskRefs.forEach(taskRef => {
+          transaction.update(taskRef, {
+            status: TaskStatus.COMPLETED,
+            completed: true,
+            completedAt: timestamp,
+            updatedAt: timestamp
+          });
+        });
+        writeRollups();
+      });
       console.log(`✅ Completed ${taskIds.length} tasks`);
     } catch (error) {
       console.error('❌ Error completing tasks:', error);
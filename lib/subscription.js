@@ -1,18 +1,19 @@
 import { doc, getDoc, setDoc, updateDoc, Timestamp } from 'firebase/firestore';
 import { db } from '@/lib/firebase';
+import { CHAT_USAGE_COLLECTION, MONTHLY_CHAT_LIMITS, isUnlimitedTesting, monthlyChatLimit, monthlyUsageKey } from '@/lib/chatUsage';
 
 // Subscription tiers
 export const SUBSCRIPTION_TIERS = {
   free: {
     name: 'Free',
     price: 0,
-    chatLimit: 3,
+    chatLimit: MONTHLY_CHAT_LIMITS.free,
     features: ['Basic task management', 'Emergency modes', '3 AI chats per month']
   },
   premium: {
     name: 'Betterish Pro',
     price: 9.99,
-    chatLimit: 100,
+    chatLimit: MONTHLY_CHAT_LIMITS.premium,
     features: [
       'Unlimited AI sidekick chat',
       'Advanced project breakdowns',
@@ -24,7 +25,7 @@ export const SUBSCRIPTION_TIERS = {
   family: {
     name: 'Betterish Family',
     price: 14.99,
-    chatLimit: 150,
+    chatLimit: MONTHLY_CHAT_LIMITS.family,
     features: [
       'Everything in Pro',
       'Shared family dashboard',
@@ -83,69 +84,76 @@ export async function getUserSubscription(userId) {
   }
 }
 
+// Per-session caches: tier per user, last known usage per user-month
+const tierCache = new Map();
+const usageCache = new Map();
+
+// Cache the tier until the subscription expires
+function cacheTier(userId, subscription) {
+  const expiresAt = subscription.tier !== 'free' && subscription.expiresAt
+    ? subscription.expiresAt.toMillis()
+    : Infinity;
+  tierCache.set(userId, { tier: subscription.tier || 'free', expiresAt });
+}
+
+// Get user's subscription tier, read once per session
+export async function getSubscriptionTier(userId) {
+  const cached = tierCache.get(userId);
+  if (cached && cached.expiresAt > Date.now()) return cached.tier;
+
+  const subscription = await getUserSubscription(userId);
+  cacheTier(userId, subscription);
+  return subscription.tier || 'free';
+}
+
 // Get monthly chat usage
 export async function getMonthlyUsage(userId) {
+  const { usageId } = monthlyUsageKey(userId);
+  if (usageCache.has(usageId)) return usageCache.get(usageId);
+
   try {
-    const now = new Date();
-    const monthKey = `${now.getFullYear()}-${(now.getMonth() + 1).toString().padStart(2, '0')}`;
-    
-    const usageRef = doc(db, 'chatUsage', `${userId}_${monthKey}`);
+    const usageRef = doc(db, CHAT_USAGE_COLLECTION, usageId);
     const usageDoc = await getDoc(usageRef);
-    
-    return usageDoc.exists() ? usageDoc.data().count || 0 : 0;
+    const count = usageDoc.exists() ? usageDoc.data().count || 0 : 0;
+    usageCache.set(usageId, count);
+    return count;
   } catch (error) {
     console.error('Error getting monthly usage:', error);
     return 0;
   }
 }
 
-// Increment chat usage
-export async function incrementChatUsage(userId) {
-  try {
-    const now = new Date();
-    const monthKey = `${now.getFullYear()}-${(now.getMonth() + 1).toString().padStart(2, '0')}`;
-    
-    const usageRef = doc(db, 'chatUsage', `${userId}_${monthKey}`);
-    const usageDoc = await getDoc(usageRef);
-    
-    if (usageDoc.exists()) {
-      await updateDoc(usageRef, {
-        count: (usageDoc.data().count || 0) + 1,
-        lastUsed: Timestamp.now()
-      });
-    } else {
-      await setDoc(usageRef, {
-        userId,
-        monthKey,
-        count: 1,
-        createdAt: Timestamp.now(),
-        lastUsed: Timestamp.now()
-      });
-    }
-  } catch (error) {
-    console.error('Error incrementing chat usage:', error);
+/**
+ * Record a chat the server metered. `used` is the count it reported; without
+ * one the cached count is bumped. Failed chats are refunded server-side, so
+ * they're never recorded.
+ */
+export function recordChatUsage(userId, used) {
+  const { usageId } = monthlyUsageKey(userId);
+  if (typeof used === 'number') {
+    usageCache.set(usageId, used);
+  } else if (usageCache.has(usageId)) {
+    usageCache.set(usageId, usageCache.get(usageId) + 1);
   }
 }
 
-// Check if user can use chat
+// Check if user can use chat (for display; /api/sidekick-chat is the enforcing check)
 export async function canUseChat(userId, userTier) {
   // Development/testing mode - unlimited access
-  if (process.env.NODE_ENV === 'development' || process.env.NEXT_PUBLIC_UNLIMITED_TESTING === 'true') {
-    return { allowed: true, remaining: 'unlimited' };
-  }
-  
-  if (userTier === 'premium' || userTier === 'family') {
+  if (isUnlimitedTesting()) {
     return { allowed: true, remaining: 'unlimited' };
   }
   
+  const tier = userTier || await getSubscriptionTier(userId);
   const usage = await getMonthlyUsage(userId);
-  const limit = SUBSCRIPTION_TIERS.free.chatLimit;
+  const limit = monthlyChatLimit(tier);
   
   return {
     allowed: usage < limit,
     remaining: Math.max(0, limit - usage),
     used: usage,
-    limit
+    limit,
+    tier
   };
 }
 
@@ -169,6 +177,7 @@ export async function createPremiumSubscription(userId, tier = 'premium') {
     
     const subRef = doc(db, 'subscriptions', userId);
     await setDoc(subRef, subscription);
+    cacheTier(userId, subscription);
     
     return subscription;
   } catch (error) {
@@ -186,6 +195,7 @@ export async function cancelSubscription(userId) {
       cancelledAt: Timestamp.now(),
       updatedAt: Timestamp.now()
     });
+    tierCache.delete(userId);
     
     return true;
   } catch (error) {
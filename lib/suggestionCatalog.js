@@ -0,0 +1,339 @@
+/**
+ * Suggestion Catalog
+ * Every task that generatePersonalizedTasks can suggest, compiled once at
+ * module load into a frozen index keyed by category, month, state, day of
+ * week, time of day and kid age. Selecting candidates is a lookup plus a few
+ * cheap predicates; the catalog itself is never rebuilt or mutated.
+ *
+ * Titles can carry `{kid}` / `{spouse}` placeholders, filled in when selected.
+ */
+
+import { staticTaskFeatures } from './rankingEngine';
+
+const FALL = [8, 9, 10];
+const SPRING = [2, 3, 4];
+const HURRICANE_MONTHS = [5, 6, 7, 8, 9, 10];
+const WILDFIRE_MONTHS = [5, 6, 7, 8, 9, 10];
+
+const HURRICANE_STATES = ['FL', 'TX', 'LA', 'MS', 'AL', 'GA', 'SC', 'NC'];
+const SNOW_STATES = ['ME', 'NH', 'VT', 'NY', 'MA', 'CT', 'RI', 'PA', 'MI', 'WI', 'MN', 'ND', 'SD', 'MT', 'ID', 'WY', 'CO', 'UT'];
+const WILDFIRE_STATES = ['CA', 'OR', 'WA', 'NV', 'AZ', 'NM', 'CO', 'UT', 'ID', 'MT', 'WY'];
+
+const MAX_KID_AGE = 18;
+
+// Predicates shared by catalog entries
+const isHomeowner = (context, profile) => profile?.homeOwnership === 'own';
+const isRenter = (context, profile) => profile?.homeOwnership !== 'own';
+const hasKids = (context, profile) => profile?.kidsCount > 0;
+const isMorning = (context) => context.isMorning;
+const isEvening = (context) => context.isEvening;
+const isWeekend = (context) => context.isWeekend;
+const hasSchoolAgeKids = (context, profile) =>
+  hasKids(context, profile) && (profile.kidsAges || []).some(age => age >= 5 && age <= 18);
+
+/**
+ * Helper: Get season from month
+ */
+export function getSeason(month) {
+  if (month >= 2 && month <= 4) return 'spring';
+  if (month >= 5 && month <= 7) return 'summer';
+  if (month >= 8 && month <= 10) return 'fall';
+  return 'winter';
+}
+
+// =============================================
+// CATALOG
+// =============================================
+
+const REGIONAL = [
+  // Southern states (hurricane season)
+  { states: HURRICANE_STATES, months: HURRICANE_MONTHS, task: { title: 'Check hurricane supplies', description: 'Water, batteries, first aid', category: 'household', priority: 'high', timeEstimate: '30 minutes', isRegional: true } },
+  { states: HURRICANE_STATES, months: HURRICANE_MONTHS, task: { title: 'Review evacuation plan', description: 'Know your routes and zones', category: 'household', priority: 'medium', timeEstimate: '15 minutes', isRegional: true } },
+  // Northern states (winter prep)
+  { states: SNOW_STATES, months: [9, 10], task: { title: 'Schedule snow removal service', description: 'They book up fast', category: 'maintenance', priority: 'high', timeEstimate: '20 minutes', isRegional: true } },
+  { states: SNOW_STATES, months: [9, 10], task: { title: 'Stock ice melt and sand', description: 'Before the first storm', category: 'household', priority: 'medium', timeEstimate: '30 minutes', isRegional: true } },
+  // Western states (wildfire season)
+  { states: WILDFIRE_STATES, months: WILDFIRE_MONTHS, task: { title: 'Create defensible space', description: 'Clear brush around home', category: 'maintenance', priority: 'high', timeEstimate: '2 hours', isRegional: true } },
+  { states: WILDFIRE_STATES, months: WILDFIRE_MONTHS, task: { title: 'Pack go-bag for evacuations', description: 'Documents, meds, essentials', category: 'household', priority: 'high', timeEstimate: '45 minutes', isRegional: true } }
+];
+
+const SEASONAL = [
+  // Homeowner-specific seasonal tasks
+  { months: FALL, when: isHomeowner, task: { title: 'Clean gutters before winter', description: 'Prevent ice dams and water damage', category: 'maintenance', priority: 'high', timeEstimate: '2 hours', isHomeownerOnly: true } },
+  { months: FALL, when: isHomeowner, task: { title: 'Winterize outdoor faucets', description: 'Prevent frozen pipes', category: 'maintenance', priority: 'high', timeEstimate: '30 minutes', isHomeownerOnly: true } },
+  { months: FALL, when: isHomeowner, task: { title: 'Schedule furnace inspection', description: 'Ensure heating ready for winter', category: 'maintenance', priority: 'medium', timeEstimate: '10 minutes to schedule', isHomeownerOnly: true } },
+  { months: SPRING, when: isHomeowner, task: { title: 'Schedule AC service', description: 'Before the first heat wave', category: 'maintenance', priority: 'medium', timeEstimate: '10 minutes to schedule', isHomeownerOnly: true } },
+  { months: SPRING, when: isHomeowner, task: { title: 'Check roof for winter damage', description: 'Catch problems early', category: 'maintenance', priority: 'medium', timeEstimate: '30 minutes', isHomeownerOnly: true } },
+  // Kid-specific seasonal tasks
+  { months: [7, 8], when: hasSchoolAgeKids, task: { title: 'Shop for school supplies', description: 'Beat the back-to-school rush', category: 'baby', priority: 'high', timeEstimate: '1 hour' } },
+  { months: [7, 8], when: hasSchoolAgeKids, task: { title: 'Schedule back-to-school checkups', description: 'Sports physicals, dental, vision', category: 'baby', priority: 'high', timeEstimate: '20 minutes' } },
+  { months: [9, 10], when: hasKids, task: { title: 'Plan Halloween costumes', description: 'Before the good ones sell out', category: 'baby', priority: 'medium', timeEstimate: '30 minutes' } }
+];
+
+const isWeekdayEvening = (context) => context.dayOfWeek >= 1 && context.dayOfWeek <= 5 && context.isEvening;
+
+const KIDS = [
+  // Baby/Toddler (0-3)
+  { ages: [0, 3], when: isEvening, task: { title: 'Prep {kid}\'s bottles for tonight', description: 'Set up for night feeds', category: 'baby', priority: 'high', timeEstimate: '10 minutes' } },
+  { ages: [0, 3], when: isMorning, task: { title: 'Pack diaper bag for {kid}', description: 'Ready for today\'s outings', category: 'baby', priority: 'medium', timeEstimate: '5 minutes' } },
+  { ages: [1, 1], task: { title: 'Schedule 12-month checkup', description: 'Important developmental milestone', category: 'baby', priority: 'high', timeEstimate: '10 minutes' } },
+  { ages: [2, 2], task: { title: 'Research preschools', description: 'Good ones have 6+ month waitlists', category: 'baby', priority: 'medium', timeEstimate: '30 minutes' } },
+  // Preschool (4-5)
+  { ages: [4, 5], when: isEvening, task: { title: 'Read with {kid}', description: '15 minutes of connection', category: 'baby', priority: 'high', timeEstimate: '15 minutes' } },
+  { ages: [4, 5], task: { title: 'Plan {kid}\'s playdate', description: 'Social skills development', category: 'baby', priority: 'medium', timeEstimate: '10 minutes' } },
+  // School age (6-12)
+  { ages: [6, 12], when: isWeekdayEvening, task: { title: 'Check {kid}\'s homework', description: 'Stay involved in their education', category: 'baby', priority: 'high', timeEstimate: '15 minutes' } },
+  { ages: [6, 12], when: isWeekdayEvening, task: { title: 'Ask {kid} about their day', description: 'Build communication habits now', category: 'baby', priority: 'high', timeEstimate: '10 minutes' } },
+  { ages: [6, 12], when: isWeekend, task: { title: 'Plan weekend activity with {kid}', description: 'Make memories together', category: 'baby', priority: 'medium', timeEstimate: '20 minutes' } },
+  // Teen (13-18)
+  { ages: [13, 18], task: { title: 'Check in with {kid}', description: 'Teen years need connection too', category: 'baby', priority: 'high', timeEstimate: '10 minutes' } },
+  { ages: [15, 18], task: { title: 'Discuss driving plans', description: 'Permits, lessons, insurance', category: 'baby', priority: 'medium', timeEstimate: '20 minutes' } },
+  { ages: [16, 18], task: { title: 'Review college savings', description: 'Time is running out for {kid}', category: 'personal', priority: 'high', timeEstimate: '30 minutes' } }
+];
+
+const HOUSEHOLD = [
+  // Time-of-day specific
+  { when: isMorning, task: { title: 'Make your bed', description: 'Start the day with a win', category: 'household', priority: 'low', timeEstimate: '2 minutes' } },
+  { when: isEvening, task: { title: 'Prep coffee for tomorrow', description: 'Future you will thank you', category: 'household', priority: 'low', timeEstimate: '2 minutes' } },
+  { when: isEvening, task: { title: '10-minute tidy', description: 'Reset main living areas', category: 'household', priority: 'medium', timeEstimate: '10 minutes' } },
+  // Weekend tasks
+  { when: (context, profile) => context.isWeekend && isHomeowner(context, profile), task: { title: 'Mow the lawn', description: 'Before it gets too long', category: 'household', priority: 'medium', timeEstimate: '45 minutes', isHomeownerOnly: true } },
+  { when: (context, profile) => context.isWeekend && isHomeowner(context, profile), task: { title: 'Check for home repairs', description: 'Walk through and make a list', category: 'maintenance', priority: 'low', timeEstimate: '20 minutes', isHomeownerOnly: true } },
+  { when: (context, profile) => context.isWeekend && isRenter(context, profile), task: { title: 'Deep clean one room', description: 'Rotate through apartment weekly', category: 'household', priority: 'medium', timeEstimate: '30 minutes' } },
+  // Day-specific tasks
+  { days: [0], task: { title: 'Meal prep for the week', description: 'Save time on busy weekdays', category: 'household', priority: 'medium', timeEstimate: '1 hour' } },
+  { days: [1], task: { title: 'Take out trash', description: 'Start the week fresh', category: 'household', priority: 'medium', timeEstimate: '5 minutes' } },
+  { days: [5], task: { title: 'Clean out fridge', description: 'Before weekend shopping', category: 'household', priority: 'low', timeEstimate: '10 minutes' } },
+  { days: [6], task: { title: 'Change bed sheets', description: 'Fresh sheets for the weekend', category: 'household', priority: 'medium', timeEstimate: '10 minutes' } }
+];
+
+const RELATIONSHIPS_WITH_PARTNER = [
+  { when: isEvening, task: { title: 'Ask {spouse} about their day', description: 'Show genuine interest', category: 'relationship', priority: 'high', timeEstimate: '10 minutes' } },
+  { when: (context) => context.dayOfWeek === 5, task: { title: 'Plan weekend with {spouse}', description: 'Coordinate schedules and fun', category: 'relationship', priority: 'medium', timeEstimate: '15 minutes' } },
+  { when: isWeekend, task: { title: 'Date activity with {spouse}', description: 'Even 30 minutes counts', category: 'relationship', priority: 'high', timeEstimate: '30 minutes' } },
+  // Random acts of love
+  { task: { title: 'Surprise {spouse} with their favorite', description: 'Coffee, snack, or note', category: 'relationship', priority: 'low', timeEstimate: '5 minutes' } },
+  { task: { title: 'Thank {spouse} for something specific', description: 'Appreciation matters', category: 'relationship', priority: 'medium', timeEstimate: '2 minutes' } }
+];
+
+const RELATIONSHIPS_GENERIC = [
+  { task: { title: 'Text an old friend', description: 'Maintain connections', category: 'relationship', priority: 'low', timeEstimate: '5 minutes' } },
+  { task: { title: 'Call family member', description: 'They miss hearing from you', category: 'relationship', priority: 'medium', timeEstimate: '15 minutes' } }
+];
+
+const QUICK_WINS = {
+  morning: [
+    { task: { title: 'Drink a full glass of water', description: 'Start hydrated', category: 'personal', priority: 'low', timeEstimate: '1 minute' } },
+    { task: { title: 'Write 3 priorities for today', description: 'Focus your energy', category: 'personal', priority: 'medium', timeEstimate: '3 minutes' } }
+  ],
+  afternoon: [
+    { task: { title: 'Take a 5-minute walk', description: 'Reset your energy', category: 'personal', priority: 'low', timeEstimate: '5 minutes' } },
+    { task: { title: 'Clear your desk', description: 'Fresh space, fresh mind', category: 'household', priority: 'low', timeEstimate: '3 minutes' } }
+  ],
+  evening: [
+    { task: { title: 'Set out tomorrow\'s clothes', description: 'Smoother morning', category: 'personal', priority: 'low', timeEstimate: '2 minutes' } },
+    { task: { title: 'Charge all devices', description: 'Ready for tomorrow', category: 'household', priority: 'low', timeEstimate: '1 minute' } }
+  ],
+  night: [
+    { task: { title: 'Brain dump tomorrow\'s tasks', description: 'Sleep better', category: 'personal', priority: 'low', timeEstimate: '5 minutes' } },
+    { task: { title: 'Set coffee timer', description: 'Wake up to fresh coffee', category: 'household', priority: 'low', timeEstimate: '1 minute' } }
+  ]
+};
+
+const QUICK_WINS_UNIVERSAL = [
+  { task: { title: 'Delete 10 photos', description: 'Free up phone space', category: 'personal', priority: 'low', timeEstimate: '2 minutes' } },
+  { task: { title: 'Unsubscribe from 1 email', description: 'Reduce inbox noise', category: 'personal', priority: 'low', timeEstimate: '1 minute' } },
+  { task: { title: 'Text someone thanks', description: 'Spread gratitude', category: 'relationship', priority: 'low', timeEstimate: '2 minutes' } }
+];
+
+const PERSONAL = [
+  // Parent-specific self-care
+  { when: (context, profile) => hasKids(context, profile) && context.isEvening, task: { title: 'Take 10 minutes for yourself', description: 'After kids are in bed', category: 'personal', priority: 'high', timeEstimate: '10 minutes' } },
+  { when: hasKids, task: { title: 'Schedule your own checkup', description: 'Parents need care too', category: 'personal', priority: 'medium', timeEstimate: '10 minutes' } },
+  // Time-based personal tasks
+  { when: (context) => context.energyLevel === 'high', task: { title: 'Tackle hardest task first', description: 'Use peak energy wisely', category: 'personal', priority: 'high', timeEstimate: '30 minutes' } },
+  { when: (context) => context.energyLevel === 'low', task: { title: 'Do easy wins only', description: 'Match tasks to energy', category: 'personal', priority: 'medium', timeEstimate: '10 minutes' } },
+  // Always include some general personal tasks
+  { task: { title: 'Drink a full glass of water', description: 'Stay hydrated', category: 'personal', priority: 'low', timeEstimate: '1 minute' } },
+  { task: { title: 'Take 10 deep breaths', description: 'Reset your nervous system', category: 'personal', priority: 'low', timeEstimate: '2 minutes' } },
+  { task: { title: 'Schedule doctor checkup', description: 'When did you last go?', category: 'personal', priority: 'medium', timeEstimate: '5 minutes' } },
+  { task: { title: 'Update LinkedIn profile', description: 'Keep career options open', category: 'personal', priority: 'low', timeEstimate: '15 minutes' } },
+  { task: { title: 'Listen to 1 podcast episode', description: 'Learn something new', category: 'personal', priority: 'low', timeEstimate: '30 minutes' } },
+  { task: { title: 'Read for 15 minutes', description: 'Expand your knowledge', category: 'personal', priority: 'low', timeEstimate: '15 minutes' } },
+  { task: { title: 'Stretch for 5 minutes', description: 'Relieve tension', category: 'personal', priority: 'low', timeEstimate: '5 minutes' } },
+  { task: { title: 'Review weekly goals', description: 'Stay on track', category: 'personal', priority: 'medium', timeEstimate: '10 minutes' } },
+  { task: { title: 'Call a friend', description: 'Maintain connections', category: 'personal', priority: 'medium', timeEstimate: '15 minutes' } },
+  { task: { title: 'Plan tomorrow', description: 'Set yourself up for success', category: 'personal', priority: 'medium', timeEstimate: '10 minutes' } }
+];
+
+const isProjectTime = (context) => context.isWeekend && context.energyLevel === 'high';
+
+const PROJECTS = [
+  { when: (context, profile) => isProjectTime(context) && isHomeowner(context, profile), task: { title: 'Start one house project', description: 'Pick from your list and begin', category: 'home_projects', priority: 'medium', timeEstimate: '2 hours', isProject: true } },
+  { when: (context, profile) => isProjectTime(context) && isHomeowner(context, profile), task: { title: 'Fix one annoying thing', description: 'That drawer, squeak, or drip', category: 'home_projects', priority: 'medium', timeEstimate: '30 minutes' } },
+  { when: (context, profile) => isProjectTime(context) && isRenter(context, profile), task: { title: 'Rearrange one room', description: 'Fresh perspective, no cost', category: 'home_projects', priority: 'low', timeEstimate: '1 hour' } },
+  { when: (context, profile) => isProjectTime(context) && isRenter(context, profile), task: { title: 'Deep organize one closet', description: 'Donate what you don\'t use', category: 'home_projects', priority: 'medium', timeEstimate: '45 minutes' } }
+];
+
+const PREVENTION = [
+  // Monthly prevention tasks
+  { months: [0], task: { title: 'Review insurance policies', description: 'New year, check coverage', category: 'personal', priority: 'medium', timeEstimate: '30 minutes', prevents: 'Underinsurance' } },
+  { months: [3], task: { title: 'Check tax documents', description: 'Before deadline panic', category: 'personal', priority: 'high', timeEstimate: '45 minutes', prevents: 'Tax penalties' } },
+  { months: [5], task: { title: 'Test smoke detectors', description: 'Replace batteries if needed', category: 'household', priority: 'high', timeEstimate: '10 minutes', prevents: 'Fire danger' } },
+  { months: [9], task: { title: 'Flu shots for family', description: 'Before flu season peaks', category: 'health', priority: 'high', timeEstimate: '45 minutes', prevents: 'Flu outbreak' } },
+  // Always include general prevention tasks
+  { task: { title: 'Check tire pressure', description: 'Prevents uneven wear', category: 'personal', priority: 'medium', timeEstimate: '10 minutes', prevents: 'Expensive tire replacement' } },
+  { task: { title: 'Clean dryer vent', description: 'Fire prevention', category: 'household', priority: 'high', timeEstimate: '15 minutes', prevents: 'House fires' } },
+  { task: { title: 'Update important passwords', description: 'Security maintenance', category: 'personal', priority: 'medium', timeEstimate: '15 minutes', prevents: 'Identity theft' } },
+  { task: { title: 'Back up phone photos', description: 'Protect memories', category: 'personal', priority: 'medium', timeEstimate: '10 minutes', prevents: 'Lost memories' } },
+  { task: { title: 'Schedule car maintenance', description: 'Keep vehicle healthy', category: 'personal', priority: 'medium', timeEstimate: '5 minutes', prevents: 'Expensive repairs' } },
+  { task: { title: 'Check water heater', description: 'Look for rust or leaks', category: 'maintenance', priority: 'medium', timeEstimate: '2 minutes', prevents: 'Flooding disaster' } },
+  { task: { title: 'Review subscriptions', description: 'Cancel unused services', category: 'personal', priority: 'low', timeEstimate: '15 minutes', prevents: 'Wasted money' } },
+  { task: { title: 'Check credit report', description: 'Spot issues early', category: 'personal', priority: 'medium', timeEstimate: '20 minutes', prevents: 'Credit problems' } },
+  // Homeowner prevention
+  { when: isHomeowner, task: { title: 'Check HVAC filter', description: 'Monthly = better air & efficiency', category: 'maintenance', priority: 'medium', timeEstimate: '5 minutes', prevents: 'System failure' } },
+  { when: isHomeowner, task: { title: 'Inspect roof shingles', description: 'Catch damage early', category: 'maintenance', priority: 'medium', timeEstimate: '15 minutes', prevents: 'Water damage' } },
+  { when: isHomeowner, task: { title: 'Test sump pump', description: 'Before rainy season', category: 'maintenance', priority: 'high', timeEstimate: '5 minutes', prevents: 'Basement flooding' } }
+];
+
+// =============================================
+// INDEX
+// =============================================
+
+function compileEntries(entries) {
+  return Object.freeze(entries.map(entry => Object.freeze({
+    ...entry,
+    task: Object.freeze({ ...entry.task }),
+    // Ranking features that don't depend on the user (see rankingEngine)
+    features: staticTaskFeatures(entry.task),
+    templated: /\{(kid|spouse)\}/.test(entry.task.title + entry.task.description)
+  })));
+}
+
+// One frozen list per key, keeping catalog order within each list
+function indexBy(entries, keys, field) {
+  const index = {};
+  keys.forEach(key => {
+    index[key] = Object.freeze(entries.filter(entry => !entry[field] || entry[field].includes(key)));
+  });
+  return Object.freeze(index);
+}
+
+const MONTHS = [...Array(12).keys()];
+const DAYS = [...Array(7).keys()];
+const KID_AGES = [...Array(MAX_KID_AGE + 1).keys()];
+
+// Null-prototype lookup table, so keys like 'constructor' miss cleanly
+function frozenRecord(entries) {
+  return Object.freeze(Object.assign(Object.create(null), Object.fromEntries(entries)));
+}
+
+function compileCatalog() {
+  const regional = compileEntries(REGIONAL);
+  const kids = compileEntries(KIDS);
+  const regionalStates = [...new Set(REGIONAL.flatMap(entry => entry.states))];
+
+  return Object.freeze({
+    seasonal: indexBy(compileEntries(SEASONAL), MONTHS, 'months'),
+    regional: frozenRecord(regionalStates.map(state => [
+      state,
+      indexBy(regional.filter(entry => entry.states.includes(state)), MONTHS, 'months')
+    ])),
+    kids: frozenRecord(KID_AGES.map(age => [
+      age,
+      Object.freeze(kids.filter(entry => age >= entry.ages[0] && age <= entry.ages[1]))
+    ])),
+    household: indexBy(compileEntries(HOUSEHOLD), DAYS, 'days'),
+    relationships: Object.freeze({
+      partner: compileEntries(RELATIONSHIPS_WITH_PARTNER),
+      generic: compileEntries(RELATIONSHIPS_GENERIC)
+    }),
+    quickWins: frozenRecord(Object.entries(QUICK_WINS).map(([timeOfDay, entries]) => [
+      timeOfDay,
+      compileEntries([...entries, ...QUICK_WINS_UNIVERSAL])
+    ])),
+    personal: compileEntries(PERSONAL),
+    projects: compileEntries(PROJECTS),
+    prevention: indexBy(compileEntries(PREVENTION), MONTHS, 'months')
+  });
+}
+
+export const SUGGESTION_CATALOG = compileCatalog();
+
+// =============================================
+// SELECTION
+// =============================================
+
+function fillTemplate(text, vars) {
+  return text.replace(/\{(kid|spouse)\}/g, (match, name) => vars[name] ?? match);
+}
+
+// A candidate is a shared catalog task plus the few fields specific to this
+// user (filled-in names, kid age). Nothing in the catalog is copied or changed.
+function collect(candidates, entries, context, profile, vars = null, extra = null) {
+  for (const entry of entries) {
+    if (entry.when && !entry.when(context, profile)) continue;
+    const fields = entry.templated
+      ? { title: fillTemplate(entry.task.title, vars), description: fillTemplate(entry.task.description, vars), ...extra }
+      : extra;
+    candidates.push({ task: entry.task, fields, features: entry.features });
+  }
+}
+
+// Under-zero ages read as babies; unparseable or adult ages have no tasks
+function kidAgeBucket(ageNum) {
+  if (Number.isNaN(ageNum) || ageNum > MAX_KID_AGE) return null;
+  return Math.max(0, ageNum);
+}
+
+/**
+ * Candidate tasks for a browse category, in catalog order
+ */
+export function selectCatalogTasks(category, context, profile) {
+  const catalog = SUGGESTION_CATALOG;
+  const candidates = [];
+
+  switch (category) {
+    case 'seasonal': {
+      const regional = catalog.regional[profile?.state];
+      if (regional) collect(candidates, regional[context.month], context, profile);
+      collect(candidates, catalog.seasonal[context.month], context, profile);
+      break;
+    }
+    case 'quick-wins':
+      collect(candidates, catalog.quickWins[context.timeOfDay] || catalog.quickWins.afternoon, context, profile);
+      break;
+    case 'personal':
+      collect(candidates, catalog.personal, context, profile);
+      break;
+    case 'household':
+      collect(candidates, catalog.household[context.dayOfWeek], context, profile);
+      break;
+    case 'kids': {
+      if (!profile?.kidsCount) break;
+      (profile.kidsAges || []).forEach((age, index) => {
+        const ageNum = parseInt(age);
+        const bucket = kidAgeBucket(ageNum);
+        if (bucket === null) return;
+        const kid = profile.kidsCount > 1 ? `Kid ${index + 1}` : 'Your child';
+        collect(candidates, catalog.kids[bucket], context, profile, { kid }, { ageSpecific: ageNum });
+      });
+      break;
+    }
+    case 'relationships':
+      if (profile?.spouseName) {
+        collect(candidates, catalog.relationships.partner, context, profile, { spouse: profile.spouseName });
+      } else {
+        collect(candidates, catalog.relationships.generic, context, profile);
+      }
+      break;
+    case 'projects':
+      collect(candidates, catalog.projects, context, profile);
+      break;
+    case 'prevention':
+      collect(candidates, catalog.prevention[context.month], context, profile);
+      break;
+  }
+
+  return candidates;
+}
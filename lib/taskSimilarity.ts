@@ -0,0 +1,136 @@
+/**
+ * Task Similarity Index - "does the user already have this task?"
+ * Built once per task snapshot. Lookups check a hash of the normalized title
+ * first, then a trigram inverted index scored by Jaccard similarity, so a
+ * query only touches titles that share a trigram with it instead of scanning
+ * every task.
+ */
+
+export interface SimilarMatch<T> {
+  item: T;
+  title: string;
+  score: number; // 1 for an exact normalized match, otherwise trigram Jaccard
+}
+
+// Titles this close (trigram Jaccard) are treated as the same task
+export const DEFAULT_SIMILARITY_THRESHOLD = 0.6;
+
+const FILLER_WORDS = new Set(['a', 'an', 'the', 'my', 'your', 'our', 'some']);
+
+/**
+ * Lowercase, drop punctuation and filler words, collapse whitespace, so
+ * "Take out the trash!" and "take out trash" compare equal
+ */
+export function normalizeTitle(title: string | null | undefined): string {
+  return (title || '')
+    .toLowerCase()
+    .replace(/[^a-z0-9\s]/g, ' ')
+    .split(/\s+/)
+    .filter(word => word && !FILLER_WORDS.has(word))
+    .join(' ');
+}
+
+function trigrams(normalized: string): Set<string> {
+  const padded = `  ${normalized} `;
+  const grams = new Set<string>();
+  for (let i = 0; i < padded.length - 2; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+export class TaskSimilarityIndex<T = unknown> {
+  private exact = new Map<string, number>();
+  private postings = new Map<string, number[]>();
+  private entries: Array<{ item: T; title: string; gramCount: number }> = [];
+
+  constructor(private threshold: number = DEFAULT_SIMILARITY_THRESHOLD) {}
+
+  get size(): number {
+    return this.entries.length;
+  }
+
+  add(title: string | null | undefined, item: T): void {
+    const normalized = normalizeTitle(title);
+    if (!normalized) return;
+
+    const id = this.entries.length;
+    const grams = trigrams(normalized);
+    this.entries.push({ item, title: title as string, gramCount: grams.size });
+    if (!this.exact.has(normalized)) this.exact.set(normalized, id);
+
+    grams.forEach(gram => {
+      const list = this.postings.get(gram);
+      if (list) list.push(id);
+      else this.postings.set(gram, [id]);
+    });
+  }
+
+  /**
+   * Best match at or above the threshold, or null
+   */
+  findSimilar(title: string | null | undefined, threshold: number = this.threshold): SimilarMatch<T> | null {
+    const normalized = normalizeTitle(title);
+    if (!normalized) return null;
+
+    const exactId = this.exact.get(normalized);
+    if (exactId !== undefined) {
+      const entry = this.entries[exactId];
+      return { item: entry.item, title: entry.title, score: 1 };
+    }
+
+    // Count shared trigrams per candidate, touching only overlapping titles
+    const grams = trigrams(normalized);
+    const shared = new Map<number, number>();
+    grams.forEach(gram => {
+      this.postings.get(gram)?.forEach(id => shared.set(id, (shared.get(id) || 0) + 1));
+    });
+
+    let best: SimilarMatch<T> | null = null;
+    shared.forEach((count, id) => {
+      const entry = this.entries[id];
+      const score = count / (grams.size + entry.gramCount - count);
+      if (score >= threshold && (!best || score > best.score)) {
+        best = { item: entry.item, title: entry.title, score };
+      }
+    });
+    return best;
+  }
+
+  has(title: string | null | undefined, threshold?: number): boolean {
+    return this.findSimilar(title, threshold) !== null;
+  }
+}
+
+// One index per task array; a new snapshot (new array) gets a new index
+const snapshotIndexes = new WeakMap<object, TaskSimilarityIndex<any>>();
+
+/**
+ * Index over the titles of a task snapshot, built once per array
+ */
+export function getTaskSimilarityIndex<T extends { title?: string | null }>(tasks: T[]): TaskSimilarityIndex<T> {
+  let index = snapshotIndexes.get(tasks);
+  if (!index) {
+    index = new TaskSimilarityIndex<T>();
+    tasks.forEach(task => index!.add(task?.title, task));
+    snapshotIndexes.set(tasks, index);
+  }
+  return index;
+}
+
+/**
+ * Drop suggestions the user already has, and repeats within the list itself
+ */
+export function dedupeSuggestions<S extends { title?: string | null }>(
+  suggestions: S[],
+  existingTasks: Array<{ title?: string | null }> = []
+): S[] {
+  const existing = getTaskSimilarityIndex(existingTasks);
+  const kept = new TaskSimilarityIndex<S>();
+
+  return suggestions.filter(suggestion => {
+    if (existing.has(suggestion.title) || kept.has(suggestion.title)) return false;
+    kept.add(suggestion.title, suggestion);
+    return true;
+  });
+}
@@ -0,0 +1,102 @@
+/**
+ * Streaming voice transcription
+ * The recorder closes a self-contained audio segment every VOICE_SEGMENT_MS
+ * and hands it here while the user keeps talking. Segments upload in order as
+ * raw request bodies to /api/transcribe, each with the tail of the transcript
+ * so far as a Whisper prompt so words carry across segment boundaries. When
+ * recording stops only the last short segment is still outstanding.
+ */
+
+export const VOICE_SEGMENT_MS = 10 * 1000;
+
+const PROMPT_CHARS = 200;       // Whisper only reads the last ~224 tokens of a prompt
+const MAX_ATTEMPTS = 2;
+
+export class TranscriptionRequestError extends Error {
+  constructor(public status: number, message: string) {
+    super(message);
+    this.name = 'TranscriptionRequestError';
+  }
+}
+
+export class StreamingTranscriber {
+  private queue: Promise<void> = Promise.resolve();
+  private segments: string[] = [];
+  private controller = new AbortController();
+  private failure: Error | null = null;
+
+  constructor(private onPartial?: (text: string) => void) {}
+
+  // Transcript of the segments finished so far
+  get text(): string {
+    return this.segments.join(' ');
+  }
+
+  /**
+   * Queue a segment for upload; segments are transcribed in the order pushed
+   */
+  push(segment: Blob): void {
+    if (segment.size === 0) return;
+    this.queue = this.queue
+      .then(() => this.uploadWithRetry(segment))
+      .catch(error => {
+        // Later segments are skipped; finish() reports the first failure
+        if (!this.failure) this.failure = error as Error;
+      });
+  }
+
+  /**
+   * Wait for every queued segment and return the full transcript
+   */
+  async finish(): Promise<string> {
+    await this.queue;
+    if (this.failure) throw this.failure;
+    return this.text;
+  }
+
+  get aborted(): boolean {
+    return this.controller.signal.aborted;
+  }
+
+  abort(): void {
+    this.controller.abort();
+  }
+
+  private async uploadWithRetry(segment: Blob): Promise<void> {
+    if (this.failure || this.controller.signal.aborted) return;
+
+    for (let attempt = 1; ; attempt++) {
+      try {
+        await this.upload(segment);
+        return;
+      } catch (error) {
+        const retryable = !(error instanceof TranscriptionRequestError) || error.status >= 500;
+        if (attempt >= MAX_ATTEMPTS || !retryable || this.controller.signal.aborted) throw error;
+      }
+    }
+  }
+
+  private async upload(segment: Blob): Promise<void> {
+    const prompt = this.text.slice(-PROMPT_CHARS);
+    const url = prompt ? `/api/transcribe?prompt=${encodeURIComponent(prompt)}` : '/api/transcribe';
+
+    const response = await fetch(url, {
+      method: 'POST',
+      headers: { 'Content-Type': segment.type || 'audio/webm' },
+      body: segment,
+      signal: this.controller.signal
+    });
+
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}));
+      throw new TranscriptionRequestError(response.status, errorData.error || response.statusText || 'Unknown error');
+    }
+
+    const data = await response.json();
+    const text = (data.text || '').trim();
+    if (text) {
+      this.segments.push(text);
+      this.onPartial?.(this.text);
+    }
+  }
+}
@@ -0,0 +1,37 @@
+#!/usr/bin/env node
+
+/**
+ * Stamp updatedAt on tasks that don't have one
+ * The duplicate detector only reads tasks by updatedAt, and tasks created
+ * before the stampTaskUpdatedAt trigger often have none. They're stamped with
+ * the current time so the next detector run picks them up. Run once after
+ * deploying the trigger.
+ *
+ * Usage: node scripts/backfill-task-updated-at.js [--dry-run]
+ */
+
+const { admin, runMaintenance } = require('./lib/maintenance');
+
+async function backfillTaskUpdatedAt(dryRun) {
+  console.log(`🔄 Stamping updatedAt on tasks without one${dryRun ? ' (dry run)' : ''}...\n`);
+
+  const report = await runMaintenance({
+    name: 'task updatedAt',
+    collection: 'tasks',
+    dryRun,
+    handle: (doc, { ops, report }) => {
+      if (doc.get('updatedAt')) return;
+      ops.update(doc.ref, { updatedAt: admin.firestore.FieldValue.serverTimestamp() });
+      report.count('stamped');
+    }
+  });
+
+  console.log(`✅ ${dryRun ? 'Would stamp' : 'Stamped'} ${report.counters.stamped || 0} of ${report.scanned} tasks`);
+}
+
+backfillTaskUpdatedAt(process.argv.includes('--dry-run'))
+  .then(() => process.exit(0))
+  .catch(error => {
+    console.error('❌ Backfill failed:', error);
+    process.exit(1);
+  });
@@ -5,61 +5,26 @@
  * This gives us a clean slate to work with the new architecture
  */
 
-const admin = require('firebase-admin');
-
-// Initialize Firebase Admin
-if (!admin.apps.length) {
-  admin.initializeApp({
-    projectId: 'betterish'
-  });
-}
-
-const db = admin.firestore();
+const { runMaintenance } = require('./lib/maintenance');
 
 async function deleteAllTasks() {
   console.log('🗑️  Starting complete task deletion...\n');
   
   try {
-    // Get all tasks
-    const tasksRef = db.collection('tasks');
-    const snapshot = await tasksRef.get();
+    // Partitioned scan; deletes stream through the shared BulkWriter
+    const report = await runMaintenance({
+      name: 'delete tasks',
+      collection: 'tasks',
+      handle: (doc, { ops }) => ops.delete(doc.ref)
+    });
     
-    if (snapshot.empty) {
+    if (report.scanned === 0) {
       console.log('✅ No tasks found. Database is already clean.');
       return;
     }
     
-    console.log(`Found ${snapshot.size} tasks to delete.\n`);
-    
-    // Delete in batches of 500 (Firestore limit)
-    const batchSize = 500;
-    let batch = db.batch();
-    let operationCount = 0;
-    let totalDeleted = 0;
-    
-    for (const doc of snapshot.docs) {
-      batch.delete(doc.ref);
-      operationCount++;
-      
-      if (operationCount === batchSize) {
-        // Commit this batch
-        await batch.commit();
-        totalDeleted += operationCount;
-        console.log(`Deleted ${totalDeleted} tasks...`);
-        
-        // Start new batch
-        batch = db.batch();
-        operationCount = 0;
-      }
-    }
-    
-    // Commit any remaining operations
-    if (operationCount > 0) {
-      await batch.commit();
-      totalDeleted += operationCount;
-    }
-    
-    console.log(`\n✅ Successfully deleted ${totalDeleted} tasks.`);
+    const failed = report.counters.failed || 0;
+    console.log(`\n✅ Successfully deleted ${report.written - failed} tasks.`);
     console.log('🎯 Database is now clean and ready for fresh data!\n');
     
   } catch (error) {
@@ -3,28 +3,13 @@
 /**
  * Firebase Admin Cleanup Script
  * This script permanently removes problematic template tasks from Firebase
- * Run with: node scripts/firebase-cleanup.js
+ * Run with: node scripts/firebase-cleanup.js [--dry-run]
  */
 
-require('dotenv').config({ path: '.env.local' });
-const admin = require('firebase-admin');
+const { admin, runMaintenance } = require('./lib/maintenance');
 
-// Initialize Firebase Admin SDK
-if (!admin.apps.length) {
-  const serviceAccount = {
-    type: "service_account",
-    project_id: process.env.NEXT_PUBLIC_FIREBASE_PROJECT_ID || 'betterish',
-    client_email: process.env.FIREBASE_ADMIN_CLIENT_EMAIL,
-    private_key: process.env.FIREBASE_ADMIN_PRIVATE_KEY?.replace(/\\n/g, '\n'),
-  };
-
-  admin.initializeApp({
-    credential: admin.credential.cert(serviceAccount),
-    projectId: 'betterish'
-  });
-}
-
-const db = admin.firestore();
+const DRY_RUN = process.argv.includes('--dry-run');
+const SAMPLES_PER_REASON = 3;
 
 // Template patterns to delete
 const TEMPLATE_ID_PREFIXES = [
@@ -82,93 +67,89 @@ const TEMPLATE_TITLES = [
   'Update project status',
 ];
 
+/**
+ * Why a task should be deleted, or null to keep it
+ */
+function classifyTask(taskId, taskData) {
+  // Check for template ID prefixes
+  if (TEMPLATE_ID_PREFIXES.some(prefix => taskId.toLowerCase().startsWith(prefix))) {
+    return 'Template ID prefix';
+  }
+  
+  // Check for template titles
+  if (taskData.title && TEMPLATE_TITLES.some(title => 
+    taskData.title.toLowerCase().trim() === title.toLowerCase()
+  )) {
+    return 'Template title match';
+  }
+  
+  // Check for very short IDs (likely templates)
+  if (taskId.length < 15 && /^[a-z]+_?\d*$/i.test(taskId)) {
+    return 'Suspicious short ID';
+  }
+  
+  // Check for missing critical fields
+  if (!taskData.title || !taskData.userId || !taskData.createdAt) {
+    return 'Missing critical fields';
+  }
+  
+  // Check for tasks with no userId (orphaned)
+  if (taskData.userId === 'undefined' || taskData.userId === 'null') {
+    return 'Orphaned task (no valid userId)';
+  }
+  
+  // Check for corrupted timestamps
+  if (!(taskData.createdAt instanceof admin.firestore.Timestamp)) {
+    return 'Invalid timestamp format';
+  }
+  
+  // Check for very old tasks that might be test data
+  try {
+    if (taskData.createdAt.toDate().getFullYear() < 2023) {
+      return 'Very old task (pre-2023)';
+    }
+  } catch (e) {
+    return 'Date conversion error';
+  }
+  
+  return null;
+}
+
 async function cleanupAllUsers() {
-  console.log('🚀 Starting comprehensive Firebase cleanup...\n');
+  console.log(`🚀 Starting comprehensive Firebase cleanup${DRY_RUN ? ' (dry run)' : ''}...\n`);
   
   try {
-    // Get ALL tasks from the database
-    const tasksSnapshot = await db.collection('tasks').get();
-    console.log(`📊 Found ${tasksSnapshot.size} total tasks in database\n`);
-    
-    let deletedCount = 0;
-    let userTaskCounts = new Map();
-    const tasksToDelete = [];
+    const userTaskCounts = new Map();
+    const tasksByReason = {};
     
-    // Analyze each task
-    tasksSnapshot.forEach((doc) => {
-      const taskId = doc.id;
-      const taskData = doc.data();
-      const userId = taskData.userId || 'unknown';
-      
-      // Count tasks per user
-      userTaskCounts.set(userId, (userTaskCounts.get(userId) || 0) + 1);
-      
-      let shouldDelete = false;
-      let reason = '';
-      
-      // Check for template ID prefixes
-      if (TEMPLATE_ID_PREFIXES.some(prefix => taskId.toLowerCase().startsWith(prefix))) {
-        shouldDelete = true;
-        reason = 'Template ID prefix';
-      }
-      
-      // Check for template titles
-      else if (taskData.title && TEMPLATE_TITLES.some(title => 
-        taskData.title.toLowerCase().trim() === title.toLowerCase()
-      )) {
-        shouldDelete = true;
-        reason = 'Template title match';
-      }
-      
-      // Check for very short IDs (likely templates)
-      else if (taskId.length < 15 && /^[a-z]+_?\d*$/i.test(taskId)) {
-        shouldDelete = true;
-        reason = 'Suspicious short ID';
-      }
-      
-      // Check for missing critical fields
-      else if (!taskData.title || !taskData.userId || !taskData.createdAt) {
-        shouldDelete = true;
-        reason = 'Missing critical fields';
-      }
-      
-      // Check for tasks with no userId (orphaned)
-      else if (!taskData.userId || taskData.userId === 'undefined' || taskData.userId === 'null') {
-        shouldDelete = true;
-        reason = 'Orphaned task (no valid userId)';
-      }
-      
-      // Check for corrupted timestamps
-      else if (taskData.createdAt && !(taskData.createdAt instanceof admin.firestore.Timestamp)) {
-        shouldDelete = true;
-        reason = 'Invalid timestamp format';
-      }
-      
-      // Check for very old tasks that might be test data
-      else if (taskData.createdAt) {
-        try {
-          const date = taskData.createdAt.toDate();
-          if (date.getFullYear() < 2023) {
-            shouldDelete = true;
-            reason = 'Very old task (pre-2023)';
-          }
-        } catch (e) {
-          shouldDelete = true;
-          reason = 'Date conversion error';
+    // Classify and delete in one partitioned pass instead of loading every task first
+    const report = await runMaintenance({
+      name: 'template cleanup',
+      collection: 'tasks',
+      dryRun: DRY_RUN,
+      handle: (doc, { ops, report }) => {
+        const taskData = doc.data();
+        const userId = taskData.userId || 'unknown';
+        
+        // Count tasks per user
+        userTaskCounts.set(userId, (userTaskCounts.get(userId) || 0) + 1);
+        
+        const reason = classifyTask(doc.id, taskData);
+        if (!reason) return;
+        
+        const group = tasksByReason[reason] || (tasksByReason[reason] = { count: 0, samples: [] });
+        group.count++;
+        if (group.samples.length < SAMPLES_PER_REASON) {
+          group.samples.push({ id: doc.id, title: taskData.title || 'NO TITLE' });
         }
-      }
-      
-      if (shouldDelete) {
-        tasksToDelete.push({
-          id: taskId,
-          userId: userId,
-          title: taskData.title || 'NO TITLE',
-          reason: reason,
-          ref: doc.ref
-        });
+        
+        report.count('problematic');
+        ops.delete(doc.ref);
       }
     });
     
+    console.log(`\n📊 Scanned ${report.scanned} total tasks in database\n`);
+    
     // Display user statistics
     console.log('📊 User Statistics:');
     userTaskCounts.forEach((count, userId) => {
@@ -176,56 +157,33 @@ async function cleanupAllUsers() {
     });
     console.log('');
     
-    if (tasksToDelete.length === 0) {
+    const problematic = report.counters.problematic || 0;
+    if (problematic === 0) {
       console.log('✅ No problematic tasks found! Database is clean.\n');
       return;
     }
     
-    // Group tasks by reason
-    const tasksByReason = {};
-    tasksToDelete.forEach(task => {
-      if (!tasksByReason[task.reason]) {
-        tasksByReason[task.reason] = [];
-      }
-      tasksByReason[task.reason].push(task);
-    });
-    
-    console.log(`⚠️  Found ${tasksToDelete.length} problematic tasks to delete:\n`);
+    console.log(`⚠️  Found ${problematic} problematic tasks:\n`);
     
-    Object.entries(tasksByReason).forEach(([reason, tasks]) => {
-      console.log(`   ${reason}: ${tasks.length} tasks`);
-      if (tasks.length <= 5) {
-        tasks.forEach(task => {
-          console.log(`      - ${task.id}: "${task.title}"`);
-        });
-      } else {
-        tasks.slice(0, 3).forEach(task => {
-          console.log(`      - ${task.id}: "${task.title}"`);
-        });
-        console.log(`      ... and ${tasks.length - 3} more`);
+    Object.entries(tasksByReason).forEach(([reason, { count, samples }]) => {
+      console.log(`   ${reason}: ${count} tasks`);
+      samples.forEach(task => {
+        console.log(`      - ${task.id}: "${task.title}"`);
+      });
+      if (count > samples.length) {
+        console.log(`      ... and ${count - samples.length} more`);
       }
     });
     
-    console.log('\n🗑️  Starting deletion process...\n');
-    
-    // Delete tasks in batches
-    const batchSize = 500;
-    for (let i = 0; i < tasksToDelete.length; i += batchSize) {
-      const batch = db.batch();
-      const batchTasks = tasksToDelete.slice(i, Math.min(i + batchSize, tasksToDelete.length));
-      
-      batchTasks.forEach(task => {
-        batch.delete(task.ref);
-      });
-      
-      await batch.commit();
-      deletedCount += batchTasks.length;
-      console.log(`   Deleted batch: ${deletedCount}/${tasksToDelete.length} tasks`);
+    if (DRY_RUN) {
+      console.log('\n🔍 Dry run - nothing was deleted. Re-run without --dry-run to delete.\n');
+      return;
     }
     
+    const deletedCount = problematic - (report.counters.failed || 0);
     console.log('\n✅ Cleanup complete!');
     console.log(`   Deleted ${deletedCount} problematic tasks`);
-    console.log(`   Remaining tasks: ${tasksSnapshot.size - deletedCount}`);
+    console.log(`   Remaining tasks: ${report.scanned - deletedCount}`);
     console.log('\n🎉 Your Firebase database is now clean!');
     console.log('   Refresh your dashboard to see the results.\n');
     
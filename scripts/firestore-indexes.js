@@ -0,0 +1,568 @@
+#!/usr/bin/env node
+
+/**
+ * Firestore composite index generator and verifier
+ *
+ * Statically extracts every client SDK `query(collection(...), where(...), orderBy(...))`
+ * and every Admin SDK `.collection(...).where(...).orderBy(...)` chain in the repo,
+ * derives the minimal composite index set and diffs it against firestore.indexes.json.
+ *
+ * Usage:
+ *   node scripts/firestore-indexes.js            # report + diff
+ *   node scripts/firestore-indexes.js --write    # add missing indexes to firestore.indexes.json
+ *   node scripts/firestore-indexes.js --prune    # --write and drop indexes no query uses
+ *   node scripts/firestore-indexes.js --verify   # run every query shape against Firestore
+ *   node scripts/firestore-indexes.js --json     # machine readable output
+ *
+ * --verify uses FIRESTORE_EMULATOR_HOST when set. Note the emulator accepts queries
+ * without composite indexes, so against the emulator only invalid query shapes are
+ * reported; point it at a staging project to catch real index misses.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const ROOT = path.resolve(__dirname, '..');
+const INDEX_FILE = path.join(ROOT, 'firestore.indexes.json');
+
+const SOURCE_EXTENSIONS = ['.js', '.jsx', '.ts', '.tsx', '.mjs'];
+const IGNORED_DIRS = new Set(['node_modules', '.next', '.git', 'out', 'coverage', '__tests__', 'testsprite_tests', 'typescript']);
+// Dead copies of old components that are never bundled
+const IGNORED_FILES = /(\.backup|\.original|\.bak)\.[jt]sx?$|^temp_fix\.js$/;
+
+const EQUALITY_OPS = new Set(['==', 'in']);
+const ARRAY_OPS = new Set(['array-contains', 'array-contains-any']);
+const RANGE_OPS = new Set(['<', '<=', '>', '>=', '!=', 'not-in']);
+
+// Conditional refinements (`q = query(q, ...)`) are expanded into every combination,
+// capped so a pathological file cannot blow up the report
+const MAX_OPTIONAL_REFINEMENTS = 6;
+
+// =============================================
+// SOURCE SCANNING
+// =============================================
+
+function listSourceFiles(dir = ROOT) {
+  const files = [];
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    if (entry.isDirectory()) {
+      if (!IGNORED_DIRS.has(entry.name) && !entry.name.startsWith('.')) {
+        files.push(...listSourceFiles(path.join(dir, entry.name)));
+      }
+    } else if (SOURCE_EXTENSIONS.includes(path.extname(entry.name)) && !IGNORED_FILES.test(entry.name)) {
+      files.push(path.join(dir, entry.name));
+    }
+  }
+  return files;
+}
+
+// Blank out comments while keeping offsets (and so line numbers) intact
+function stripComments(source) {
+  const blank = match => match.replace(/[^\n]/g, ' ');
+  return source
+    .replace(/\/\*[\s\S]*?\*\//g, blank)
+    .replace(/(^|[^:'"`\\])\/\/.*$/gm, (match, prefix) => prefix + blank(match.slice(prefix.length)));
+}
+
+// Return the index just past the paren matching the one at `open`
+function matchParen(source, open) {
+  let depth = 0;
+  let quote = null;
+  for (let i = open; i < source.length; i++) {
+    const ch = source[i];
+    if (quote) {
+      if (ch === '\\') i++;
+      else if (ch === quote) quote = null;
+      continue;
+    }
+    if (ch === '"' || ch === "'" || ch === '`') quote = ch;
+    else if (ch === '(' || ch === '[' || ch === '{') depth++;
+    else if (ch === ')' || ch === ']' || ch === '}') {
+      depth--;
+      if (depth === 0) return i + 1;
+    }
+  }
+  return source.length;
+}
+
+// Split a call's argument list on top-level commas
+function splitArgs(argSource) {
+  const args = [];
+  let depth = 0;
+  let quote = null;
+  let start = 0;
+  for (let i = 0; i < argSource.length; i++) {
+    const ch = argSource[i];
+    if (quote) {
+      if (ch === '\\') i++;
+      else if (ch === quote) quote = null;
+      continue;
+    }
+    if (ch === '"' || ch === "'" || ch === '`') quote = ch;
+    else if (ch === '(' || ch === '[' || ch === '{') depth++;
+    else if (ch === ')' || ch === ']' || ch === '}') depth--;
+    else if (ch === ',' && depth === 0) {
+      args.push(argSource.slice(start, i).trim());
+      start = i + 1;
+    }
+  }
+  const last = argSource.slice(start).trim();
+  if (last) args.push(last);
+  return args;
+}
+
+function stringLiteral(arg) {
+  const match = /^(['"`])([^'"`$]*)\1$/.exec((arg || '').trim());
+  return match ? match[2] : null;
+}
+
+function lineAt(source, offset) {
+  return source.slice(0, offset).split('\n').length;
+}
+
+// Parse `where(...)` / `orderBy(...)` argument lists into constraints
+function parseConstraint(kind, argSource) {
+  const args = splitArgs(argSource);
+  const field = stringLiteral(args[0]);
+  if (kind === 'where') {
+    return { kind, field, op: stringLiteral(args[1]) || '==', dynamic: !field };
+  }
+  if (kind === 'orderBy') {
+    const direction = (stringLiteral(args[1]) || 'asc').toLowerCase();
+    return { kind, field, direction: direction === 'desc' ? 'DESCENDING' : 'ASCENDING', dynamic: !field };
+  }
+  return null;
+}
+
+/**
+ * Client SDK: query(collection(db, 'tasks'), where(...), orderBy(...))
+ * Refinements such as `q = query(q, where(...))` are treated as optional and
+ * expanded into every combination because they usually sit behind filters.
+ */
+function extractClientQueries(source, file) {
+  const shapes = [];
+  const variables = new Map();
+  const pattern = /(?:\b(?:const|let|var)\s+)?(?:\b(\w+)\s*=\s*)?(?<![.\w])query\s*\(/g;
+  let match;
+
+  while ((match = pattern.exec(source))) {
+    const open = source.indexOf('(', match.index + match[0].length - 1);
+    const close = matchParen(source, open);
+    const args = splitArgs(source.slice(open + 1, close - 1));
+    const assignedTo = match[1];
+    const line = lineAt(source, match.index);
+
+    let base = null;
+    const constraints = [];
+
+    for (const arg of args) {
+      const collectionMatch = /^collection\s*\(([\s\S]*)\)$/.exec(arg);
+      const constraintMatch = /^(where|orderBy)\s*\(([\s\S]*)\)$/.exec(arg);
+
+      if (collectionMatch) {
+        const collArgs = splitArgs(collectionMatch[1]);
+        const name = stringLiteral(collArgs[collArgs.length - 1]);
+        base = { collection: name, required: [], optional: [] };
+        if (!name && /this\.collection/.test(collectionMatch[1])) {
+          base.collection = inferClassCollection(source);
+        }
+      } else if (constraintMatch) {
+        constraints.push(parseConstraint(constraintMatch[1], constraintMatch[2]));
+      } else if (/^\w+$/.test(arg) && variables.has(arg)) {
+        base = variables.get(arg);
+      }
+    }
+
+    if (!base || !base.collection) continue;
+
+    let record;
+    if (assignedTo && variables.get(assignedTo) === base) {
+      // q = query(q, ...) - an optional refinement of an existing query
+      base.optional.push(constraints);
+      record = base;
+    } else if (variables.has(args[0]) && variables.get(args[0]) === base) {
+      record = { collection: base.collection, required: [...base.required], optional: [...base.optional], file, line };
+      record.optional.push(constraints);
+    } else {
+      record = { collection: base.collection, required: constraints, optional: [], file, line };
+    }
+
+    if (!record.file) {
+      record.file = file;
+      record.line = line;
+    }
+    if (assignedTo) variables.set(assignedTo, record);
+    if (!shapes.includes(record)) shapes.push(record);
+  }
+
+  return shapes;
+}
+
+// `private readonly collection = 'tasks'` in service classes
+function inferClassCollection(source) {
+  const match = /\bcollection\s*=\s*(['"`])(\w+)\1/.exec(source);
+  return match ? match[2] : null;
+}
+
+// `const REMINDER_QUEUE = 'scheduledNotifications'` style collection name constants
+function collectStringConstants(sources) {
+  const constants = new Map();
+  const pattern = /\bconst\s+([A-Z][A-Z0-9_]*)\s*=\s*(['"`])(\w+)\2\s*;/g;
+  for (const source of sources) {
+    let match;
+    while ((match = pattern.exec(source))) constants.set(match[1], match[3]);
+  }
+  return constants;
+}
+
+/**
+ * Admin SDK: db.collection('tasks').where(...).orderBy(...)
+ * Also follows `const ref = db.collection('tasks')` followed by `ref.where(...)`,
+ * and collection names held in string constants.
+ */
+function extractAdminQueries(source, file, constants = new Map()) {
+  const shapes = [];
+  const refs = new Map();
+
+  const refPattern = /\b(\w+)\s*=\s*\w+\.collection\s*\(\s*(['"`])(\w+)\2\s*\)\s*;/g;
+  let refMatch;
+  while ((refMatch = refPattern.exec(source))) {
+    refs.set(refMatch[1], refMatch[3]);
+  }
+
+  const starts = [];
+  const collectionPattern = /\.collection\s*\(\s*(?:(['"`])(\w+)\1|([A-Z][A-Z0-9_]*))\s*\)/g;
+  let match;
+  while ((match = collectionPattern.exec(source))) {
+    const collection = match[2] || constants.get(match[3]);
+    if (collection) {
+      starts.push({ collection, end: match.index + match[0].length, offset: match.index });
+    }
+  }
+  for (const [name, collection] of refs) {
+    const usePattern = new RegExp(`(?<![.\\w])${name}(?=\\s*\\.(?:where|orderBy)\\s*\\()`, 'g');
+    while ((match = usePattern.exec(source))) {
+      starts.push({ collection, end: match.index + name.length, offset: match.index });
+    }
+  }
+
+  for (const start of starts) {
+    const constraints = [];
+    let cursor = start.end;
+    for (;;) {
+      const link = /^\s*\.\s*(where|orderBy|limit|limitToLast|offset|select|startAfter|startAt|endBefore|endAt)\s*\(/.exec(source.slice(cursor));
+      if (!link) break;
+      const open = cursor + link[0].length - 1;
+      const close = matchParen(source, open);
+      if (link[1] === 'where' || link[1] === 'orderBy') {
+        constraints.push(parseConstraint(link[1], source.slice(open + 1, close - 1)));
+      }
+      cursor = close;
+    }
+    if (constraints.length > 0) {
+      shapes.push({ collection: start.collection, required: constraints, optional: [], file, line: lineAt(source, start.offset) });
+    }
+  }
+
+  return shapes;
+}
+
+function extractQueries(files = listSourceFiles()) {
+  const sources = files.map(file => stripComments(fs.readFileSync(file, 'utf8')));
+  const constants = collectStringConstants(sources);
+  const shapes = [];
+  files.forEach((file, i) => {
+    const relative = path.relative(ROOT, file);
+    shapes.push(...extractClientQueries(sources[i], relative), ...extractAdminQueries(sources[i], relative, constants));
+  });
+  return shapes;
+}
+
+// Expand optional refinements into the concrete constraint lists they can produce
+function expandVariants(shape) {
+  const optional = shape.optional.slice(0, MAX_OPTIONAL_REFINEMENTS);
+  const variants = [];
+  for (let mask = 0; mask < 1 << optional.length; mask++) {
+    const constraints = [...shape.required];
+    optional.forEach((group, i) => {
+      if (mask & (1 << i)) constraints.push(...group);
+    });
+    variants.push(constraints);
+  }
+  return variants;
+}
+
+// =============================================
+// INDEX DERIVATION
+// =============================================
+
+/**
+ * Work out which composite indexes a single query needs.
+ * Returns [] when single-field indexes (or index merging) are enough.
+ */
+function requiredIndexes(collection, constraints) {
+  if (constraints.some(c => !c || c.dynamic)) return [];
+
+  const equality = [];
+  const arrays = [];
+  const ranges = [];
+  const orders = [];
+
+  for (const c of constraints) {
+    if (c.kind === 'where') {
+      if (EQUALITY_OPS.has(c.op)) equality.push(c.field);
+      else if (ARRAY_OPS.has(c.op)) arrays.push(c.field);
+      else if (RANGE_OPS.has(c.op)) ranges.push(c.field);
+    } else if (c.kind === 'orderBy') {
+      orders.push({ fieldPath: c.field, order: c.direction });
+    }
+  }
+
+  // Inequality fields are implicitly ordered ascending when not ordered explicitly
+  const orderFields = orders.filter(o => !equality.includes(o.fieldPath));
+  for (const field of new Set(ranges)) {
+    if (!orderFields.some(o => o.fieldPath === field)) {
+      orderFields.push({ fieldPath: field, order: 'ASCENDING' });
+    }
+  }
+
+  const prefix = [...new Set(equality)].sort();
+  const arrayFields = [...new Set(arrays)].sort();
+
+  // Pure equality / array-contains filters are served by merging single-field indexes
+  if (orderFields.length === 0) return [];
+  if (prefix.length + arrayFields.length === 0 && orderFields.length === 1) return [];
+
+  const build = (eqFields) => ({
+    collectionGroup: collection,
+    queryScope: 'COLLECTION',
+    fields: [
+      ...eqFields.map(fieldPath => ({ fieldPath, order: 'ASCENDING' })),
+      ...arrayFields.map(fieldPath => ({ fieldPath, arrayConfig: 'CONTAINS' })),
+      ...orderFields
+    ],
+    equalityCount: eqFields.length
+  });
+
+  // Equality filters + sort without inequalities can zig-zag merge per-field indexes,
+  // so (a ==, b ==, orderBy c) only needs (a, c) and (b, c)
+  if (ranges.length === 0 && arrayFields.length === 0 && prefix.length > 1) {
+    return prefix.map(field => build([field]));
+  }
+
+  return [build(prefix)];
+}
+
+function indexKey(index) {
+  const fields = index.fields
+    .map(f => `${f.fieldPath}:${f.order || f.arrayConfig}`)
+    .join(',');
+  return `${index.collectionGroup}/${index.queryScope || 'COLLECTION'}/${fields}`;
+}
+
+// Does `existing` serve `required`? Leading equality fields may be in any order.
+function covers(existing, required) {
+  if (existing.collectionGroup !== required.collectionGroup) return false;
+  if ((existing.queryScope || 'COLLECTION') !== required.queryScope) return false;
+  if (existing.fields.length !== required.fields.length) return false;
+
+  const eqCount = required.equalityCount || 0;
+  const existingPrefix = existing.fields.slice(0, eqCount);
+  if (existingPrefix.some(f => f.order !== 'ASCENDING')) return false;
+  const prefixNames = existingPrefix.map(f => f.fieldPath).sort().join(',');
+  const requiredNames = required.fields.slice(0, eqCount).map(f => f.fieldPath).sort().join(',');
+  if (prefixNames !== requiredNames) return false;
+
+  return existing.fields.slice(eqCount).every((f, i) => {
+    const r = required.fields[eqCount + i];
+    return f.fieldPath === r.fieldPath && (f.order || f.arrayConfig) === (r.order || r.arrayConfig);
+  });
+}
+
+function deriveIndexSet(shapes) {
+  const indexes = new Map();
+  const usages = new Map();
+
+  for (const shape of shapes) {
+    for (const constraints of expandVariants(shape)) {
+      for (const index of requiredIndexes(shape.collection, constraints)) {
+        const key = indexKey(index);
+        if (!indexes.has(key)) {
+          indexes.set(key, index);
+          usages.set(key, new Set());
+        }
+        usages.get(key).add(`${shape.file}:${shape.line}`);
+      }
+    }
+  }
+
+  return [...indexes.entries()]
+    .sort(([a], [b]) => a.localeCompare(b))
+    .map(([key, index]) => ({ index, key, usedBy: [...usages.get(key)] }));
+}
+
+function diffIndexes(derived, existing) {
+  const missing = derived.filter(d => !existing.some(e => covers(e, d.index)));
+  const unused = existing.filter(e => !derived.some(d => covers(e, d.index)));
+  return { missing, unused };
+}
+
+function toIndexJson(index) {
+  const { equalityCount, ...rest } = index;
+  return rest;
+}
+
+function readIndexFile() {
+  if (!fs.existsSync(INDEX_FILE)) return { indexes: [], fieldOverrides: [] };
+  return JSON.parse(fs.readFileSync(INDEX_FILE, 'utf8'));
+}
+
+function writeIndexFile(config, derived, { prune }) {
+  const { missing, unused } = diffIndexes(derived, config.indexes || []);
+  const kept = prune ? (config.indexes || []).filter(e => !unused.includes(e)) : (config.indexes || []);
+  const next = {
+    ...config,
+    indexes: [...kept, ...missing.map(m => toIndexJson(m.index))],
+    fieldOverrides: config.fieldOverrides || []
+  };
+  fs.writeFileSync(INDEX_FILE, JSON.stringify(next, null, 2) + '\n');
+  return { added: missing.length, removed: config.indexes.length - kept.length };
+}
+
+// =============================================
+// VERIFICATION
+// =============================================
+
+function placeholderValue(op) {
+  return ['in', 'not-in', 'array-contains-any'].includes(op) ? ['__index_check__'] : '__index_check__';
+}
+
+/**
+ * Run every extracted query shape (limit 1) and collect FAILED_PRECONDITION
+ * "requires an index" errors together with the console link Firestore returns.
+ */
+async function verifyQueries(shapes) {
+  const admin = require('firebase-admin');
+  if (!admin.apps.length) {
+    const rc = JSON.parse(fs.readFileSync(path.join(ROOT, '.firebaserc'), 'utf8'));
+    admin.initializeApp({
+      projectId: process.env.NEXT_PUBLIC_FIREBASE_PROJECT_ID || rc.projects.default
+    });
+  }
+  const db = admin.firestore();
+  const results = [];
+
+  for (const shape of shapes) {
+    for (const constraints of expandVariants(shape)) {
+      if (constraints.some(c => !c || c.dynamic)) continue;
+
+      let q = db.collection(shape.collection);
+      for (const c of constraints) {
+        q = c.kind === 'where'
+          ? q.where(c.field, c.op, placeholderValue(c.op))
+          : q.orderBy(c.field, c.direction === 'DESCENDING' ? 'desc' : 'asc');
+      }
+
+      try {
+        await q.limit(1).get();
+        results.push({ shape, constraints, ok: true });
+      } catch (error) {
+        const indexMiss = error.code === 9 || /requires an index/i.test(error.message);
+        const link = (/https:\/\/console\.firebase\.google\.com\S+/.exec(error.message) || [])[0];
+        results.push({ shape, constraints, ok: false, indexMiss, error: error.message, link });
+      }
+    }
+  }
+
+  return results;
+}
+
+// =============================================
+// CLI
+// =============================================
+
+function describeIndex(index) {
+  const fields = index.fields
+    .map(f => `${f.fieldPath} ${f.arrayConfig ? 'CONTAINS' : f.order === 'DESCENDING' ? 'desc' : 'asc'}`)
+    .join(', ');
+  return `${index.collectionGroup} (${fields})`;
+}
+
+function describeConstraints(constraints) {
+  return constraints
+    .map(c => c.kind === 'where' ? `${c.field} ${c.op}` : `orderBy ${c.field}${c.direction === 'DESCENDING' ? ' desc' : ''}`)
+    .join(' && ');
+}
+
+async function main() {
+  const argv = process.argv.slice(2);
+  const shapes = extractQueries();
+  const derived = deriveIndexSet(shapes);
+  const config = readIndexFile();
+  const { missing, unused } = diffIndexes(derived, config.indexes || []);
+
+  if (argv.includes('--json')) {
+    console.log(JSON.stringify({
+      queries: shapes.map(s => ({ collection: s.collection, file: s.file, line: s.line, variants: expandVariants(s).map(describeConstraints) })),
+      derived: derived.map(d => ({ index: toIndexJson(d.index), usedBy: d.usedBy })),
+      missing: missing.map(m => toIndexJson(m.index)),
+      unused
+    }, null, 2));
+  } else {
+    console.log(`🔍 Found ${shapes.length} Firestore queries\n`);
+    for (const shape of shapes) {
+      const dynamic = [...shape.required, ...shape.optional.flat()].some(c => !c || c.dynamic);
+      console.log(`  ${shape.file}:${shape.line}  ${shape.collection}${dynamic ? '  ⚠️  dynamic field, skipped' : ''}`);
+    }
+
+    console.log(`\n📋 Minimal composite index set (${derived.length}):`);
+    for (const d of derived) {
+      console.log(`  ${describeIndex(d.index)}`);
+      d.usedBy.forEach(use => console.log(`      ↳ ${use}`));
+    }
+
+    console.log(`\n❌ Missing from firestore.indexes.json (${missing.length}):`);
+    missing.forEach(m => console.log(`  ${describeIndex(m.index)}`));
+    console.log(`\n🗑️  Declared but unused (${unused.length}):`);
+    unused.forEach(u => console.log(`  ${describeIndex(u)}`));
+  }
+
+  if (argv.includes('--write') || argv.includes('--prune')) {
+    const { added, removed } = writeIndexFile(config, derived, { prune: argv.includes('--prune') });
+    console.log(`\n✅ Updated firestore.indexes.json (+${added} / -${removed})`);
+  }
+
+  if (argv.includes('--verify')) {
+    if (process.env.FIRESTORE_EMULATOR_HOST) {
+      console.log('\n⚠️  Emulator does not enforce composite indexes - only invalid query shapes will be reported');
+    }
+    const results = await verifyQueries(shapes);
+    const failures = results.filter(r => !r.ok);
+    console.log(`\n🧪 Verified ${results.length} query variants, ${failures.length} failed`);
+    for (const failure of failures) {
+      console.log(`  ${failure.indexMiss ? '❌ index miss' : '⚠️  error'}: ${failure.shape.file}:${failure.shape.line} ${describeConstraints(failure.constraints)}`);
+      console.log(`      ${failure.link || failure.error}`);
+    }
+    if (failures.length > 0) process.exitCode = 1;
+  } else if (missing.length > 0 && argv.includes('--check')) {
+    process.exitCode = 1;
+  }
+}
+
+if (require.main === module) {
+  main().catch(error => {
+    console.error('❌ Index check failed:', error);
+    process.exit(1);
+  });
+}
+
+module.exports = {
+  extractQueries,
+  extractClientQueries,
+  extractAdminQueries,
+  expandVariants,
+  requiredIndexes,
+  deriveIndexSet,
+  diffIndexes,
+  covers
+};
@@ -0,0 +1,167 @@
+/**
+ * Shared maintenance runner for the Firestore cleanup scripts
+ *
+ * Full-collection jobs split the collection with partition queries and scan
+ * the partitions concurrently with a bounded worker pool. Filtered jobs
+ * (e.g. one user's tasks) are paged sequentially. Writes go through a
+ * BulkWriter, which ramps its rate up from `initialOpsPerSecond` (the
+ * 500/50/5 rule), and progress and throughput are printed while it runs.
+ *
+ *   const { runMaintenance } = require('./lib/maintenance');
+ *   await runMaintenance({
+ *     name: 'delete all tasks',
+ *     collection: 'tasks',
+ *     handle: (doc, { ops }) => ops.delete(doc.ref)
+ *   });
+ */
+
+require('dotenv').config({ path: '.env.local' });
+const admin = require('firebase-admin');
+
+// Initialize Firebase Admin SDK - service account from env when present,
+// application default credentials otherwise. The project comes from env;
+// when it isn't set the credentials (or gcloud's config) decide
+if (!admin.apps.length) {
+  const hasServiceAccount = process.env.FIREBASE_ADMIN_CLIENT_EMAIL && process.env.FIREBASE_ADMIN_PRIVATE_KEY;
+  const projectId = process.env.NEXT_PUBLIC_FIREBASE_PROJECT_ID || process.env.GOOGLE_CLOUD_PROJECT;
+  admin.initializeApp({
+    ...(hasServiceAccount ? {
+      credential: admin.credential.cert({
+        type: 'service_account',
+        project_id: projectId,
+        client_email: process.env.FIREBASE_ADMIN_CLIENT_EMAIL,
+        private_key: process.env.FIREBASE_ADMIN_PRIVATE_KEY.replace(/\\n/g, '\n'),
+      })
+    } : {}),
+    ...(projectId ? { projectId } : {})
+  });
+}
+
+const db = admin.firestore();
+
+const DEFAULTS = {
+  partitions: 16,            // partition queries for full-collection scans
+  concurrency: 4,            // partitions scanned at once
+  pageSize: 500,
+  initialOpsPerSecond: 500,  // BulkWriter ramps up from here by 50% every 5 min
+  maxOpsPerSecond: 5000,
+  progressEveryMs: 2000
+};
+
+/**
+ * Counters plus a periodic progress line
+ */
+function createReport(name, progressEveryMs) {
+  const startedAt = Date.now();
+  const report = {
+    scanned: 0,
+    written: 0,
+    counters: {},
+    count(key, by = 1) {
+      report.counters[key] = (report.counters[key] || 0) + by;
+    },
+    elapsedMs: () => Date.now() - startedAt,
+    line() {
+      const seconds = Math.max(report.elapsedMs() / 1000, 0.001);
+      const counters = Object.entries(report.counters).map(([k, v]) => `${k}: ${v}`).join(', ');
+      return `   ${name}: scanned ${report.scanned} (${Math.round(report.scanned / seconds)}/s), ` +
+        `writes ${report.written} (${Math.round(report.written / seconds)}/s)${counters ? `, ${counters}` : ''}`;
+    }
+  };
+  const timer = setInterval(() => console.log(report.line()), progressEveryMs);
+  timer.unref();
+  report.stop = () => clearInterval(timer);
+  return report;
+}
+
+/**
+ * Writes are queued on the BulkWriter, or only counted in dry-run mode
+ */
+function createOps(writer, report, dryRun) {
+  const record = (op) => (...args) => {
+    report.written++;
+    if (!dryRun) writer[op](...args).catch(() => {}); // failures surface via onWriteError
+  };
+  return { delete: record('delete'), update: record('update'), set: record('set') };
+}
+
+async function scanQuery(query, pageSize, visit) {
+  let lastDoc = null;
+  for (;;) {
+    const page = await (lastDoc ? query.startAfter(lastDoc) : query).limit(pageSize).get();
+    for (const doc of page.docs) await visit(doc);
+    if (page.size < pageSize) return;
+    lastDoc = page.docs[page.docs.length - 1];
+  }
+}
+
+// Run async jobs with at most `limit` in flight
+async function runBounded(jobs, limit) {
+  let next = 0;
+  const worker = async () => {
+    while (next < jobs.length) {
+      const job = jobs[next++];
+      await job();
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, jobs.length) }, worker));
+}
+
+/**
+ * Scan a collection (partitioned) or a filtered query (paged) and call
+ * `handle(doc, { ops, report })` for every document.
+ *
+ * options:
+ *   name         label for progress output
+ *   collection   collection id to scan in full with partition queries
+ *   query        a filtered Admin SDK query to page through instead
+ *   handle       per-document callback; queue writes through `ops`
+ *   dryRun       count writes without performing them
+ *   partitions, concurrency, pageSize, initialOpsPerSecond, maxOpsPerSecond
+ */
+async function runMaintenance(options) {
+  const opts = { ...DEFAULTS, ...options };
+  const report = createReport(opts.name, opts.progressEveryMs);
+
+  const writer = db.bulkWriter({
+    throttling: { initialOpsPerSecond: opts.initialOpsPerSecond, maxOpsPerSecond: opts.maxOpsPerSecond }
+  });
+  writer.onWriteError(error => {
+    if (error.failedAttempts < 3) return true;
+    console.error(`   ❌ Write failed for ${error.documentRef.path}: ${error.message}`);
+    report.count('failed');
+    return false;
+  });
+
+  const ops = createOps(writer, report, opts.dryRun);
+  const visit = async (doc) => {
+    report.scanned++;
+    await opts.handle(doc, { ops, report });
+  };
+
+  try {
+    if (opts.query) {
+      await scanQuery(opts.query, opts.pageSize, visit);
+    } else {
+      // Partition queries come back ordered by document id, so each partition pages independently
+      const partitions = [];
+      for await (const partition of db.collectionGroup(opts.collection).getPartitions(opts.partitions)) {
+        partitions.push(partition.toQuery());
+      }
+      console.log(`   ${opts.name}: ${partitions.length} partitions, ${opts.concurrency} workers${opts.dryRun ? ' (dry run)' : ''}`);
+      await runBounded(partitions.map(q => () => scanQuery(q, opts.pageSize, visit)), opts.concurrency);
+    }
+    await writer.close();
+  } finally {
+    report.stop();
+  }
+
+  console.log(report.line());
+  return report;
+}
+
+module.exports = {
+  admin,
+  db,
+  runMaintenance
+};
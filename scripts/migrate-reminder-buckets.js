@@ -0,0 +1,51 @@
+#!/usr/bin/env node
+
+/**
+ * Move pending reminders into the bucketed scheduledNotifications layout
+ * Reminders scheduled before the (bucket, shard) queue existed have no
+ * bucket fields, so the dispatcher never claims them. Run once after deploy.
+ *
+ * Usage: node scripts/migrate-reminder-buckets.js [--dry-run]
+ */
+
+const admin = require('firebase-admin');
+
+// Initialize Firebase Admin
+if (!admin.apps.length) {
+  admin.initializeApp({
+    projectId: 'betterish'
+  });
+}
+
+const db = admin.firestore();
+const { REMINDER_QUEUE, queuePlacement } = require('../functions/reminderQueue');
+
+async function migrateReminderBuckets(dryRun) {
+  console.log(`🔄 Migrating pending reminders into bucketed queue${dryRun ? ' (dry run)' : ''}...\n`);
+
+  const snapshot = await db.collection(REMINDER_QUEUE).where('sent', '==', false).get();
+  const writer = db.bulkWriter();
+  let migrated = 0;
+
+  for (const doc of snapshot.docs) {
+    const reminder = doc.data();
+    if (reminder.bucket !== undefined) continue;
+
+    const placement = queuePlacement(db, reminder.taskId, reminder.scheduledFor);
+    migrated++;
+    if (dryRun) continue;
+
+    writer.update(doc.ref, placement.fields);
+    writer.set(placement.bucketRef, placement.bucketData, { merge: true });
+  }
+
+  await writer.close();
+  console.log(`✅ ${dryRun ? 'Would migrate' : 'Migrated'} ${migrated} of ${snapshot.size} pending reminders`);
+}
+
+migrateReminderBuckets(process.argv.includes('--dry-run'))
+  .then(() => process.exit(0))
+  .catch(error => {
+    console.error('❌ Migration failed:', error);
+    process.exit(1);
+  });